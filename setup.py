@@ -33,6 +33,13 @@ setup(
                         "asyncio": "threading",
                     },
                 ),
+                unasync.Rule(
+                    "/apyhiveapi/helper/hive_tasks.py",
+                    "/pyhiveapi/helper/hive_tasks.py",
+                    additional_replacements={
+                        "apyhiveapi": "pyhiveapi",
+                    },
+                ),
                 unasync.Rule(
                     "/apyhiveapi/api/",
                     "/pyhiveapi/api/",
@@ -44,5 +51,8 @@ setup(
         )
     },
     install_requires=requirements_from_file(),
-    extras_require={"dev": requirements_from_file("requirements_test.txt")},
+    extras_require={
+        "dev": requirements_from_file("requirements_test.txt"),
+        "token_store": ["cryptography"],
+    },
 )
@@ -1,6 +1,7 @@
 """Hive Alarm Module."""
 
 # pylint: skip-file
+from .helper.hivedataclasses import Device
 
 
 class HiveHomeShield:
@@ -15,6 +16,14 @@ class HiveHomeShield:
     async def getMode(self):
         """Get current mode of the alarm.
 
+        Returns:
+            str: Mode if the alarm [armed_home, armed_away, armed_night]
+        """
+        return self.readMode()
+
+    def readMode(self):
+        """Read current mode of the alarm.
+
         Returns:
             str: Mode if the alarm [armed_home, armed_away, armed_night]
         """
@@ -24,13 +33,21 @@ class HiveHomeShield:
             data = self.session.data.alarm
             state = data["mode"]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
     async def getState(self, device: dict):
         """Get the alarm triggered state.
 
+        Returns:
+            boolean: True/False if alarm is triggered.
+        """
+        return self.readState(device)
+
+    def readState(self, device: dict):
+        """Read the alarm triggered state.
+
         Returns:
             boolean: True/False if alarm is triggered.
         """
@@ -40,7 +57,7 @@ class HiveHomeShield:
             data = self.session.data.devices[device["hiveID"]]
             state = data["state"]["alarmActive"]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
@@ -95,35 +112,36 @@ class Alarm(HiveHomeShield):
         device["deviceData"].update(
             {"online": await self.session.attr.onlineOffline(device["device_id"])}
         )
-        dev_data = {}
 
         if device["deviceData"]["online"]:
             self.session.helper.deviceRecovered(device["device_id"])
-            data = self.session.data.devices[device["device_id"]]
-            dev_data = {
-                "hiveID": device["hiveID"],
-                "hiveName": device["hiveName"],
-                "hiveType": device["hiveType"],
-                "haName": device["haName"],
-                "haType": device["haType"],
-                "device_id": device["device_id"],
-                "device_name": device["device_name"],
-                "status": {
-                    "state": await self.getState(device),
-                    "mode": await self.getMode(),
-                },
-                "deviceData": data.get("props", None),
-                "parentDevice": data.get("parent", None),
-                "custom": device.get("custom", None),
-                "attributes": await self.session.attr.stateAttributes(
-                    device["device_id"], device["hiveType"]
-                ),
-            }
-
-            self.session.devices.update({device["hiveID"]: dev_data})
+            self.session.devices.update({device["hiveID"]: self.readAlarm(device)})
             return self.session.devices[device["hiveID"]]
         else:
             await self.session.log.errorCheck(
                 device["device_id"], "ERROR", device["deviceData"]["online"]
             )
             return device
+
+    def readAlarm(self, device: dict):
+        """Read alarm data.
+
+        Args:
+            device (dict): Online device to read, updated in place if it is a Device.
+
+        Returns:
+            Device: Device data.
+        """
+        data = self.session.data.devices[device["device_id"]]
+        dev_data = Device.reuse(device)
+        dev_data.identify(device)
+        status = dev_data.section("status")
+        status["state"] = self.readState(device)
+        status["mode"] = self.readMode()
+        dev_data.deviceData = data.get("props", None)
+        dev_data.parentDevice = data.get("parent", None)
+        dev_data.attributes = self.session.attr.readAttributes(
+            device["device_id"], device["hiveType"]
+        )
+
+        return dev_data
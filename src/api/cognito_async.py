@@ -0,0 +1,158 @@
+"""Async Cognito identity provider clients."""
+
+import asyncio
+import functools
+import json
+from abc import ABC, abstractmethod
+
+from aiohttp import ClientError, ClientSession
+
+COGNITO_URL = "https://cognito-idp.{0}.amazonaws.com/"
+COGNITO_TARGET = "AWSCognitoIdentityProviderService.{0}"
+OPERATIONS = {
+    "confirm_device": "ConfirmDevice",
+    "forget_device": "ForgetDevice",
+    "initiate_auth": "InitiateAuth",
+    "respond_to_auth_challenge": "RespondToAuthChallenge",
+    "update_device_status": "UpdateDeviceStatus",
+}
+
+
+class CognitoError(Exception):
+    """Base error raised by the Cognito clients."""
+
+
+class EndpointConnectionError(CognitoError):
+    """The Cognito endpoint could not be reached."""
+
+
+class CognitoClientError(CognitoError):
+    """Cognito returned an error.
+
+    Errors are raised as a subclass named after the Cognito error code,
+    e.g. NotAuthorizedException.
+    """
+
+    def __init__(self, code, message, response=None):
+        """Initialise the client error."""
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.message = message
+        self.response = response or {}
+
+
+@functools.lru_cache(maxsize=None)
+def client_error(code):
+    """Get the error class for a Cognito error code."""
+    return type(code, (CognitoClientError,), {})
+
+
+class CognitoClientAsync(ABC):
+    """Base async Cognito identity provider client."""
+
+    @abstractmethod
+    async def call(self, operation, **params):
+        """Call a Cognito operation."""
+
+    async def initiate_auth(self, **params):
+        """Start an authentication flow."""
+        return await self.call("initiate_auth", **params)
+
+    async def respond_to_auth_challenge(self, **params):
+        """Respond to an authentication challenge."""
+        return await self.call("respond_to_auth_challenge", **params)
+
+    async def confirm_device(self, **params):
+        """Confirm a device for device authentication."""
+        return await self.call("confirm_device", **params)
+
+    async def update_device_status(self, **params):
+        """Update the remembered status of a device."""
+        return await self.call("update_device_status", **params)
+
+    async def forget_device(self, **params):
+        """Forget a device."""
+        return await self.call("forget_device", **params)
+
+
+class NativeCognitoClient(CognitoClientAsync):
+    """Cognito client which calls the JSON API with aiohttp."""
+
+    def __init__(self, region, websession=None, timeout=None):
+        """Initialise the native Cognito client.
+
+        A timeout of None uses the default timeout of the websession.
+        """
+        self.url = COGNITO_URL.format(region)
+        self.websession = ClientSession() if websession is None else websession
+        self.timeout = timeout
+
+    async def call(self, operation, **params):
+        """Call a Cognito operation."""
+        headers = {
+            "Content-Type": "application/x-amz-json-1.1",
+            "X-Amz-Target": COGNITO_TARGET.format(OPERATIONS[operation]),
+        }
+        try:
+            async with self.websession.post(
+                self.url, data=json.dumps(params), headers=headers, timeout=self.timeout
+            ) as resp:
+                status = resp.status
+                try:
+                    body = await resp.json(content_type=None) or {}
+                except ValueError:
+                    body = {}
+        except (ClientError, asyncio.TimeoutError, OSError) as err:
+            raise EndpointConnectionError(str(err)) from err
+
+        if status >= 400:
+            code = body.get("__type", "UnknownError").rsplit("#", 1)[-1]
+            raise client_error(code)(code, body.get("message", ""), body)
+
+        return body
+
+
+class BotoCognitoClient(CognitoClientAsync):
+    """Cognito client which runs boto3 calls in an executor."""
+
+    def __init__(self, client):
+        """Initialise the boto3 Cognito client."""
+        self.client = client
+
+    @classmethod
+    async def create(cls, region):
+        """Create the boto3 client without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        client = await loop.run_in_executor(None, cls.create_client, region)
+        return cls(client)
+
+    @staticmethod
+    def create_client(region):
+        """Import boto3 and create a Cognito client."""
+        import boto3  # pylint: disable=import-outside-toplevel
+
+        return boto3.client(
+            "cognito-idp",
+            region,
+            aws_access_key_id="ACCESS_KEY",
+            aws_secret_access_key="SECRET_KEY",
+            aws_session_token="SESSION_TOKEN",
+        )
+
+    async def call(self, operation, **params):
+        """Call a Cognito operation."""
+        import botocore.exceptions  # pylint: disable=import-outside-toplevel
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                None, functools.partial(getattr(self.client, operation), **params)
+            )
+        except botocore.exceptions.ClientError as err:
+            error = err.response.get("Error", {})
+            code = error.get("Code", "UnknownError")
+            raise client_error(code)(
+                code, error.get("Message", ""), err.response
+            ) from err
+        except botocore.exceptions.EndpointConnectionError as err:
+            raise EndpointConnectionError(str(err)) from err
@@ -2,11 +2,14 @@
 
 # pylint: skip-file
 import json
+import time
 
 import requests
 import urllib3
 from pyquery import PyQuery
 
+from ..helper.hive_exceptions import HiveApiError
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
@@ -39,10 +42,15 @@ class HiveApi:
             "parsed": "No response to Hive API request",
         }
         self.session = hiveSession
+        self.websession = websession
         self.token = token
 
-    def request(self, type, url, jsc=None, camera=False):
-        """Make API request."""
+    def request(self, type, url, jsc=None, camera=False, deadline=None):
+        """Make API request.
+
+        A request which times out or passes its deadline, as
+        time.monotonic() time, raises HiveApiError.
+        """
         if self.session is not None:
             if camera:
                 self.headers = {
@@ -72,14 +80,27 @@ class HiveApi:
                     "authorization": self.token,
                 }
 
-        if type == "GET":
-            return requests.get(
-                url=url, headers=self.headers, data=jsc, timeout=self.timeout
-            )
-        if type == "POST":
-            return requests.post(
-                url=url, headers=self.headers, data=jsc, timeout=self.timeout
-            )
+        timeout = self.requestTimeout(deadline)
+        try:
+            if type == "GET":
+                return requests.get(
+                    url=url, headers=self.headers, data=jsc, timeout=timeout
+                )
+            if type == "POST":
+                return requests.post(
+                    url=url, headers=self.headers, data=jsc, timeout=timeout
+                )
+        except requests.Timeout as err:
+            raise HiveApiError(f"Timed out calling {url}") from err
+
+    def requestTimeout(self, deadline=None):
+        """Get the timeout of a request, shortened to end by a deadline."""
+        if deadline is None:
+            return self.timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise HiveApiError("Deadline has passed")
+        return min(self.timeout, remaining)
 
     def refreshTokens(self, tokens={}):
         """Get new session tokens - DEPRECATED NOW BY AWS TOKEN MANAGEMENT."""
@@ -130,12 +151,12 @@ class HiveApi:
         except (OSError, RuntimeError, ZeroDivisionError):
             self.error()
 
-    def getAll(self):
+    def getAll(self, stream=False, deadline=None):
         """Build and query all endpoint."""
         json_return = {}
         url = self.urls["base"] + self.urls["all"]
         try:
-            info = self.request("GET", url)
+            info = self.request("GET", url, deadline=deadline)
             json_return.update({"original": info.status_code})
             json_return.update({"parsed": info.json()})
         except (OSError, RuntimeError, ZeroDivisionError):
@@ -143,13 +164,13 @@ class HiveApi:
 
         return json_return
 
-    def getAlarm(self, homeID=None):
+    def getAlarm(self, homeID=None, deadline=None):
         """Build and query alarm endpoint."""
         if self.session is not None:
             homeID = self.session.config.homeID
         url = self.urls["base"] + self.urls["alarm"] + homeID
         try:
-            info = self.request("GET", url)
+            info = self.request("GET", url, deadline=deadline)
             self.json_return.update({"original": info.status_code})
             self.json_return.update({"parsed": info.json()})
         except (OSError, RuntimeError, ZeroDivisionError):
@@ -157,12 +178,12 @@ class HiveApi:
 
         return self.json_return
 
-    def getCameraImage(self, device=None, accessToken=None):
+    def getCameraImage(self, device=None, accessToken=None, deadline=None):
         """Build and query camera endpoint."""
         json_return = {}
         url = self.urls["cameraImages"].format(device["props"]["hardwareIdentifier"])
         try:
-            info = self.request("GET", url, camera=True)
+            info = self.request("GET", url, camera=True, deadline=deadline)
             json_return.update({"original": info.status_code})
             json_return.update({"parsed": info.json()})
         except (OSError, RuntimeError, ZeroDivisionError):
@@ -170,14 +191,14 @@ class HiveApi:
 
         return json_return
 
-    def getCameraRecording(self, device=None, eventId=None):
+    def getCameraRecording(self, device=None, eventId=None, deadline=None):
         """Build and query camera endpoint."""
         json_return = {}
         url = self.urls["cameraRecordings"].format(
             device["props"]["hardwareIdentifier"], eventId
         )
         try:
-            info = self.request("GET", url, camera=True)
+            info = self.request("GET", url, camera=True, deadline=deadline)
             json_return.update({"original": info.status_code})
             json_return.update({"parsed": info.text.split("\n")[3]})
         except (OSError, RuntimeError, ZeroDivisionError):
@@ -221,6 +242,18 @@ class HiveApi:
 
         return self.json_return
 
+    def getNode(self, n_type, n_id, deadline=None):
+        """Call the get node endpoint for a single product or device."""
+        url = self.urls["base"] + self.urls["nodes"].format(n_type, n_id)
+        try:
+            response = self.request("GET", url, deadline=deadline)
+            self.json_return.update({"original": response.status_code})
+            self.json_return.update({"parsed": response.json()})
+        except (OSError, RuntimeError, ZeroDivisionError):
+            self.error()
+
+        return self.json_return
+
     def motionSensor(self, sensor, fromepoch, toepoch):
         """Call a way to get motion sensor info."""
         url = (
@@ -257,7 +290,7 @@ class HiveApi:
 
         return self.json_return
 
-    def setState(self, n_type, n_id, **kwargs):
+    def setState(self, n_type, n_id, deadline=None, **kwargs):
         """Set the state of a Device."""
         jsc = (
             "{"
@@ -270,7 +303,7 @@ class HiveApi:
         url = self.urls["base"] + self.urls["nodes"].format(n_type, n_id)
 
         try:
-            response = self.request("POST", url, jsc)
+            response = self.request("POST", url, jsc, deadline=deadline)
             self.json_return.update({"original": response.status_code})
             self.json_return.update({"parsed": response.json()})
         except (OSError, RuntimeError, ZeroDivisionError, ConnectionError):
@@ -1,24 +1,67 @@
 """Hive API Module."""
 
 # pylint: skip-file
-import json
+import asyncio
+import hashlib
+import time
 from typing import Optional
-
-import requests
-import urllib3
-from aiohttp import ClientResponse, ClientSession, web_exceptions
-from pyquery import PyQuery
-
-from ..helper.const import HTTP_UNAUTHORIZED
-from ..helper.hive_exceptions import FileInUse, HiveApiError, NoApiToken
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from urllib.parse import urlsplit
+
+from aiohttp import (
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    web_exceptions,
+)
+
+from ..helper.const import HTTP_NOT_MODIFIED, HTTP_UNAUTHORIZED
+from ..helper.hive_exceptions import (
+    FileInUse,
+    HiveApiError,
+    HiveInvalidDeviceAuthentication,
+    NoApiToken,
+)
+from ..helper.node_parser import parseNodes
+from .hive_retry import (
+    SERVER_ERROR_STATUSES,
+    THROTTLE_STATUSES,
+    HiveRetryPolicy,
+    get_circuit_breaker,
+)
+from .login_info import parse_login_info
+
+
+class HiveHashedStream:
+    """Response content stream which hashes the chunks as they are read."""
+
+    def __init__(self, content: object, digest: object):
+        """Wrap a response content stream.
+
+        Args:
+            content (object): Response content stream.
+            digest (object): hashlib hash to update with each chunk.
+        """
+        self.content = content
+        self.digest = digest
+
+    async def iter_chunked(self, size: int):
+        """Read the content in chunks, hashing each one."""
+        async for chunk in self.content.iter_chunked(size):
+            self.digest.update(chunk)
+            yield chunk
 
 
 class HiveApiAsync:
     """Hive API Code."""
 
-    def __init__(self, hiveSession=None, websession: Optional[ClientSession] = None):
+    def __init__(
+        self,
+        hiveSession=None,
+        websession: Optional[ClientSession] = None,
+        retry_policy: Optional[HiveRetryPolicy] = None,
+        timeout: Optional[ClientTimeout] = None,
+    ):
         """Hive API initialisation."""
         self.baseUrl = "https://beekeeper.hivehome.com/1.0"
         self.cameraBaseUrl = "prod.hcam.bgchtest.info"
@@ -39,48 +82,135 @@ class HiveApiAsync:
             "weather": "https://weather.prod.bgchprod.info/weather",
         }
         self.timeout = 10
+        self.clientTimeout = (
+            ClientTimeout(total=30, connect=self.timeout, sock_read=self.timeout)
+            if timeout is None
+            else timeout
+        )
         self.json_return = {
             "original": "No response to Hive API request",
             "parsed": "No response to Hive API request",
         }
         self.session = hiveSession
         self.websession = ClientSession() if websession is None else websession
+        self.retryPolicy = HiveRetryPolicy() if retry_policy is None else retry_policy
+        self.validators = {}
+        self.transferStats = {}
 
     async def request(
         self, method: str, url: str, camera: bool = False, **kwargs
     ) -> ClientResponse:
-        """Make a request."""
+        """Make a request.
+
+        Throttled and failed requests are retried with the retry policy, and
+        requests to a failing host are shed by its circuit breaker. A
+        deadline, as time.monotonic() time, bounds the request and its retries.
+        A request which times out or passes its deadline raises HiveApiError.
+        Conditional requests send the validators of the last response, and
+        set resp.unchanged when the content is the same as last time.
+        """
         data = kwargs.get("data", None)
-
-        try:
-            if camera:
-                headers = {
-                    "content-type": "application/json",
-                    "Accept": "*/*",
-                    "Authorization": f"Bearer {self.session.tokens.tokenData['token']}",
-                    "x-jwt-token": self.session.tokens.tokenData["token"],
-                    "User-Agent": "Hive/12.04.0 iOS/18.3.1 Apple",
-                }
-            else:
-                headers = {
-                    "content-type": "application/json",
-                    "Accept": "*/*",
-                    "Authorization": self.session.tokens.tokenData["token"],
-                    "User-Agent": "Hive/12.04.0 iOS/18.3.1 Apple",
-                }
-        except KeyError:
-            if "sso" in url:
-                pass
-            else:
-                raise NoApiToken
-
-        async with self.websession.request(
-            method, url, headers=headers, data=data
-        ) as resp:
-            await resp.text()
-            if str(resp.status).startswith("20"):
+        parser = kwargs.get("parser", None)
+        deadline = kwargs.get("deadline", None)
+        conditional = kwargs.get("conditional", False)
+        breaker = get_circuit_breaker(url)
+
+        attempt = 0
+        retried = False
+        while True:
+            token = None
+            try:
+                token = self.session.tokens.tokenData["token"]
+                # aiohttp sets Accept-Encoding itself, offering br when it
+                # can decode it.
+                if camera:
+                    headers = {
+                        "content-type": "application/json",
+                        "Accept": "*/*",
+                        "Authorization": f"Bearer {token}",
+                        "x-jwt-token": token,
+                        "User-Agent": "Hive/12.04.0 iOS/18.3.1 Apple",
+                    }
+                else:
+                    headers = {
+                        "content-type": "application/json",
+                        "Accept": "*/*",
+                        "Authorization": token,
+                        "User-Agent": "Hive/12.04.0 iOS/18.3.1 Apple",
+                    }
+            except KeyError:
+                if "sso" in url:
+                    pass
+                else:
+                    raise NoApiToken
+
+            if conditional:
+                validators = self.validators.get(url, {})
+                if validators.get("etag"):
+                    headers["If-None-Match"] = validators["etag"]
+                if validators.get("modified"):
+                    headers["If-Modified-Since"] = validators["modified"]
+
+            timeout = self.requestTimeout(deadline)
+            breaker.check(url)
+            try:
+                async with self.websession.request(
+                    method, url, headers=headers, data=data, timeout=timeout
+                ) as resp:
+                    resp.unchanged = False
+                    if str(resp.status).startswith("20"):
+                        if not conditional or self.storeValidators(url, resp):
+                            if parser is not None:
+                                resp.parsed = await parser(resp.content)
+                            else:
+                                await resp.text()
+                        else:
+                            await self.checkBodyHash(url, resp, parser)
+                        self.recordTransfer(url, resp)
+                        breaker.success()
+                        return resp
+                    await resp.text()
+                    self.recordTransfer(url, resp)
+            except (ClientError, asyncio.TimeoutError) as err:
+                if deadline is None or time.monotonic() < deadline:
+                    breaker.failure()
+                delay = self.retryPolicy.delay(attempt, method)
+                if delay is None or not self.beforeDeadline(delay, deadline):
+                    if isinstance(err, asyncio.TimeoutError):
+                        raise HiveApiError(f"Timed out calling {url}") from err
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+
+            if resp.status == HTTP_NOT_MODIFIED and conditional:
+                resp.unchanged = True
+                breaker.success()
                 return resp
 
+            if resp.status in THROTTLE_STATUSES + SERVER_ERROR_STATUSES:
+                breaker.failure()
+                delay = self.retryPolicy.delay(
+                    attempt, method, resp.status, resp.headers
+                )
+                if delay is None or not self.beforeDeadline(delay, deadline):
+                    break
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+
+            breaker.success()
+            if resp.status != HTTP_UNAUTHORIZED or retried or token is None:
+                break
+
+            # Renew the tokens unless another request already has, then retry once.
+            retried = True
+            if self.session.tokens.tokenData.get("token") == token:
+                try:
+                    await self.session.hiveRefreshTokens(force=True)
+                except (HiveApiError, HiveInvalidDeviceAuthentication):
+                    break
+
         if resp.status == HTTP_UNAUTHORIZED:
             self.session.logger.error(
                 f"Hive token has expired when calling {url} - "
@@ -94,26 +224,153 @@ class HiveApiAsync:
 
         raise HiveApiError
 
-    def getLoginInfo(self):
-        """Get login properties to make the login request."""
-        url = "https://sso.hivehome.com/"
-
-        data = requests.get(url=url, verify=False, timeout=self.timeout)
-        html = PyQuery(data.content)
-        json_data = json.loads(
-            '{"'
-            + (html("script:first").text())
-            .replace(",", ', "')
-            .replace("=", '":')
-            .replace("window.", "")
-            + "}"
+    def endpointName(self, url: str):
+        """Get the name of the endpoint a URL belongs to.
+
+        Args:
+            url (str): URL of the request.
+
+        Returns:
+            str: Key of the endpoint in urls, or the URL path if it is not one.
+        """
+        name, length = urlsplit(url).path, 0
+        for key, template in self.urls.items():
+            prefix = template.split("{", 1)[0]
+            if len(prefix) > length and url.startswith(prefix):
+                name, length = key, len(prefix)
+        return name
+
+    def recordTransfer(self, url: str, resp: ClientResponse):
+        """Add the body size of a response to the transfer stats of its endpoint.
+
+        Args:
+            url (str): URL of the request.
+            resp (ClientResponse): Response which has been read.
+        """
+        stats = self.transferStats.setdefault(
+            self.endpointName(url),
+            {"requests": 0, "compressedBytes": 0, "decompressedBytes": 0},
+        )
+        decompressed = resp.content.total_bytes
+        compressed = getattr(resp.content, "total_raw_bytes", None)
+        if compressed is None:
+            compressed = (
+                decompressed if resp.content_length is None else resp.content_length
+            )
+        stats["requests"] += 1
+        stats["compressedBytes"] += compressed
+        stats["decompressedBytes"] += decompressed
+
+    def storeValidators(self, url: str, resp: ClientResponse):
+        """Store the ETag and Last-Modified validators of a response.
+
+        Args:
+            url (str): URL of the request.
+            resp (ClientResponse): Successful response.
+
+        Returns:
+            boolean: True if the response has validators.
+        """
+        etag = resp.headers.get("ETag")
+        modified = resp.headers.get("Last-Modified")
+        if etag or modified:
+            self.validators[url] = {"etag": etag, "modified": modified}
+            return True
+        return False
+
+    async def checkBodyHash(self, url: str, resp: ClientResponse, parser=None):
+        """Read a response without validators, comparing its hash to the last one.
+
+        The body is hashed chunk by chunk as the parser reads it, so it is
+        never held whole. Without a parser the body is read for the caller
+        and hashed once.
+
+        Args:
+            url (str): URL of the request.
+            resp (ClientResponse): Successful response.
+            parser (callable, optional): Parser of the response stream. Defaults to None.
+        """
+        digest = hashlib.sha256()
+        if parser is not None:
+            resp.parsed = await parser(HiveHashedStream(resp.content, digest))
+        else:
+            digest.update(await resp.read())
+        resp.unchanged = self.validators.get(url, {}).get("hash") == digest.digest()
+        self.validators[url] = {"hash": digest.digest()}
+
+    def clearValidators(self):
+        """Forget the validators so the next conditional requests are fetched in full."""
+        self.validators.clear()
+
+    def setTimeouts(
+        self, connect: float = None, read: float = None, total: float = None
+    ):
+        """Set the timeouts of requests, keeping any which are not given.
+
+        Args:
+            connect (float, optional): Seconds to connect to the API. Defaults to None.
+            read (float, optional): Seconds to wait for each read of a response. Defaults to None.
+            total (float, optional): Seconds for a whole request. Defaults to None.
+        """
+        current = self.clientTimeout
+        self.clientTimeout = ClientTimeout(
+            total=current.total if total is None else total,
+            connect=current.connect if connect is None else connect,
+            sock_read=current.sock_read if read is None else read,
+            sock_connect=current.sock_connect,
         )
 
-        loginData = {}
-        loginData.update({"UPID": json_data["HiveSSOPoolId"]})
-        loginData.update({"CLIID": json_data["HiveSSOPublicCognitoClientId"]})
-        loginData.update({"REGION": json_data["HiveSSOPoolId"]})
-        return loginData
+    def requestTimeout(self, deadline: float = None):
+        """Get the timeout of a request, shortened to end by a deadline.
+
+        Args:
+            deadline (float, optional): time.monotonic() time to finish by. Defaults to None.
+
+        Raises:
+            HiveApiError: The deadline has passed.
+
+        Returns:
+            ClientTimeout: Timeout of the request.
+        """
+        if deadline is None:
+            return self.clientTimeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise HiveApiError("Deadline has passed")
+        current = self.clientTimeout
+        return ClientTimeout(
+            total=remaining if current.total is None else min(current.total, remaining),
+            connect=current.connect,
+            sock_read=current.sock_read,
+            sock_connect=current.sock_connect,
+        )
+
+    @staticmethod
+    def beforeDeadline(delay: float, deadline: float = None):
+        """Check a retry after a delay would start before a deadline."""
+        return deadline is None or time.monotonic() + delay < deadline
+
+    async def getLoginInfo(self):
+        """Get login properties to make the login request.
+
+        Raises:
+            HiveApiError: The SSO page could not be fetched or has no login information.
+
+        Returns:
+            dict: Login information.
+        """
+        url = self.urls["properties"]
+        async with self.websession.get(
+            url, timeout=ClientTimeout(total=self.timeout)
+        ) as resp:
+            if resp.status != 200:
+                raise HiveApiError(f"Calling {url} returned status {resp.status}")
+            html = await resp.text()
+
+        login_info = parse_login_info(html)
+        if login_info is None:
+            raise HiveApiError(f"No login information found at {url}")
+        return login_info
 
     async def refreshTokens(self):
         """Refresh tokens - DEPRECATED NOW BY AWS TOKEN MANAGEMENT."""
@@ -142,12 +399,33 @@ class HiveApiAsync:
 
         return self.json_return
 
-    async def getAll(self):
-        """Build and query all endpoint."""
+    async def getAll(self, stream: bool = False, deadline: float = None):
+        """Build and query all endpoint.
+
+        When streamed the response is parsed as it arrives and the products,
+        devices and actions are returned keyed by id instead of as lists.
+        When nothing has changed since the last call the status is
+        HTTP_NOT_MODIFIED and nothing is parsed.
+        """
         json_return = {}
         url = self.urls["all"]
         try:
-            resp = await self.request("get", url)
+            if stream:
+                resp = await self.request(
+                    "get", url, parser=parseNodes, deadline=deadline, conditional=True
+                )
+            else:
+                resp = await self.request(
+                    "get", url, deadline=deadline, conditional=True
+                )
+            if resp.unchanged:
+                json_return.update({"original": HTTP_NOT_MODIFIED})
+                json_return.update({"parsed": None})
+                return json_return
+            if stream:
+                json_return.update({"original": resp.status})
+                json_return.update({"parsed": resp.parsed})
+                return json_return
             json_return.update({"original": resp.status})
             json_return.update({"parsed": await resp.json(content_type=None)})
         except (OSError, RuntimeError, ZeroDivisionError):
@@ -155,12 +433,12 @@ class HiveApiAsync:
 
         return json_return
 
-    async def getAlarm(self):
+    async def getAlarm(self, deadline: float = None):
         """Build and query alarm endpoint."""
         json_return = {}
         url = self.urls["alarm"] + self.session.config.homeID
         try:
-            resp = await self.request("get", url)
+            resp = await self.request("get", url, deadline=deadline)
             json_return.update({"original": resp.status})
             json_return.update({"parsed": await resp.json(content_type=None)})
         except (OSError, RuntimeError, ZeroDivisionError):
@@ -168,12 +446,12 @@ class HiveApiAsync:
 
         return json_return
 
-    async def getCameraImage(self, device):
+    async def getCameraImage(self, device, deadline: float = None):
         """Build and query alarm endpoint."""
         json_return = {}
         url = self.urls["cameraImages"].format(device["props"]["hardwareIdentifier"])
         try:
-            resp = await self.request("get", url, True)
+            resp = await self.request("get", url, True, deadline=deadline)
             json_return.update({"original": resp.status})
             json_return.update({"parsed": await resp.json(content_type=None)})
         except (OSError, RuntimeError, ZeroDivisionError):
@@ -181,14 +459,14 @@ class HiveApiAsync:
 
         return json_return
 
-    async def getCameraRecording(self, device, eventId):
+    async def getCameraRecording(self, device, eventId, deadline: float = None):
         """Build and query alarm endpoint."""
         json_return = {}
         url = self.urls["cameraRecordings"].format(
             device["props"]["hardwareIdentifier"], eventId
         )
         try:
-            resp = await self.request("get", url, True)
+            resp = await self.request("get", url, True, deadline=deadline)
             recUrl = await resp.text()
             json_return.update({"original": resp.status})
             json_return.update({"parsed": recUrl.split("\n")[3]})
@@ -236,6 +514,19 @@ class HiveApiAsync:
 
         return json_return
 
+    async def getNode(self, n_type, n_id, deadline: float = None):
+        """Call the get node endpoint for a single product or device."""
+        json_return = {}
+        url = self.urls["nodes"].format(n_type, n_id)
+        try:
+            resp = await self.request("get", url, deadline=deadline)
+            json_return.update({"original": resp.status})
+            json_return.update({"parsed": await resp.json(content_type=None)})
+        except (OSError, RuntimeError, ZeroDivisionError):
+            await self.error()
+
+        return json_return
+
     async def motionSensor(self, sensor, fromepoch, toepoch):
         """Call a way to get motion sensor info."""
         json_return = {}
@@ -274,7 +565,7 @@ class HiveApiAsync:
 
         return json_return
 
-    async def setState(self, n_type, n_id, **kwargs):
+    async def setState(self, n_type, n_id, deadline: float = None, **kwargs):
         """Set the state of a Device."""
         json_return = {}
         jsc = (
@@ -288,7 +579,7 @@ class HiveApiAsync:
         url = self.urls["nodes"].format(n_type, n_id)
         try:
             await self.isFileBeingUsed()
-            resp = await self.request("post", url, data=jsc)
+            resp = await self.request("post", url, data=jsc, deadline=deadline)
             json_return["original"] = resp.status
             json_return["parsed"] = await resp.json(content_type=None)
         except (FileInUse, OSError, RuntimeError, ConnectionError) as e:
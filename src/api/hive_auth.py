@@ -20,6 +20,7 @@ from ..helper.hive_exceptions import (
     HiveInvalidUsername,
 )
 from .hive_api import HiveApi
+from .login_info import LOGIN_INFO
 
 # https://github.com/aws/amazon-cognito-identity-js/blob/master/src/AuthenticationHelper.js#L22
 N_HEX = (
@@ -43,6 +44,10 @@ N_HEX = (
 # https://github.com/aws/amazon-cognito-identity-js/blob/master/src/AuthenticationHelper.js#L49
 G_HEX = "2"
 INFO_BITS = bytearray("Caldera Derived Key", "utf-8")
+# SRP group parameters, parsed once.
+BIG_N = int(N_HEX, 16)
+G_VALUE = int(G_HEX, 16)
+K_VALUE = int(hashlib.sha256(bytes.fromhex("00" + N_HEX + "0" + G_HEX)).hexdigest(), 16)
 
 
 class HiveAuth:
@@ -79,6 +84,8 @@ class HiveAuth:
         device_password: str = None,
         pool_region: str = None,
         client_secret: str = None,
+        websession=None,
+        native_client: bool = False,
     ):
         """Initialise Sync Hive Auth.
 
@@ -87,6 +94,9 @@ class HiveAuth:
             password (str): [description]
             pool_region (str, optional): [description]. Defaults to None.
             client_secret (str, optional): [description]. Defaults to None.
+            websession (optional): Websession of the session. Defaults to None.
+            native_client (bool, optional): Kept for the async auth, the sync
+                auth always uses boto3. Defaults to False.
 
         Raises:
             ValueError: pool_region and client should not both be specified.
@@ -105,15 +115,17 @@ class HiveAuth:
         self.access_token = None
         self.user_id = "user_id"
         self.client_secret = client_secret
-        self.big_n = hex_to_long(N_HEX)
-        self.g_value = hex_to_long(G_HEX)
-        self.k = hex_to_long(hex_hash("00" + N_HEX + "0" + G_HEX))
+        self.websession = websession
+        self.native_client = native_client
+        self.big_n = BIG_N
+        self.g_value = G_VALUE
+        self.k = K_VALUE
         self.small_a_value = self.generate_random_small_a()
         self.large_a_value = self.calculate_a()
         self.use_file = bool(self.username == "use@file.com")
         self.file_response = {"AuthenticationResult": {"AccessToken": "file"}}
         self.api = HiveApi()
-        self.data = self.api.getLoginInfo()
+        self.data = LOGIN_INFO.get_sync(self.api.getLoginInfo)
         self.__pool_id = self.data.get("UPID")
         self.__client_id = self.data.get("CLIID")
         self.__region = self.data.get("REGION").split("_")[0]
@@ -214,9 +226,7 @@ class HiveAuth:
         salt = pad_hex(get_random(16))
 
         x_value = hex_to_long(hex_hash(salt + combined_string_hash))
-        g_value = hex_to_long(G_HEX)
-        big_n = hex_to_long(N_HEX)
-        verifier_device_not_padded = pow(g_value, x_value, big_n)
+        verifier_device_not_padded = pow(G_VALUE, x_value, BIG_N)
         verifier = pad_hex(verifier_device_not_padded)
 
         device_secret_verifier_config = {
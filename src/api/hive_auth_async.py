@@ -5,15 +5,13 @@ import base64
 import binascii
 import concurrent.futures
 import datetime
-import functools
 import hashlib
 import hmac
 import os
 import re
 import socket
 
-import boto3
-import botocore
+from aiohttp import ClientTimeout
 
 from ..helper.hive_exceptions import (
     HiveApiError,
@@ -23,7 +21,14 @@ from ..helper.hive_exceptions import (
     HiveInvalidPassword,
     HiveInvalidUsername,
 )
-from .hive_api import HiveApi
+from .cognito_async import (
+    BotoCognitoClient,
+    CognitoClientError,
+    EndpointConnectionError,
+    NativeCognitoClient,
+)
+from .hive_async_api import HiveApiAsync
+from .login_info import LOGIN_INFO
 
 # https://github.com/aws/amazon-cognito-identity-js/blob/master/src/AuthenticationHelper.js#L22
 N_HEX = (
@@ -47,7 +52,23 @@ N_HEX = (
 # https://github.com/aws/amazon-cognito-identity-js/blob/master/src/AuthenticationHelper.js#L49
 G_HEX = "2"
 INFO_BITS = bytearray("Caldera Derived Key", "utf-8")
-POOL = concurrent.futures.ThreadPoolExecutor()
+# Timeout of each native Cognito request, matching the Hive API requests.
+COGNITO_TIMEOUT = ClientTimeout(total=30, connect=10, sock_read=10)
+# SRP group parameters, parsed once.
+BIG_N = int(N_HEX, 16)
+G_VALUE = int(G_HEX, 16)
+K_VALUE = int(hashlib.sha256(bytes.fromhex("00" + N_HEX + "0" + G_HEX)).hexdigest(), 16)
+# Modular exponentiation runs on this thread instead of the event loop. It
+# holds the GIL, so extra threads would add no parallelism: sessions logging
+# in together would share the CPU and all finish late. With one thread each
+# SRP step (tens of milliseconds) runs in turn, so the first session is not
+# held up by the others and none waits longer than with more threads.
+POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="hive_srp"
+)
+# Exponent bits handled by each pow call, so the GIL is released often.
+# Splitting the exponent costs about twice the CPU of a single pow call.
+MOD_POW_WINDOW = 8
 
 
 class HiveAuthAsync:
@@ -68,8 +89,14 @@ class HiveAuthAsync:
         device_password: str = None,
         pool_region: str = None,
         client_secret: str = None,
+        websession=None,
+        native_client: bool = False,
     ):
-        """Initialise async auth."""
+        """Initialise async auth.
+
+        The native client calls Cognito through aiohttp using websession
+        instead of running boto3 in an executor.
+        """
         if pool_region is not None:
             raise ValueError(
                 "pool_region and client should not both be specified "
@@ -83,14 +110,17 @@ class HiveAuthAsync:
         self.device_key = device_key
         self.device_password = device_password
         self.access_token = None
-        self.api = HiveApi()
+        self.api = None
         self.user_id = "user_id"
         self.client_secret = client_secret
-        self.big_n = hex_to_long(N_HEX)
-        self.g_value = hex_to_long(G_HEX)
-        self.k = hex_to_long(hex_hash(pad_hex(N_HEX) + pad_hex(G_HEX)))
+        self.websession = websession
+        self.native_client = native_client
+        self.big_n = BIG_N
+        self.g_value = G_VALUE
+        self.k = K_VALUE
         self.small_a_value = self.generate_random_small_a()
-        self.large_a_value = self.calculate_a()
+        # Calculated off the event loop in async_init
+        self.large_a_value = None
         self.use_file = bool(self.username == "use@file.com")
         self.file_response = {"AuthenticationResult": {"AccessToken": "file"}}
         # The below variables are initialized in the async_init function
@@ -102,21 +132,32 @@ class HiveAuthAsync:
 
     async def async_init(self):
         """Initialise async variables."""
-        self.data = await self.loop.run_in_executor(None, self.api.getLoginInfo)
+        if self.websession is not None:
+            discover = HiveApiAsync(websession=self.websession).getLoginInfo
+        else:
+
+            def discover():
+                if self.api is None:
+                    # Imported here so pyquery is only loaded without a websession.
+                    from .hive_api import HiveApi
+
+                    self.api = HiveApi()
+                return self.loop.run_in_executor(None, self.api.getLoginInfo)
+
+        self.data = await LOGIN_INFO.get(discover)
+        if self.data is None:
+            raise HiveApiError("Unable to get the Hive login information")
         self.__pool_id = self.data.get("UPID")
         self.__client_id = self.data.get("CLIID")
         self.__region = self.data.get("REGION").split("_")[0]
-        self.client = await self.loop.run_in_executor(
-            None,
-            functools.partial(
-                boto3.client,
-                "cognito-idp",
-                self.__region,
-                aws_access_key_id="ACCESS_KEY",
-                aws_secret_access_key="SECRET_KEY",
-                aws_session_token="SESSION_TOKEN",
-            ),
-        )
+        if self.large_a_value is None:
+            self.large_a_value = await self.loop.run_in_executor(POOL, self.calculate_a)
+        if self.native_client:
+            self.client = NativeCognitoClient(
+                self.__region, self.websession, COGNITO_TIMEOUT
+            )
+        else:
+            self.client = await BotoCognitoClient.create(self.__region)
 
     def _to_int(self, value):
         """Accepts int or hex string and returns int."""
@@ -142,7 +183,7 @@ class HiveAuthAsync:
         :param {Long integer} a Randomly generated small A.
         :return {Long integer} Computed large A.
         """
-        big_a = pow(self.g_value, self.small_a_value, self.big_n)
+        big_a = mod_pow(self.g_value, self.small_a_value, self.big_n)
         # safety check
         if (big_a % self.big_n) == 0:
             raise ValueError("Safety check for A failed")
@@ -168,10 +209,10 @@ class HiveAuthAsync:
         username_password_hash = hash_sha256(username_password.encode("utf-8"))
 
         x_value = hex_to_long(hex_hash(pad_hex(salt) + username_password_hash))
-        g_mod_pow_xn = pow(self.g_value, x_value, self.big_n)
+        g_mod_pow_xn = mod_pow(self.g_value, x_value, self.big_n)
         int_value2 = (server_b_value - self.k * g_mod_pow_xn) % self.big_n
         exp = self.small_a_value + u_value * x_value
-        s_value = pow(int_value2, exp, self.big_n)
+        s_value = mod_pow(int_value2, exp, self.big_n)
         hkdf = compute_hkdf(
             bytearray.fromhex(pad_hex(s_value)),
             bytearray.fromhex(pad_hex(long_to_hex(u_value))),
@@ -213,9 +254,9 @@ class HiveAuthAsync:
         salt = pad_hex(get_random(16))
 
         x_value = hex_to_long(hex_hash(salt + combined_string_hash))
-        g_value = hex_to_long(G_HEX)
-        big_n = hex_to_long(N_HEX)
-        verifier_device_not_padded = pow(g_value, x_value, big_n)
+        verifier_device_not_padded = await self.loop.run_in_executor(
+            POOL, mod_pow, G_VALUE, x_value, BIG_N
+        )
         verifier = pad_hex(verifier_device_not_padded)
 
         device_secret_verifier_config = {
@@ -231,6 +272,20 @@ class HiveAuthAsync:
         self, device_group_key, device_key, device_password, server_b_value, salt
     ):
         """Get device authentication key."""
+        return await self.loop.run_in_executor(
+            POOL,
+            self.calculate_device_authentication_key,
+            device_group_key,
+            device_key,
+            device_password,
+            server_b_value,
+            salt,
+        )
+
+    def calculate_device_authentication_key(  # pylint: disable=too-many-positional-arguments
+        self, device_group_key, device_key, device_password, server_b_value, salt
+    ):
+        """Calculate the device authentication key."""
         u_value = calculate_u(self.large_a_value, server_b_value)
         if u_value == 0:
             raise ValueError("U cannot be zero.")
@@ -238,10 +293,10 @@ class HiveAuthAsync:
         username_password_hash = hash_sha256(username_password.encode("utf-8"))
 
         x_value = hex_to_long(hex_hash(pad_hex(salt) + username_password_hash))
-        g_mod_pow_xn = pow(self.g_value, x_value, self.big_n)
+        g_mod_pow_xn = mod_pow(self.g_value, x_value, self.big_n)
         int_value2 = (server_b_value - self.k * g_mod_pow_xn) % self.big_n
         exp = self.small_a_value + u_value * x_value
-        s_value = pow(int_value2, exp, self.big_n)
+        s_value = mod_pow(int_value2, exp, self.big_n)
         hkdf = compute_hkdf(
             bytearray.fromhex(pad_hex(s_value)),
             bytearray.fromhex(pad_hex(long_to_hex(u_value))),
@@ -314,7 +369,7 @@ class HiveAuthAsync:
             datetime.datetime.utcnow().strftime("%a %b %d %H:%M:%S UTC %Y"),
         )
         hkdf = await self.loop.run_in_executor(
-            None,
+            POOL,
             self.get_password_authentication_key,
             self.user_id,
             self.password,
@@ -361,19 +416,15 @@ class HiveAuthAsync:
         response = None
         result = None
         try:
-            response = await self.loop.run_in_executor(
-                None,
-                functools.partial(
-                    self.client.initiate_auth,
-                    AuthFlow="USER_SRP_AUTH",
-                    AuthParameters=auth_params,
-                    ClientId=self.__client_id,
-                ),
+            response = await self.client.initiate_auth(
+                AuthFlow="USER_SRP_AUTH",
+                AuthParameters=auth_params,
+                ClientId=self.__client_id,
             )
-        except botocore.exceptions.ClientError as err:
+        except CognitoClientError as err:
             if err.__class__.__name__ == "UserNotFoundException":
                 raise HiveInvalidUsername from err
-        except botocore.exceptions.EndpointConnectionError as err:
+        except EndpointConnectionError as err:
             if err.__class__.__name__ == "EndpointConnectionError":
                 raise HiveApiError from err
 
@@ -382,21 +433,17 @@ class HiveAuthAsync:
                 response["ChallengeParameters"]
             )
             try:
-                result = await self.loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        self.client.respond_to_auth_challenge,
-                        ClientId=self.__client_id,
-                        ChallengeName=self.PASSWORD_VERIFIER_CHALLENGE,
-                        ChallengeResponses=challenge_response,
-                    ),
+                result = await self.client.respond_to_auth_challenge(
+                    ClientId=self.__client_id,
+                    ChallengeName=self.PASSWORD_VERIFIER_CHALLENGE,
+                    ChallengeResponses=challenge_response,
                 )
-            except botocore.exceptions.ClientError as err:
+            except CognitoClientError as err:
                 if err.__class__.__name__ == "NotAuthorizedException":
                     raise HiveInvalidPassword from err
                 if err.__class__.__name__ == "ResourceNotFoundException":
                     raise HiveInvalidDeviceAuthentication from err
-            except botocore.exceptions.EndpointConnectionError as err:
+            except EndpointConnectionError as err:
                 if err.__class__.__name__ == "EndpointConnectionError":
                     raise HiveApiError from err
 
@@ -412,29 +459,21 @@ class HiveAuthAsync:
 
         if login_result.get("ChallengeName") == self.DEVICE_VERIFIER_CHALLENGE:
             try:
-                initial_result = await self.loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        self.client.respond_to_auth_challenge,
-                        ClientId=self.__client_id,
-                        ChallengeName=self.DEVICE_VERIFIER_CHALLENGE,
-                        ChallengeResponses=auth_params,
-                    ),
+                initial_result = await self.client.respond_to_auth_challenge(
+                    ClientId=self.__client_id,
+                    ChallengeName=self.DEVICE_VERIFIER_CHALLENGE,
+                    ChallengeResponses=auth_params,
                 )
 
                 device_challenge_response = await self.process_device_challenge(
                     initial_result["ChallengeParameters"]
                 )
-                result = await self.loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        self.client.respond_to_auth_challenge,
-                        ClientId=self.__client_id,
-                        ChallengeName=self.DEVICE_PASSWORD_CHALLENGE,
-                        ChallengeResponses=device_challenge_response,
-                    ),
+                result = await self.client.respond_to_auth_challenge(
+                    ClientId=self.__client_id,
+                    ChallengeName=self.DEVICE_PASSWORD_CHALLENGE,
+                    ChallengeResponses=device_challenge_response,
                 )
-            except botocore.exceptions.EndpointConnectionError as err:
+            except EndpointConnectionError as err:
                 if err.__class__.__name__ == "EndpointConnectionError":
                     raise HiveApiError from err
         else:
@@ -452,18 +491,14 @@ class HiveAuthAsync:
         code = str(entered_code)
         result = None
         try:
-            result = await self.loop.run_in_executor(
-                None,
-                functools.partial(
-                    self.client.respond_to_auth_challenge,
-                    ClientId=self.__client_id,
-                    ChallengeName=self.SMS_MFA_CHALLENGE,
-                    Session=session,
-                    ChallengeResponses={
-                        "SMS_MFA_CODE": code,
-                        "USERNAME": self.user_id,
-                    },
-                ),
+            result = await self.client.respond_to_auth_challenge(
+                ClientId=self.__client_id,
+                ChallengeName=self.SMS_MFA_CHALLENGE,
+                Session=session,
+                ChallengeResponses={
+                    "SMS_MFA_CODE": code,
+                    "USERNAME": self.user_id,
+                },
             )
             if "NewDeviceMetadata" in result["AuthenticationResult"]:
                 self.access_token = result["AuthenticationResult"]["AccessToken"]
@@ -473,13 +508,13 @@ class HiveAuthAsync:
                 self.device_key = result["AuthenticationResult"]["NewDeviceMetadata"][
                     "DeviceKey"
                 ]
-        except botocore.exceptions.ClientError as err:
+        except CognitoClientError as err:
             if err.__class__.__name__ in (
                 "NotAuthorizedException",
                 "CodeMismatchException",
             ):
                 raise HiveInvalid2FACode from err
-        except botocore.exceptions.EndpointConnectionError as err:
+        except EndpointConnectionError as err:
             if err.__class__.__name__ == "EndpointConnectionError":
                 raise HiveApiError from err
 
@@ -506,23 +541,19 @@ class HiveAuthAsync:
             device_secret_verifier_config = await self.generate_hash_device(
                 self.device_group_key, self.device_key
             )
-            result = await self.loop.run_in_executor(
-                None,
-                functools.partial(
-                    self.client.confirm_device,
-                    AccessToken=self.access_token,
-                    DeviceKey=self.device_key,
-                    DeviceName=device_name,
-                    DeviceSecretVerifierConfig=device_secret_verifier_config,
-                ),
+            result = await self.client.confirm_device(
+                AccessToken=self.access_token,
+                DeviceKey=self.device_key,
+                DeviceName=device_name,
+                DeviceSecretVerifierConfig=device_secret_verifier_config,
             )
-        except botocore.exceptions.ClientError as err:
+        except CognitoClientError as err:
             if err.__class__.__name__ in (
                 "NotAuthorizedException",
                 "CodeMismatchException",
             ):
                 raise HiveInvalid2FACode from err
-        except botocore.exceptions.EndpointConnectionError as err:
+        except EndpointConnectionError as err:
             if err.__class__.__name__ == "EndpointConnectionError":
                 raise HiveApiError from err
 
@@ -534,16 +565,12 @@ class HiveAuthAsync:
             await self.async_init()
         result = None
         try:
-            result = await self.loop.run_in_executor(
-                None,
-                functools.partial(
-                    self.client.update_device_status,
-                    AccessToken=self.access_token,
-                    DeviceKey=self.device_key,
-                    DeviceRememberedStatus="remembered",
-                ),
+            result = await self.client.update_device_status(
+                AccessToken=self.access_token,
+                DeviceKey=self.device_key,
+                DeviceRememberedStatus="remembered",
             )
-        except botocore.exceptions.EndpointConnectionError as err:
+        except EndpointConnectionError as err:
             if err.__class__.__name__ == "EndpointConnectionError":
                 raise HiveApiError from err
 
@@ -566,18 +593,14 @@ class HiveAuthAsync:
             }
 
         try:
-            result = await self.loop.run_in_executor(
-                None,
-                functools.partial(
-                    self.client.initiate_auth,
-                    ClientId=self.__client_id,
-                    AuthFlow="REFRESH_TOKEN_AUTH",
-                    AuthParameters=auth_params,
-                ),
+            result = await self.client.initiate_auth(
+                ClientId=self.__client_id,
+                AuthFlow="REFRESH_TOKEN_AUTH",
+                AuthParameters=auth_params,
             )
-        except botocore.exceptions.ClientError as err:
+        except CognitoClientError as err:
             raise HiveFailedToRefreshTokens from err
-        except botocore.exceptions.EndpointConnectionError as err:
+        except EndpointConnectionError as err:
             if err.__class__.__name__ == "EndpointConnectionError":
                 raise HiveApiError from err
 
@@ -590,18 +613,14 @@ class HiveAuthAsync:
         result = None
 
         try:
-            result = await self.loop.run_in_executor(
-                None,
-                functools.partial(
-                    self.client.forget_device,
-                    AccessToken=access_token,
-                    DeviceKey=device_key,
-                ),
+            result = await self.client.forget_device(
+                AccessToken=access_token,
+                DeviceKey=device_key,
             )
-        except botocore.exceptions.ClientError as err:
+        except CognitoClientError as err:
             if err.__class__.__name__ == "NotAuthorizedException":
                 raise HiveInvalid2FACode from err
-        except botocore.exceptions.EndpointConnectionError as err:
+        except EndpointConnectionError as err:
             if err.__class__.__name__ == "ResourceNotFoundException":
                 raise HiveApiError from err
 
@@ -642,6 +661,28 @@ def calculate_u(big_a, big_b):
     return hex_to_long(u_hex_hash)
 
 
+def mod_pow(base, exponent, modulus, window=MOD_POW_WINDOW):
+    """
+    Calculate base ** exponent % modulus in short pow calls.
+
+    pow holds the GIL for the whole calculation, so splitting the exponent
+    lets the event loop thread run between calls. The extra multiplication
+    for each window makes this about twice as slow as a single pow call.
+
+    :param {Long integer} base Base.
+    :param {Long integer} exponent Non-negative exponent.
+    :param {Long integer} modulus Modulus.
+    :param {Integer} window Exponent bits handled by each pow call.
+    :return {Long integer} Computed power.
+    """
+    result = 1
+    mask = (1 << window) - 1
+    for shift in range((exponent.bit_length() - 1) // window * window, -1, -window):
+        result = pow(result, 1 << window, modulus)
+        result = result * pow(base, (exponent >> shift) & mask, modulus) % modulus
+    return result % modulus
+
+
 def long_to_hex(long_num):
     """Convert long number to hex."""
     return "%x" % long_num  # pylint: disable=consider-using-f-string
@@ -0,0 +1,196 @@
+"""Retry policy and circuit breaker for Hive API requests."""
+
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from ..helper.const import (
+    HTTP_BAD_GATEWAY,
+    HTTP_INTERNAL_SERVER_ERROR,
+    HTTP_SERVICE_UNAVAILABLE,
+    HTTP_TOO_MANY_REQUESTS,
+)
+from ..helper.hive_exceptions import HiveApiUnavailable
+
+HTTP_GATEWAY_TIMEOUT = 504
+# Statuses where the request was not processed, so any method can be retried.
+THROTTLE_STATUSES = (HTTP_TOO_MANY_REQUESTS, HTTP_SERVICE_UNAVAILABLE)
+SERVER_ERROR_STATUSES = (
+    HTTP_INTERNAL_SERVER_ERROR,
+    HTTP_BAD_GATEWAY,
+    HTTP_SERVICE_UNAVAILABLE,
+    HTTP_GATEWAY_TIMEOUT,
+)
+IDEMPOTENT_METHODS = ("get", "head", "options", "put", "delete")
+
+
+class HiveRetryPolicy:
+    """Exponential backoff with full jitter for failed API requests.
+
+    Throttled requests (429/503) are retried for any method, waiting at
+    least as long as the Retry-After header asks. Other server errors and
+    connection errors are only retried for idempotent methods.
+    """
+
+    def __init__(
+        self,
+        retries: int = 2,
+        backoff: float = 0.5,
+        max_backoff: float = 10,
+        max_retry_after: float = 30,
+    ):
+        """Initialise the retry policy.
+
+        Args:
+            retries (int, optional): Retries after the first attempt. Defaults to 2.
+            backoff (float, optional): Base delay in seconds, doubled for each
+                retry. Defaults to 0.5.
+            max_backoff (float, optional): Maximum backoff delay in seconds.
+                Defaults to 10.
+            max_retry_after (float, optional): Longest Retry-After to wait for in
+                seconds. Defaults to 30.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+
+    def is_retryable(self, method: str, status: int = None):
+        """Check if a failed request may be retried.
+
+        Args:
+            method (str): HTTP method of the request.
+            status (int, optional): Response status, None for a connection error.
+
+        Returns:
+            boolean: True if the request may be retried.
+        """
+        if status in THROTTLE_STATUSES:
+            return True
+        if status is None or status in SERVER_ERROR_STATUSES:
+            return method.lower() in IDEMPOTENT_METHODS
+        return False
+
+    def delay(self, attempt: int, method: str, status: int = None, headers=None):
+        """Get the delay before retrying a failed request.
+
+        Args:
+            attempt (int): Number of retries already made.
+            method (str): HTTP method of the request.
+            status (int, optional): Response status, None for a connection error.
+            headers (dict, optional): Response headers.
+
+        Returns:
+            float: Seconds to wait, or None if the request should not be retried.
+        """
+        if attempt >= self.retries or not self.is_retryable(method, status):
+            return None
+
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        wait = self.retry_after(headers)
+        if wait is not None:
+            if wait > self.max_retry_after:
+                return None
+            delay = max(delay, wait)
+        return delay
+
+    @staticmethod
+    def retry_after(headers):
+        """Get the delay asked for by a Retry-After header.
+
+        Args:
+            headers (dict): Response headers.
+
+        Returns:
+            float: Seconds to wait, or None if there is no valid header.
+        """
+        value = (headers or {}).get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HiveCircuitBreaker:
+    """Circuit breaker which sheds requests to a host while it is failing.
+
+    After a number of consecutive failures the circuit opens and requests
+    fail straight away. One trial request is let through each reset timeout;
+    a success closes the circuit and a failure keeps it open.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60):
+        """Initialise the circuit breaker.
+
+        Args:
+            failure_threshold (int, optional): Consecutive failures which open the
+                circuit. Defaults to 5.
+            reset_timeout (float, optional): Seconds to shed requests for.
+                Defaults to 60.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def is_open(self):
+        """Check if requests are being shed."""
+        return self.opened_at is not None
+
+    def check(self, url: str):
+        """Check a request may be made.
+
+        Args:
+            url (str): URL of the request.
+
+        Raises:
+            HiveApiUnavailable: The circuit is open.
+        """
+        if self.opened_at is None:
+            return
+        now = time.monotonic()
+        if now - self.opened_at >= self.reset_timeout:
+            self.opened_at = now
+            return
+        raise HiveApiUnavailable(f"Hive API unavailable, not calling {url}")
+
+    def success(self):
+        """Record a request which reached the API."""
+        self.failures = 0
+        self.opened_at = None
+
+    def failure(self):
+        """Record a request which failed because the API is degraded."""
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+BREAKERS = {}
+
+
+def get_circuit_breaker(url: str):
+    """Get the circuit breaker shared by every session for the host of a URL.
+
+    Args:
+        url (str): URL of the request.
+
+    Returns:
+        HiveCircuitBreaker: Circuit breaker of the host.
+    """
+    host = urlsplit(url).netloc
+    if host not in BREAKERS:
+        BREAKERS[host] = HiveCircuitBreaker()
+    return BREAKERS[host]
@@ -0,0 +1,155 @@
+"""Cache of the Hive SSO login information."""
+
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+from os.path import expanduser
+
+LOGIN_INFO_KEYS = ("UPID", "CLIID", "REGION")
+SSO_VARIABLE = re.compile(
+    r"window\.(HiveSSO\w+)\s*=\s*(\"(?:[^\"\\]|\\.)*\"|'[^']*'|[^,;\s<]+)"
+)
+
+
+def parse_login_info(html: str):
+    """Extract the login information from the HiveSSO variables of the SSO page.
+
+    Args:
+        html (str): SSO page.
+
+    Returns:
+        dict: Login information, or None if the page does not contain it.
+    """
+    variables = {}
+    for name, value in SSO_VARIABLE.findall(html):
+        if value.startswith("'"):
+            value = value[1:-1]
+        else:
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        variables.setdefault(name, value)
+
+    pool_id = variables.get("HiveSSOPoolId")
+    client_id = variables.get("HiveSSOPublicCognitoClientId")
+    if not pool_id or not client_id:
+        return None
+    return {"UPID": pool_id, "CLIID": client_id, "REGION": pool_id}
+
+
+class HiveLoginInfoCache:
+    """Process wide cache of the Cognito pool and client discovered from SSO.
+
+    Fresh values are shared by every session in the process and persisted
+    to disk. If discovery fails, the last known values are used instead.
+    """
+
+    def __init__(self, ttl: float = 86400, path: str = None):
+        """Initialise the login information cache."""
+        self.ttl = ttl
+        self.path = path or os.path.join(
+            expanduser("~"), ".pyhiveapi", "login_info.json"
+        )
+        self.data = None
+        self.fetched = 0
+        self.loaded = False
+        self.lock = threading.Lock()
+        self.tasks = {}
+
+    def is_fresh(self):
+        """Check if the cached login information is within its TTL."""
+        return self.data is not None and time.time() - self.fetched < self.ttl
+
+    def load(self):
+        """Load the persisted login information once."""
+        if self.loaded:
+            return
+        self.loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as info_file:
+                stored = json.load(info_file)
+            if self.is_valid(stored["data"]) and stored["fetched"] > self.fetched:
+                self.data = stored["data"]
+                self.fetched = stored["fetched"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def store(self, data: dict):
+        """Cache and persist newly discovered login information."""
+        self.data = data
+        self.fetched = time.time()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as info_file:
+                json.dump({"fetched": self.fetched, "data": data}, info_file)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def is_valid(data: dict):
+        """Check discovered login information has every value needed."""
+        return isinstance(data, dict) and all(data.get(key) for key in LOGIN_INFO_KEYS)
+
+    def result(self, data: dict, error: Exception = None):
+        """Use newly discovered login information or fall back to the last known."""
+        if self.is_valid(data):
+            self.store(data)
+        elif self.data is None:
+            if error is not None:
+                raise error
+            return data
+        return dict(self.data)
+
+    async def get(self, fetch):
+        """Get the login information, discovering it at most once at a time.
+
+        Args:
+            fetch (callable): Coroutine function which discovers the login information.
+        """
+        self.load()
+        if self.is_fresh():
+            return dict(self.data)
+
+        loop = asyncio.get_running_loop()
+        task = self.tasks.get(loop)
+        if task is None:
+            task = loop.create_task(self.discover(fetch))
+            self.tasks[loop] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done() and self.tasks.get(loop) is task:
+                self.tasks.pop(loop)
+
+    async def discover(self, fetch):
+        """Discover the login information."""
+        try:
+            data = await fetch()
+        except Exception as error:  # pylint: disable=broad-except
+            return self.result(None, error)
+        return self.result(data)
+
+    def get_sync(self, fetch):
+        """Get the login information from synchronous code.
+
+        Args:
+            fetch (callable): Function which discovers the login information.
+        """
+        with self.lock:
+            self.load()
+            if self.is_fresh():
+                return dict(self.data)
+            try:
+                data = fetch()
+            except Exception as error:  # pylint: disable=broad-except
+                return self.result(None, error)
+            return self.result(data)
+
+
+LOGIN_INFO = HiveLoginInfoCache()
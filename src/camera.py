@@ -1,6 +1,7 @@
 """Hive Camera Module."""
 
 # pylint: skip-file
+from .helper.hivedataclasses import Device
 
 
 class HiveCamera:
@@ -15,6 +16,14 @@ class HiveCamera:
     async def getCameraTemperature(self, device: dict):
         """Get the camera state.
 
+        Returns:
+            boolean: True/False if camera is on.
+        """
+        return self.readCameraTemperature(device)
+
+    def readCameraTemperature(self, device: dict):
+        """Read the camera state.
+
         Returns:
             boolean: True/False if camera is on.
         """
@@ -24,13 +33,21 @@ class HiveCamera:
             data = self.session.data.devices[device["hiveID"]]
             state = data["props"]["temperature"]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
     async def getCameraState(self, device: dict):
         """Get the camera state.
 
+        Returns:
+            boolean: True/False if camera is on.
+        """
+        return self.readCameraState(device)
+
+    def readCameraState(self, device: dict):
+        """Read the camera state.
+
         Returns:
             boolean: True/False if camera is on.
         """
@@ -40,13 +57,21 @@ class HiveCamera:
             data = self.session.data.devices[device["hiveID"]]
             state = True if data["state"]["mode"] == "ARMED" else False
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
     async def getCameraImageURL(self, device: dict):
         """Get the camera image url.
 
+        Returns:
+            str: image url.
+        """
+        return self.readCameraImageURL(device)
+
+    def readCameraImageURL(self, device: dict):
+        """Read the camera image url.
+
         Returns:
             str: image url.
         """
@@ -57,13 +82,21 @@ class HiveCamera:
                 "thumbnailUrls"
             ][0]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
     async def getCameraRecodringURL(self, device: dict):
         """Get the camera recording url.
 
+        Returns:
+            str: image url.
+        """
+        return self.readCameraRecodringURL(device)
+
+    def readCameraRecodringURL(self, device: dict):
+        """Read the camera recording url.
+
         Returns:
             str: image url.
         """
@@ -72,7 +105,7 @@ class HiveCamera:
         try:
             state = self.session.data.camera[device["hiveID"]]["cameraRecording"]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
@@ -150,37 +183,38 @@ class Camera(HiveCamera):
         device["deviceData"].update(
             {"online": await self.session.attr.onlineOffline(device["device_id"])}
         )
-        dev_data = {}
 
         if device["deviceData"]["online"]:
             self.session.helper.deviceRecovered(device["device_id"])
-            data = self.session.data.devices[device["device_id"]]
-            dev_data = {
-                "hiveID": device["hiveID"],
-                "hiveName": device["hiveName"],
-                "hiveType": device["hiveType"],
-                "haName": device["haName"],
-                "haType": device["haType"],
-                "device_id": device["device_id"],
-                "device_name": device["device_name"],
-                "status": {
-                    "temperature": await self.getCameraTemperature(device),
-                    "state": await self.getCameraState(device),
-                    "imageURL": await self.getCameraImageURL(device),
-                    "recordingURL": await self.getCameraRecodringURL(device),
-                },
-                "deviceData": data.get("props", None),
-                "parentDevice": data.get("parent", None),
-                "custom": device.get("custom", None),
-                "attributes": await self.session.attr.stateAttributes(
-                    device["device_id"], device["hiveType"]
-                ),
-            }
-
-            self.session.devices.update({device["hiveID"]: dev_data})
+            self.session.devices.update({device["hiveID"]: self.readCamera(device)})
             return self.session.devices[device["hiveID"]]
         else:
             await self.session.log.errorCheck(
                 device["device_id"], "ERROR", device["deviceData"]["online"]
             )
             return device
+
+    def readCamera(self, device: dict):
+        """Read camera data.
+
+        Args:
+            device (dict): Online device to read, updated in place if it is a Device.
+
+        Returns:
+            Device: Device data.
+        """
+        data = self.session.data.devices[device["device_id"]]
+        dev_data = Device.reuse(device)
+        dev_data.identify(device)
+        status = dev_data.section("status")
+        status["temperature"] = self.readCameraTemperature(device)
+        status["state"] = self.readCameraState(device)
+        status["imageURL"] = self.readCameraImageURL(device)
+        status["recordingURL"] = self.readCameraRecodringURL(device)
+        dev_data.deviceData = data.get("props", None)
+        dev_data.parentDevice = data.get("parent", None)
+        dev_data.attributes = self.session.attr.readAttributes(
+            device["device_id"], device["hiveType"]
+        )
+
+        return dev_data
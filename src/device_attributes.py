@@ -21,6 +21,18 @@ class HiveAttributes:
     async def stateAttributes(self, n_id: str, _type: str):
         """Get HA State Attributes.
 
+        Args:
+            n_id (str): The id of the device.
+            _type (str): The device type.
+
+        Returns:
+            dict: Set of attributes.
+        """
+        return self.readAttributes(n_id, _type)
+
+    def readAttributes(self, n_id: str, _type: str):
+        """Read HA State Attributes.
+
         Args:
             n_id (str): The id of the device.
             _type (str): The device type.
@@ -31,18 +43,29 @@ class HiveAttributes:
         attr = {}
 
         if n_id in self.session.data.products or n_id in self.session.data.devices:
-            attr.update({"available": (await self.onlineOffline(n_id))})
+            attr.update({"available": self.readOnline(n_id)})
             if n_id in self.session.config.battery:
-                battery = await self.getBattery(n_id)
+                battery = self.readBattery(n_id)
                 if battery is not None:
                     attr.update({"battery": str(battery) + "%"})
             if n_id in self.session.config.mode:
-                attr.update({"mode": (await self.getMode(n_id))})
+                attr.update({"mode": self.readMode(n_id)})
         return attr
 
     async def onlineOffline(self, n_id: str):
         """Check if device is online.
 
+        Args:
+            n_id (str): The id of the device.
+
+        Returns:
+            boolean: True/False if device online.
+        """
+        return self.readOnline(n_id)
+
+    def readOnline(self, n_id: str):
+        """Check if device is online.
+
         Args:
             n_id (str): The id of the device.
 
@@ -55,13 +78,24 @@ class HiveAttributes:
             data = self.session.data.devices[n_id]
             state = data["props"]["online"]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
     async def getMode(self, n_id: str):
         """Get sensor mode.
 
+        Args:
+            n_id (str): The id of the device
+
+        Returns:
+            str: The mode of the device.
+        """
+        return self.readMode(n_id)
+
+    def readMode(self, n_id: str):
+        """Read sensor mode.
+
         Args:
             n_id (str): The id of the device
 
@@ -76,13 +110,24 @@ class HiveAttributes:
             state = data["state"]["mode"]
             final = HIVETOHA[self.type].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getBattery(self, n_id: str):
         """Get device battery level.
 
+        Args:
+            n_id (str): The id of the device.
+
+        Returns:
+            str: Battery level of device.
+        """
+        return self.readBattery(n_id)
+
+    def readBattery(self, n_id: str):
+        """Read device battery level.
+
         Args:
             n_id (str): The id of the device.
 
@@ -96,8 +141,8 @@ class HiveAttributes:
             data = self.session.data.devices[n_id]
             state = data["props"]["battery"]
             final = state
-            await self.session.log.errorCheck(n_id, self.type, state)
+            self.session.log.logErrorCheck(n_id, self.type, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
@@ -2,6 +2,7 @@
 
 # pylint: skip-file
 from .helper.const import HIVETOHA
+from .helper.hivedataclasses import Device
 
 
 class HiveHeating:
@@ -16,6 +17,17 @@ class HiveHeating:
     async def getMinTemperature(self, device: dict):
         """Get heating minimum target temperature.
 
+        Args:
+            device (dict): Device to get min temp for.
+
+        Returns:
+            int: Minimum temperature
+        """
+        return self.readMinTemperature(device)
+
+    def readMinTemperature(self, device: dict):
+        """Read heating minimum target temperature.
+
         Args:
             device (dict): Device to get min temp for.
 
@@ -29,6 +41,17 @@ class HiveHeating:
     async def getMaxTemperature(self, device: dict):
         """Get heating maximum target temperature.
 
+        Args:
+            device (dict): Device to get max temp for.
+
+        Returns:
+            int: Maximum temperature
+        """
+        return self.readMaxTemperature(device)
+
+    def readMaxTemperature(self, device: dict):
+        """Read heating maximum target temperature.
+
         Args:
             device (dict): Device to get max temp for.
 
@@ -42,6 +65,17 @@ class HiveHeating:
     async def getCurrentTemperature(self, device: dict):
         """Get heating current temperature.
 
+        Args:
+            device (dict): Device to get current temperature for.
+
+        Returns:
+            float: current temperature
+        """
+        return self.readCurrentTemperature(device)
+
+    def readCurrentTemperature(self, device: dict):
+        """Read heating current temperature.
+
         Args:
             device (dict): Device to get current temperature for.
 
@@ -93,13 +127,24 @@ class HiveHeating:
             f_state = round(float(state), 1)
             final = f_state
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getTargetTemperature(self, device: dict):
         """Get heating target temperature.
 
+        Args:
+            device (dict): Device to get target temperature for.
+
+        Returns:
+            str: Target temperature.
+        """
+        return self.readTargetTemperature(device)
+
+    def readTargetTemperature(self, device: dict):
+        """Read heating target temperature.
+
         Args:
             device (dict): Device to get target temperature for.
 
@@ -113,13 +158,24 @@ class HiveHeating:
             state = float(data["state"].get("target", None))
             state = float(data["state"].get("heat", state))
         except (KeyError, TypeError) as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
     async def getMode(self, device: dict):
         """Get heating current mode.
 
+        Args:
+            device (dict): Device to get current mode for.
+
+        Returns:
+            str: Current Mode
+        """
+        return self.readMode(device)
+
+    def readMode(self, device: dict):
+        """Read heating current mode.
+
         Args:
             device (dict): Device to get current mode for.
 
@@ -136,13 +192,24 @@ class HiveHeating:
                 state = data["props"]["previous"]["mode"]
             final = HIVETOHA[self.heatingType].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getState(self, device: dict):
         """Get heating current state.
 
+        Args:
+            device (dict): Device to get state for.
+
+        Returns:
+            str: Current state.
+        """
+        return self.readState(device)
+
+    def readState(self, device: dict):
+        """Read heating current state.
+
         Args:
             device (dict): Device to get state for.
 
@@ -153,21 +220,32 @@ class HiveHeating:
         final = None
 
         try:
-            current_temp = await self.getCurrentTemperature(device)
-            target_temp = await self.getTargetTemperature(device)
+            current_temp = self.readCurrentTemperature(device)
+            target_temp = self.readTargetTemperature(device)
             if current_temp < target_temp:
                 state = "ON"
             else:
                 state = "OFF"
             final = HIVETOHA[self.heatingType].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getCurrentOperation(self, device: dict):
         """Get heating current operation.
 
+        Args:
+            device (dict): Device to get current operation for.
+
+        Returns:
+            str: Current operation.
+        """
+        return self.readCurrentOperation(device)
+
+    def readCurrentOperation(self, device: dict):
+        """Read heating current operation.
+
         Args:
             device (dict): Device to get current operation for.
 
@@ -180,13 +258,24 @@ class HiveHeating:
             data = self.session.data.products[device["hiveID"]]
             state = data["props"]["working"]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
     async def getBoostStatus(self, device: dict):
         """Get heating boost current status.
 
+        Args:
+            device (dict): Device to get boost status for.
+
+        Returns:
+            str: Boost status.
+        """
+        return self.readBoostStatus(device)
+
+    def readBoostStatus(self, device: dict):
+        """Read heating boost current status.
+
         Args:
             device (dict): Device to get boost status for.
 
@@ -199,7 +288,7 @@ class HiveHeating:
             data = self.session.data.products[device["hiveID"]]
             state = HIVETOHA["Boost"].get(data["state"].get("boost", False), "ON")
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
@@ -227,6 +316,17 @@ class HiveHeating:
     async def getHeatOnDemand(self, device):
         """Get heat on demand status.
 
+        Args:
+            device ([dictionary]): [Get Heat on Demand status for Thermostat device.]
+
+        Returns:
+            str: [Return True or False for the Heat on Demand status.]
+        """
+        return self.readHeatOnDemand(device)
+
+    def readHeatOnDemand(self, device):
+        """Read heat on demand status.
+
         Args:
             device ([dictionary]): [Get Heat on Demand status for Thermostat device.]
 
@@ -239,7 +339,7 @@ class HiveHeating:
             data = self.session.data.products[device["hiveID"]]
             state = data["props"]["autoBoost"]["active"]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
@@ -271,12 +371,11 @@ class HiveHeating:
         ):
             await self.session.hiveRefreshTokens()
             data = self.session.data.products[device["hiveID"]]
-            resp = await self.session.api.setState(
+            resp = await self.session.writeState(
                 data["type"], device["hiveID"], target=new_temp
             )
 
             if resp["original"] == 200:
-                await self.session.getDevices(device["hiveID"])
                 final = True
 
         return final
@@ -299,12 +398,11 @@ class HiveHeating:
             and device["deviceData"]["online"]
         ):
             data = self.session.data.products[device["hiveID"]]
-            resp = await self.session.api.setState(
+            resp = await self.session.writeState(
                 data["type"], device["hiveID"], mode=new_mode
             )
 
             if resp["original"] == 200:
-                await self.session.getDevices(device["hiveID"])
                 final = True
 
         return final
@@ -330,7 +428,7 @@ class HiveHeating:
                     and device["deviceData"]["online"]
                 ):
                     data = self.session.data.products[device["hiveID"]]
-                    resp = await self.session.api.setState(
+                    resp = await self.session.writeState(
                         data["type"],
                         device["hiveID"],
                         mode="BOOST",
@@ -339,7 +437,6 @@ class HiveHeating:
                     )
 
                     if resp["original"] == 200:
-                        await self.session.getDevices(device["hiveID"])
                         final = True
 
                 return final
@@ -367,18 +464,17 @@ class HiveHeating:
                 prev_mode = data["props"]["previous"]["mode"]
                 if prev_mode == "MANUAL" or prev_mode == "OFF":
                     pre_temp = data["props"]["previous"].get("target", 7)
-                    resp = await self.session.api.setState(
+                    resp = await self.session.writeState(
                         data["type"],
                         device["hiveID"],
                         mode=prev_mode,
                         target=pre_temp,
                     )
                 else:
-                    resp = await self.session.api.setState(
+                    resp = await self.session.writeState(
                         data["type"], device["hiveID"], mode=prev_mode
                     )
                 if resp["original"] == 200:
-                    await self.session.getDevices(device["hiveID"])
                     final = True
 
         return final
@@ -401,12 +497,11 @@ class HiveHeating:
         ):
             data = self.session.data.products[device["hiveID"]]
             await self.session.hiveRefreshTokens()
-            resp = await self.session.api.setState(
+            resp = await self.session.writeState(
                 data["type"], device["hiveID"], autoBoost=state
             )
 
             if resp["original"] == 200:
-                await self.session.getDevices(device["hiveID"])
                 final = True
 
         return final
@@ -441,35 +536,8 @@ class Climate(HiveHeating):
         )
 
         if device["deviceData"]["online"]:
-            dev_data = {}
             self.session.helper.deviceRecovered(device["device_id"])
-            data = self.session.data.devices[device["device_id"]]
-            dev_data = {
-                "hiveID": device["hiveID"],
-                "hiveName": device["hiveName"],
-                "hiveType": device["hiveType"],
-                "haName": device["haName"],
-                "haType": device["haType"],
-                "device_id": device["device_id"],
-                "device_name": device["device_name"],
-                "temperatureunit": device["temperatureunit"],
-                "min_temp": await self.getMinTemperature(device),
-                "max_temp": await self.getMaxTemperature(device),
-                "status": {
-                    "current_temperature": await self.getCurrentTemperature(device),
-                    "target_temperature": await self.getTargetTemperature(device),
-                    "action": await self.getCurrentOperation(device),
-                    "mode": await self.getMode(device),
-                    "boost": await self.getBoostStatus(device),
-                },
-                "deviceData": data.get("props", None),
-                "parentDevice": data.get("parent", None),
-                "custom": device.get("custom", None),
-                "attributes": await self.session.attr.stateAttributes(
-                    device["device_id"], device["hiveType"]
-                ),
-            }
-            self.session.devices.update({device["hiveID"]: dev_data})
+            self.session.devices.update({device["hiveID"]: self.readClimate(device)})
             return self.session.devices[device["hiveID"]]
         else:
             await self.session.log.errorCheck(
@@ -477,6 +545,35 @@ class Climate(HiveHeating):
             )
             return device
 
+    def readClimate(self, device: dict):
+        """Read heating data.
+
+        Args:
+            device (dict): Online device to read, updated in place if it is a Device.
+
+        Returns:
+            Device: Device data.
+        """
+        data = self.session.data.devices[device["device_id"]]
+        dev_data = Device.reuse(device)
+        dev_data.identify(device)
+        dev_data.temperatureunit = device["temperatureunit"]
+        dev_data.min_temp = self.readMinTemperature(device)
+        dev_data.max_temp = self.readMaxTemperature(device)
+        status = dev_data.section("status")
+        status["current_temperature"] = self.readCurrentTemperature(device)
+        status["target_temperature"] = self.readTargetTemperature(device)
+        status["action"] = self.readCurrentOperation(device)
+        status["mode"] = self.readMode(device)
+        status["boost"] = self.readBoostStatus(device)
+        dev_data.deviceData = data.get("props", None)
+        dev_data.parentDevice = data.get("parent", None)
+        dev_data.attributes = self.session.attr.readAttributes(
+            device["device_id"], device["hiveType"]
+        )
+
+        return dev_data
+
     async def getScheduleNowNextLater(self, device: dict):
         """Hive get heating schedule now, next and later.
 
@@ -13,6 +13,7 @@ HTTP_OK = 200
 HTTP_CREATED = 201
 HTTP_ACCEPTED = 202
 HTTP_MOVED_PERMANENTLY = 301
+HTTP_NOT_MODIFIED = 304
 HTTP_BAD_REQUEST = 400
 HTTP_UNAUTHORIZED = 401
 HTTP_FORBIDDEN = 403
@@ -47,6 +48,16 @@ HIVETOHA = {
     "Switch": {"ON": True, "OFF": False},
 }
 
+NUMERIC_STATE_FIELDS = (
+    "boost",
+    "brightness",
+    "colourTemperature",
+    "hue",
+    "saturation",
+    "target",
+    "value",
+)
+
 HIVE_TYPES = {
     "Hub": ["hub", "sense"],
     "Thermo": ["thermostatui", "trv"],
@@ -56,116 +67,308 @@ HIVE_TYPES = {
     "Sensor": ["motionsensor", "contactsensor"],
     "Switch": ["activeplug"],
 }
-sensor_commands = {
-    "SMOKE_CO": "self.session.hub.getSmokeStatus(device)",
-    "DOG_BARK": "self.session.hub.getDogBarkStatus(device)",
-    "GLASS_BREAK": "self.session.hub.getGlassBreakStatus(device)",
-    "Camera_Temp": "self.session.camera.getCameraTemperature(device)",
-    "Current_Temperature": "self.session.heating.getCurrentTemperature(device)",
-    "Heating_Current_Temperature": "self.session.heating.getCurrentTemperature(device)",
-    "Heating_Target_Temperature": "self.session.heating.getTargetTemperature(device)",
-    "Heating_State": "self.session.heating.getState(device)",
-    "Heating_Mode": "self.session.heating.getMode(device)",
-    "Heating_Boost": "self.session.heating.getBoostStatus(device)",
-    "Hotwater_State": "self.session.hotwater.getState(device)",
-    "Hotwater_Mode": "self.session.hotwater.getMode(device)",
-    "Hotwater_Boost": "self.session.hotwater.getBoost(device)",
-    "Battery": 'self.session.attr.getBattery(device["device_id"])',
-    "Mode": 'self.session.attr.getMode(device["hiveID"])',
-    "Availability": "self.online(device)",
-    "Connectivity": "self.online(device)",
-    "Power": "self.session.switch.getPowerUsage(device)",
+sensor_readers = {
+    "SMOKE_CO": ("hub", "readSmokeStatus"),
+    "DOG_BARK": ("hub", "readDogBarkStatus"),
+    "GLASS_BREAK": ("hub", "readGlassBreakStatus"),
+    "Camera_Temp": ("camera", "readCameraTemperature"),
+    "Current_Temperature": ("heating", "readCurrentTemperature"),
+    "Heating_Current_Temperature": ("heating", "readCurrentTemperature"),
+    "Heating_Target_Temperature": ("heating", "readTargetTemperature"),
+    "Heating_State": ("heating", "readState"),
+    "Heating_Mode": ("heating", "readMode"),
+    "Heating_Boost": ("heating", "readBoostStatus"),
+    "Hotwater_State": ("hotwater", "readState"),
+    "Hotwater_Mode": ("hotwater", "readMode"),
+    "Hotwater_Boost": ("hotwater", "readBoost"),
+    "Battery": ("attr", "readBattery", "device_id"),
+    "Mode": ("attr", "readMode", "hiveID"),
+    "Availability": (None, "readOnline"),
+    "Connectivity": (None, "readOnline"),
+    "Power": ("switch", "readPowerUsage"),
+}
+entity_readers = {
+    "alarm_control_panel": ("alarm", "readAlarm"),
+    "binary_sensor": ("sensor", "readSensor"),
+    "camera": ("camera", "readCamera"),
+    "climate": ("heating", "readClimate"),
+    "light": ("light", "readLight"),
+    "sensor": ("sensor", "readSensor"),
+    "switch": ("switch", "readSwitch"),
+    "water_heater": ("hotwater", "readWaterHeater"),
 }
 
+# Entities are (entity type, arguments) pairs passed to HiveSession.addList.
+# Tuple arguments are looked up when the entity is created, starting from
+# either the node ("node") or an attribute of the session (e.g. "data").
 PRODUCTS = {
     "sense": [
-        'addList("binary_sensor", p, haName="Glass Detection", hiveType="GLASS_BREAK")',
-        'addList("binary_sensor", p, haName="Smoke Detection", hiveType="SMOKE_CO")',
-        'addList("binary_sensor", p, haName="Dog Bark Detection", hiveType="DOG_BARK")',
+        ("binary_sensor", {"haName": "Glass Detection", "hiveType": "GLASS_BREAK"}),
+        ("binary_sensor", {"haName": "Smoke Detection", "hiveType": "SMOKE_CO"}),
+        ("binary_sensor", {"haName": "Dog Bark Detection", "hiveType": "DOG_BARK"}),
     ],
     "heating": [
-        'addList("climate", p, temperatureunit=self.data["user"]["temperatureUnit"])',
-        'addList("switch", p, haName=" Heat on Demand", hiveType="Heating_Heat_On_Demand", category="config")',
-        'addList("sensor", p, haName=" Current Temperature", hiveType="Heating_Current_Temperature", category="diagnostic")',
-        'addList("sensor", p, haName=" Target Temperature", hiveType="Heating_Target_Temperature", category="diagnostic")',
-        'addList("sensor", p, haName=" State", hiveType="Heating_State", category="diagnostic")',
-        'addList("sensor", p, haName=" Mode", hiveType="Heating_Mode", category="diagnostic")',
-        'addList("sensor", p, haName=" Boost", hiveType="Heating_Boost", category="diagnostic")',
+        ("climate", {"temperatureunit": ("data", "user", "temperatureUnit")}),
+        (
+            "switch",
+            {
+                "haName": " Heat on Demand",
+                "hiveType": "Heating_Heat_On_Demand",
+                "category": "config",
+            },
+        ),
+        (
+            "sensor",
+            {
+                "haName": " Current Temperature",
+                "hiveType": "Heating_Current_Temperature",
+                "category": "diagnostic",
+            },
+        ),
+        (
+            "sensor",
+            {
+                "haName": " Target Temperature",
+                "hiveType": "Heating_Target_Temperature",
+                "category": "diagnostic",
+            },
+        ),
+        (
+            "sensor",
+            {"haName": " State", "hiveType": "Heating_State", "category": "diagnostic"},
+        ),
+        (
+            "sensor",
+            {"haName": " Mode", "hiveType": "Heating_Mode", "category": "diagnostic"},
+        ),
+        (
+            "sensor",
+            {"haName": " Boost", "hiveType": "Heating_Boost", "category": "diagnostic"},
+        ),
     ],
     "trvcontrol": [
-        'addList("climate", p, temperatureunit=self.data["user"]["temperatureUnit"])',
-        'addList("sensor", p, haName=" Current Temperature", hiveType="Heating_Current_Temperature", category="diagnostic")',
-        'addList("sensor", p, haName=" Target Temperature", hiveType="Heating_Target_Temperature", category="diagnostic")',
-        'addList("sensor", p, haName=" State", hiveType="Heating_State", category="diagnostic")',
-        'addList("sensor", p, haName=" Mode", hiveType="Heating_Mode", category="diagnostic")',
-        'addList("sensor", p, haName=" Boost", hiveType="Heating_Boost", category="diagnostic")',
+        ("climate", {"temperatureunit": ("data", "user", "temperatureUnit")}),
+        (
+            "sensor",
+            {
+                "haName": " Current Temperature",
+                "hiveType": "Heating_Current_Temperature",
+                "category": "diagnostic",
+            },
+        ),
+        (
+            "sensor",
+            {
+                "haName": " Target Temperature",
+                "hiveType": "Heating_Target_Temperature",
+                "category": "diagnostic",
+            },
+        ),
+        (
+            "sensor",
+            {"haName": " State", "hiveType": "Heating_State", "category": "diagnostic"},
+        ),
+        (
+            "sensor",
+            {"haName": " Mode", "hiveType": "Heating_Mode", "category": "diagnostic"},
+        ),
+        (
+            "sensor",
+            {"haName": " Boost", "hiveType": "Heating_Boost", "category": "diagnostic"},
+        ),
     ],
     "hotwater": [
-        'addList("water_heater", p,)',
-        'addList("sensor", p, haName="Hotwater State", hiveType="Hotwater_State", category="diagnostic")',
-        'addList("sensor", p, haName="Hotwater Mode", hiveType="Hotwater_Mode", category="diagnostic")',
-        'addList("sensor", p, haName="Hotwater Boost", hiveType="Hotwater_Boost", category="diagnostic")',
+        ("water_heater", {}),
+        (
+            "sensor",
+            {
+                "haName": "Hotwater State",
+                "hiveType": "Hotwater_State",
+                "category": "diagnostic",
+            },
+        ),
+        (
+            "sensor",
+            {
+                "haName": "Hotwater Mode",
+                "hiveType": "Hotwater_Mode",
+                "category": "diagnostic",
+            },
+        ),
+        (
+            "sensor",
+            {
+                "haName": "Hotwater Boost",
+                "hiveType": "Hotwater_Boost",
+                "category": "diagnostic",
+            },
+        ),
     ],
     "activeplug": [
-        'addList("switch", p)',
-        'addList("sensor", p, haName=" Mode", hiveType="Mode", category="diagnostic")',
-        'addList("sensor", p, haName=" Availability", hiveType="Availability", category="diagnostic")',
-        'addList("sensor", p, haName=" Power", hiveType="Power", category="diagnostic")',
+        ("switch", {}),
+        ("sensor", {"haName": " Mode", "hiveType": "Mode", "category": "diagnostic"}),
+        (
+            "sensor",
+            {
+                "haName": " Availability",
+                "hiveType": "Availability",
+                "category": "diagnostic",
+            },
+        ),
+        ("sensor", {"haName": " Power", "hiveType": "Power", "category": "diagnostic"}),
     ],
     "warmwhitelight": [
-        'addList("light", p)',
-        'addList("sensor", p, haName=" Mode", hiveType="Mode", category="diagnostic")',
-        'addList("sensor", p, haName=" Availability", hiveType="Availability", category="diagnostic")',
+        ("light", {}),
+        ("sensor", {"haName": " Mode", "hiveType": "Mode", "category": "diagnostic"}),
+        (
+            "sensor",
+            {
+                "haName": " Availability",
+                "hiveType": "Availability",
+                "category": "diagnostic",
+            },
+        ),
     ],
     "tuneablelight": [
-        'addList("light", p)',
-        'addList("sensor", p, haName=" Mode", hiveType="Mode", category="diagnostic")',
-        'addList("sensor", p, haName=" Availability", hiveType="Availability", category="diagnostic")',
+        ("light", {}),
+        ("sensor", {"haName": " Mode", "hiveType": "Mode", "category": "diagnostic"}),
+        (
+            "sensor",
+            {
+                "haName": " Availability",
+                "hiveType": "Availability",
+                "category": "diagnostic",
+            },
+        ),
     ],
     "colourtuneablelight": [
-        'addList("light", p)',
-        'addList("sensor", p, haName=" Mode", hiveType="Mode", category="diagnostic")',
-        'addList("sensor", p, haName=" Availability", hiveType="Availability", category="diagnostic")',
+        ("light", {}),
+        ("sensor", {"haName": " Mode", "hiveType": "Mode", "category": "diagnostic"}),
+        (
+            "sensor",
+            {
+                "haName": " Availability",
+                "hiveType": "Availability",
+                "category": "diagnostic",
+            },
+        ),
     ],
     #    "hivecamera": [
-    #        'addList("camera", p)',
-    #        'addList("sensor", p, haName=" Mode", hiveType="Mode", category="diagnostic")',
-    #        'addList("sensor", p, haName=" Availability", hiveType="Availability", category="diagnostic")',
-    #        'addList("sensor", p, haName=" Temperature", hiveType="Camera_Temp", category="diagnostic")',
+    #        ("camera", {}),
+    #        ("sensor", {"haName": " Mode", "hiveType": "Mode", "category": "diagnostic"}),
+    #        ("sensor", {"haName": " Availability", "hiveType": "Availability", "category": "diagnostic"}),
+    #        ("sensor", {"haName": " Temperature", "hiveType": "Camera_Temp", "category": "diagnostic"}),
     #    ],
     "motionsensor": [
-        'addList("binary_sensor", p)',
-        'addList("sensor", p, haName=" Current Temperature", hiveType="Current_Temperature", category="diagnostic")',
+        ("binary_sensor", {}),
+        (
+            "sensor",
+            {
+                "haName": " Current Temperature",
+                "hiveType": "Current_Temperature",
+                "category": "diagnostic",
+            },
+        ),
     ],
-    "contactsensor": ['addList("binary_sensor", p)'],
+    "contactsensor": [("binary_sensor", {})],
 }
 
 DEVICES = {
     "contactsensor": [
-        'addList("sensor", d, haName=" Battery Level", hiveType="Battery", category="diagnostic")',
-        'addList("sensor", d, haName=" Availability", hiveType="Availability", category="diagnostic")',
+        (
+            "sensor",
+            {
+                "haName": " Battery Level",
+                "hiveType": "Battery",
+                "category": "diagnostic",
+            },
+        ),
+        (
+            "sensor",
+            {
+                "haName": " Availability",
+                "hiveType": "Availability",
+                "category": "diagnostic",
+            },
+        ),
     ],
     "hub": [
-        'addList("binary_sensor", d, haName="Hive Hub Status", hiveType="Connectivity", category="diagnostic")',
+        (
+            "binary_sensor",
+            {
+                "haName": "Hive Hub Status",
+                "hiveType": "Connectivity",
+                "category": "diagnostic",
+            },
+        ),
     ],
     "motionsensor": [
-        'addList("sensor", d, haName=" Battery Level", hiveType="Battery", category="diagnostic")',
-        'addList("sensor", d, haName=" Availability", hiveType="Availability", category="diagnostic")',
+        (
+            "sensor",
+            {
+                "haName": " Battery Level",
+                "hiveType": "Battery",
+                "category": "diagnostic",
+            },
+        ),
+        (
+            "sensor",
+            {
+                "haName": " Availability",
+                "hiveType": "Availability",
+                "category": "diagnostic",
+            },
+        ),
     ],
     "sense": [
-        'addList("binary_sensor", d, haName="Hive Hub Status", hiveType="Connectivity")',
+        ("binary_sensor", {"haName": "Hive Hub Status", "hiveType": "Connectivity"}),
     ],
-    "siren": ['addList("alarm_control_panel", d)'],
+    "siren": [("alarm_control_panel", {})],
     "thermostatui": [
-        'addList("sensor", d, haName=" Battery Level", hiveType="Battery", category="diagnostic")',
-        'addList("sensor", d, haName=" Availability", hiveType="Availability", category="diagnostic")',
+        (
+            "sensor",
+            {
+                "haName": " Battery Level",
+                "hiveType": "Battery",
+                "category": "diagnostic",
+            },
+        ),
+        (
+            "sensor",
+            {
+                "haName": " Availability",
+                "hiveType": "Availability",
+                "category": "diagnostic",
+            },
+        ),
     ],
     "trv": [
-        'addList("sensor", d, haName=" Battery Level", hiveType="Battery", category="diagnostic")',
-        'addList("sensor", d, haName=" Availability", hiveType="Availability", category="diagnostic")',
+        (
+            "sensor",
+            {
+                "haName": " Battery Level",
+                "hiveType": "Battery",
+                "category": "diagnostic",
+            },
+        ),
+        (
+            "sensor",
+            {
+                "haName": " Availability",
+                "hiveType": "Availability",
+                "category": "diagnostic",
+            },
+        ),
     ],
 }
 
-ACTIONS = (
-    'addList("switch", a, hiveName=a["name"], haName=a["name"], hiveType="action")'
-)
+ACTIONS = [
+    (
+        "switch",
+        {
+            "hiveName": ("node", "name"),
+            "haName": ("node", "name"),
+            "hiveType": "action",
+        },
+    ),
+]
@@ -0,0 +1,78 @@
+"""Precompiled entity factory for pyhiveapi."""
+
+# pylint: skip-file
+from operator import attrgetter, itemgetter
+
+from .const import ACTIONS, DEVICES, PRODUCTS, entity_readers, sensor_readers
+
+
+def compileArgument(spec: any):
+    """Compile an entity argument into a getter.
+
+    Args:
+        spec (any): A fixed value or a tuple path to look up.
+
+    Returns:
+        callable: Function taking the session and node which returns the value.
+    """
+    if not isinstance(spec, tuple):
+        return lambda session, node: spec
+
+    root, *keys = spec
+
+    def getArgument(session: object, node: dict):
+        value = node if root == "node" else getattr(session, root)
+        for key in keys:
+            value = value[key]
+        return value
+
+    return getArgument
+
+
+def compileEntities(entities: list):
+    """Compile a list of entity definitions.
+
+    Args:
+        entities (list): Entity type and arguments pairs.
+
+    Returns:
+        tuple: Entity type, fixed arguments and argument getters for each entity.
+    """
+    compiled = []
+    for entityType, arguments in entities:
+        fixed = {k: v for k, v in arguments.items() if not isinstance(v, tuple)}
+        lookups = tuple(
+            (k, compileArgument(v))
+            for k, v in arguments.items()
+            if isinstance(v, tuple)
+        )
+        compiled.append((entityType, fixed, lookups))
+
+    return tuple(compiled)
+
+
+def compileSensorReader(reader: tuple):
+    """Compile a sensor reader into a callable.
+
+    Args:
+        reader (tuple): Session component, method name and optional device key.
+
+    Returns:
+        callable: Function taking the sensor and device which returns the state.
+    """
+    component, method, *key = reader
+    getMethod = attrgetter(
+        method if component is None else f"session.{component}.{method}"
+    )
+
+    if key:
+        getKey = itemgetter(key[0])
+        return lambda sensor, device: getMethod(sensor)(getKey(device))
+    return lambda sensor, device: getMethod(sensor)(device)
+
+
+PRODUCT_ENTITIES = {k: compileEntities(v) for k, v in PRODUCTS.items()}
+DEVICE_ENTITIES = {k: compileEntities(v) for k, v in DEVICES.items()}
+ACTION_ENTITIES = compileEntities(ACTIONS)
+SENSOR_READERS = {k: compileSensorReader(v) for k, v in sensor_readers.items()}
+ENTITY_READERS = {k: attrgetter(".".join(v)) for k, v in entity_readers.items()}
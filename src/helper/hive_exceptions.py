@@ -89,3 +89,11 @@ class HiveFailedToRefreshTokens(Exception):
     Args:
         Exception (object): Exception object to invoke
     """
+
+
+class HiveApiUnavailable(HiveApiError):
+    """Api unavailable, requests are shed while its circuit breaker is open.
+
+    Args:
+        HiveApiError (object): Exception object to invoke
+    """
@@ -2,9 +2,11 @@
 
 # pylint: skip-file
 import datetime
-import operator
 
 from .const import HIVE_TYPES
+from .hive_schedule import HiveSchedule
+
+SCHEDULE_CACHE_SIZE = 100
 
 
 class HiveHelper:
@@ -17,6 +19,38 @@ class HiveHelper:
             session (object, optional): Interact with hive account. Defaults to None.
         """
         self.session = session
+        self.names = None
+        self.zoneThermostats = None
+        self.trvDevices = None
+        self.schedules = {}
+
+    def buildIndexes(self):
+        """Index the names, zone thermostats and TRVs of the nodes."""
+        self.names = {}
+        self.zoneThermostats = {}
+        for aDevice in self.session.data.devices.values():
+            name = aDevice.get("state", {}).get("name")
+            if name:
+                self.names[aDevice["id"]] = name
+            if aDevice["type"] in HIVE_TYPES["Thermo"]:
+                zone = aDevice.get("props", {}).get("zone")
+                if zone is not None:
+                    self.zoneThermostats[zone] = aDevice
+
+        self.trvDevices = {}
+        for aProduct in self.session.data.products.values():
+            name = aProduct.get("state", {}).get("name")
+            if name:
+                self.names[aProduct["id"]] = name
+            if aProduct["type"] == "trvcontrol":
+                trvs = aProduct.get("props", {}).get("trvs", [])
+                if trvs and trvs[0] in self.session.data.devices:
+                    self.trvDevices[aProduct["id"]] = self.session.data.devices[trvs[0]]
+
+    def getIndexes(self):
+        """Build the node indexes if they have not been built yet."""
+        if self.names is None:
+            self.buildIndexes()
 
     def getDeviceName(self, n_id: str):
         """Resolve a id into a name.
@@ -27,20 +61,9 @@ class HiveHelper:
         Returns:
             str: Name of device.
         """
-        try:
-            product_name = self.session.data.products[n_id]["state"]["name"]
-        except KeyError:
-            product_name = False
-
-        try:
-            device_name = self.session.data.devices[n_id]["state"]["name"]
-        except KeyError:
-            device_name = False
-
-        if product_name:
-            return product_name
-        elif device_name:
-            return device_name
+        self.getIndexes()
+        if n_id in self.names:
+            return self.names[n_id]
         elif n_id == "No_ID":
             return "Hive"
         else:
@@ -84,23 +107,12 @@ class HiveHelper:
         """
         device = product
         type = product["type"]
+        self.getIndexes()
         if type in ("heating", "hotwater"):
-            for aDevice in self.session.data.devices:
-                if self.session.data.devices[aDevice]["type"] in HIVE_TYPES["Thermo"]:
-                    try:
-                        if (
-                            product["props"]["zone"]
-                            == self.session.data.devices[aDevice]["props"]["zone"]
-                        ):
-                            device = self.session.data.devices[aDevice]
-                    except KeyError:
-                        pass
+            zone = product.get("props", {}).get("zone")
+            device = self.zoneThermostats.get(zone, product)
         elif type == "trvcontrol":
-            trv_present = len(product["props"]["trvs"]) > 0
-            if trv_present:
-                device = self.session.data.devices[product["props"]["trvs"][0]]
-            else:
-                raise KeyError
+            device = self.trvDevices[product["id"]]
         elif type == "warmwhitelight" and product["props"]["model"] == "SIREN001":
             device = self.session.data.devices[product["parent"]]
         elif type == "sense":
@@ -110,6 +122,32 @@ class HiveHelper:
 
         return device
 
+    @staticmethod
+    def diffNode(old: dict, new: dict, path: str = ""):
+        """Get the fields which differ between two versions of a node.
+
+        Args:
+            old (dict): Previous node data.
+            new (dict): Latest node data.
+            path (str, optional): Path of the data being compared. Defaults to "".
+
+        Returns:
+            dict: Changed field paths mapped to their old and new values.
+        """
+        changes = {}
+        for key in old.keys() | new.keys():
+            old_value = old.get(key)
+            new_value = new.get(key)
+            if old_value == new_value:
+                continue
+            field_path = f"{path}.{key}" if path else str(key)
+            if isinstance(old_value, dict) and isinstance(new_value, dict):
+                changes.update(HiveHelper.diffNode(old_value, new_value, field_path))
+            else:
+                changes[field_path] = (old_value, new_value)
+
+        return changes
+
     def convertMinutesToTime(self, minutes_to_convert: str):
         """Convert minutes string to datetime.
 
@@ -135,70 +173,14 @@ class HiveHelper:
         Returns:
             dict: Now, Next and later values.
         """
-        schedule_now_and_next = {}
-        date_time_now = datetime.datetime.now()
-        date_time_now_day_int = date_time_now.today().weekday()
-
-        days_t = (
-            "monday",
-            "tuesday",
-            "wednesday",
-            "thursday",
-            "friday",
-            "saturday",
-            "sunday",
-        )
-
-        days_rolling_list = list(days_t[date_time_now_day_int:] + days_t)[:7]
-
-        full_schedule_list = []
-
-        for day_index in range(0, len(days_rolling_list)):
-            current_day_schedule = hive_api_schedule[days_rolling_list[day_index]]
-            current_day_schedule_sorted = sorted(
-                current_day_schedule,
-                key=operator.itemgetter("start"),
-                reverse=False,
-            )
-
-            for current_slot in range(0, len(current_day_schedule_sorted)):
-                current_slot_custom = current_day_schedule_sorted[current_slot]
-
-                slot_date = datetime.datetime.now() + datetime.timedelta(days=day_index)
-                slot_time = self.convertMinutesToTime(current_slot_custom["start"])
-                slot_time_date_s = slot_date.strftime("%d-%m-%Y") + " " + slot_time
-                slot_time_date_dt = datetime.datetime.strptime(
-                    slot_time_date_s, "%d-%m-%Y %H:%M"
-                )
-                if slot_time_date_dt <= date_time_now:
-                    slot_time_date_dt = slot_time_date_dt + datetime.timedelta(days=7)
-
-                current_slot_custom["Start_DateTime"] = slot_time_date_dt
-                full_schedule_list.append(current_slot_custom)
-
-        fsl_sorted = sorted(
-            full_schedule_list,
-            key=operator.itemgetter("Start_DateTime"),
-            reverse=False,
-        )
-
-        schedule_now = fsl_sorted[-1]
-        schedule_next = fsl_sorted[0]
-        schedule_later = fsl_sorted[1]
-
-        schedule_now["Start_DateTime"] = schedule_now[
-            "Start_DateTime"
-        ] - datetime.timedelta(days=7)
-
-        schedule_now["End_DateTime"] = schedule_next["Start_DateTime"]
-        schedule_next["End_DateTime"] = schedule_later["Start_DateTime"]
-        schedule_later["End_DateTime"] = fsl_sorted[2]["Start_DateTime"]
-
-        schedule_now_and_next["now"] = schedule_now
-        schedule_now_and_next["next"] = schedule_next
-        schedule_now_and_next["later"] = schedule_later
-
-        return schedule_now_and_next
+        schedule = self.schedules.get(id(hive_api_schedule))
+        if schedule is None or schedule.source is not hive_api_schedule:
+            if len(self.schedules) >= SCHEDULE_CACHE_SIZE:
+                self.schedules.clear()
+            schedule = HiveSchedule(hive_api_schedule)
+            self.schedules[id(hive_api_schedule)] = schedule
+
+        return schedule.nowNextLater(datetime.datetime.now())
 
     def getHeatOnDemandDevice(self, device: dict):
         """Use TRV device to get the linked thermostat device.
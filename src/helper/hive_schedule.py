@@ -0,0 +1,101 @@
+"""Weekly schedule engine for pyhiveapi."""
+
+# pylint: skip-file
+import copy
+import datetime
+import operator
+from bisect import bisect_right
+
+from .hive_time import startOfWeek
+
+DAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+
+class HiveSchedule:
+    """Weekly schedule compiled into slot start times.
+
+    Slot starts are held as seconds from the start of the week, so the
+    current slot is found with a binary search. The result is reused
+    until the next slot starts.
+
+    Returns:
+        object: Compiled schedule object.
+    """
+
+    def __init__(self, schedule: dict):
+        """Compile a weekly schedule.
+
+        Args:
+            schedule (dict): Schedule slots keyed by day name.
+        """
+        slots = []
+        for day_index, day in enumerate(DAYS):
+            for slot in sorted(schedule[day], key=operator.itemgetter("start")):
+                slots.append(((day_index * 1440 + slot["start"]) * 60, slot))
+        slots.sort(key=operator.itemgetter(0))
+
+        self.source = schedule
+        self.starts = [start for start, _ in slots]
+        self.slots = [slot for _, slot in slots]
+        self.cached = None
+        self.validFrom = None
+        self.validUntil = None
+
+    def occurrence(self, week_start: datetime.datetime, position: int):
+        """Get a slot and when it starts, counting slots from a week start.
+
+        Args:
+            week_start (datetime): Start of the week to count from.
+            position (int): Number of slots after the start of the week.
+
+        Returns:
+            tuple: Start time of the slot and the slot.
+        """
+        week, index = divmod(position, len(self.slots))
+        start = week_start + datetime.timedelta(weeks=week, seconds=self.starts[index])
+        return start, self.slots[index]
+
+    def nowNextLater(self, now: datetime.datetime):
+        """Get the now, next and later slots of the schedule.
+
+        A slot which starts at the current minute counts as the current slot.
+        The result is a copy, so callers can change it without changing the
+        cached slots.
+
+        Args:
+            now (datetime): Time to get the slots for.
+
+        Raises:
+            IndexError: The schedule has no slots.
+
+        Returns:
+            dict: Now, next and later slots with their start and end times.
+        """
+        if self.cached is not None and self.validFrom <= now < self.validUntil:
+            return copy.deepcopy(self.cached)
+        if not self.slots:
+            raise IndexError("Schedule has no slots")
+
+        week_start = startOfWeek(now)
+        position = bisect_right(self.starts, (now - week_start).total_seconds())
+        occurrences = [
+            self.occurrence(week_start, position + offset) for offset in (-1, 0, 1, 2)
+        ]
+
+        self.cached = {
+            name: {**slot, "Start_DateTime": start, "End_DateTime": end}
+            for name, (start, slot), (end, _) in zip(
+                ("now", "next", "later"), occurrences, occurrences[1:]
+            )
+        }
+        self.validFrom = occurrences[0][0]
+        self.validUntil = occurrences[1][0]
+        return copy.deepcopy(self.cached)
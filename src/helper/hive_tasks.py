@@ -0,0 +1,186 @@
+"""Task helpers shared by the async and sync packages.
+
+This module is built into pyhiveapi without replacing asyncio with
+threading (see setup.py) and has no coroutines for unasync to rewrite, so
+both packages run the same code. Inside an event loop the helpers use
+asyncio, otherwise, which is always the case for pyhiveapi, they do the
+work directly or in a background thread.
+"""
+
+# pylint: skip-file
+import asyncio
+import threading
+import time
+
+
+class HiveTaskStopped(BaseException):
+    """Raised in a background thread which has been asked to stop."""
+
+
+def inEventLoop():
+    """Check if the caller is running in an event loop.
+
+    Returns:
+        boolean: True/False if there is a running event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def createFuture():
+    """Create a future for a result which is set later.
+
+    Returns:
+        asyncio.Future: Future bound to the running event loop.
+    """
+    return asyncio.get_running_loop().create_future()
+
+
+def shield(awaitable: any):
+    """Protect a shared result from the cancellation of one waiter.
+
+    Args:
+        awaitable (any): Task or future which is being waited on.
+
+    Returns:
+        asyncio.Future: Future to await.
+    """
+    return asyncio.shield(awaitable)
+
+
+def sharedCall(owner: object, name: str, func: callable, *args):
+    """Share one call of a function between concurrent callers.
+
+    The task of a running call is kept on the owner as the named attribute
+    and func is responsible for setting it back to None when it finishes.
+
+    Args:
+        owner (object): Object which keeps the running task.
+        name (str): Attribute of the owner which holds the task.
+        func (callable): Function to call.
+
+    Returns:
+        any: Awaitable shared result, or the result itself when func is not a coroutine function.
+    """
+    task = getattr(owner, name)
+    if task is None:
+        result = func(*args)
+        if not asyncio.iscoroutine(result):
+            return result
+        task = asyncio.ensure_future(result)
+        setattr(owner, name, task)
+    return asyncio.shield(task)
+
+
+def gatherCalls(func: callable, items: any):
+    """Call a function for each item, collecting the results and errors.
+
+    Args:
+        func (callable): Function to call with each item.
+        items (any): Items to call the function with.
+
+    Returns:
+        any: Awaitable list of results in an event loop, otherwise the list of results.
+    """
+    if inEventLoop():
+        return asyncio.gather(*(func(item) for item in items), return_exceptions=True)
+
+    results = []
+    for item in items:
+        try:
+            results.append(func(item))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def runBlocking(func: callable, *args):
+    """Run blocking work without holding up the event loop.
+
+    Args:
+        func (callable): Blocking function to call.
+
+    Returns:
+        any: Awaitable result in an event loop, otherwise the result.
+    """
+    if inEventLoop():
+        return asyncio.get_running_loop().run_in_executor(None, func, *args)
+    return func(*args)
+
+
+def startTask(func: callable, *args):
+    """Run a function in the background.
+
+    Args:
+        func (callable): Function to run.
+
+    Returns:
+        any: asyncio task in an event loop, otherwise a daemon thread.
+    """
+    if inEventLoop():
+        return asyncio.ensure_future(func(*args))
+
+    thread = threading.Thread(target=runThread, args=(func, *args), daemon=True)
+    thread.stopEvent = threading.Event()
+    thread.start()
+    return thread
+
+
+def runThread(func: callable, *args):
+    """Run a function in a background thread until it finishes or is stopped.
+
+    Args:
+        func (callable): Function to run.
+    """
+    try:
+        func(*args)
+    except HiveTaskStopped:
+        pass
+
+
+def stopTask(task: any):
+    """Stop a function started with startTask.
+
+    Args:
+        task (any): Task or thread returned by startTask.
+
+    Returns:
+        any: Awaitable which finishes once the task has stopped, or None once the thread has stopped.
+    """
+    if isinstance(task, threading.Thread):
+        task.stopEvent.set()
+        if task is not threading.current_thread():
+            task.join()
+        return None
+
+    task.cancel()
+    return asyncio.gather(task, return_exceptions=True)
+
+
+def sleep(delay: float):
+    """Wait for a delay.
+
+    Background threads started with startTask stop waiting as soon as they
+    are stopped.
+
+    Args:
+        delay (float): Seconds to wait.
+
+    Raises:
+        HiveTaskStopped: The background thread has been stopped.
+
+    Returns:
+        any: Awaitable in an event loop, otherwise None once the delay has passed.
+    """
+    if inEventLoop():
+        return asyncio.sleep(delay)
+
+    stopEvent = getattr(threading.current_thread(), "stopEvent", None)
+    if stopEvent is None:
+        time.sleep(delay)
+    elif stopEvent.wait(delay):
+        raise HiveTaskStopped
+    return None
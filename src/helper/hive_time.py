@@ -0,0 +1,20 @@
+"""Time helpers for pyhiveapi."""
+
+# pylint: skip-file
+import datetime
+
+
+def startOfWeek(now: datetime.datetime):
+    """Get midnight at the start of the week containing a time.
+
+    The week is counted in wall clock time, so a week with a daylight saving
+    change still starts at midnight and schedule slots keep their local times.
+
+    Args:
+        now (datetime): Time within the week.
+
+    Returns:
+        datetime: Midnight on the Monday of the week, in the same timezone.
+    """
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0, fold=0)
+    return midnight - datetime.timedelta(days=now.weekday())
@@ -2,21 +2,141 @@
 
 # pylint: skip-file
 
-from dataclasses import dataclass
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field, fields
+
+UNSET = object()
+
+
+@dataclass(eq=False, slots=True)
+class Device(MutableMapping):
+    """Class for keeping track of an device.
+
+    The entity readers fill the fields of a device in place each time it is
+    read again, and the device reads as the dict of entity data it replaces.
+    Fields which have not been set are missing keys.
+    """
+
+    hiveID: str = UNSET
+    hiveName: str = UNSET
+    hiveType: str = UNSET
+    haName: str = UNSET
+    haType: str = UNSET
+    device_id: str = UNSET
+    device_name: str = UNSET
+    temperatureunit: str = UNSET
+    min_temp: float = UNSET
+    max_temp: float = UNSET
+    min_mireds: int = UNSET
+    max_mireds: int = UNSET
+    status: dict = UNSET
+    deviceData: dict = UNSET
+    parentDevice: str = UNSET
+    custom: str = UNSET
+    attributes: dict = UNSET
+    extra: dict = None
+
+    @classmethod
+    def reuse(cls, device: object):
+        """Get the device to fill for an entity being read.
+
+        Args:
+            device (object): Entity being read, a Device from an earlier read or a plain dict.
+
+        Returns:
+            Device: The earlier device, or a new one for a plain dict.
+        """
+        return device if isinstance(device, cls) else cls()
+
+    def identify(self, device: dict):
+        """Copy the names and ids of an entity.
+
+        Args:
+            device (dict): Entity being read.
+        """
+        if device is self:
+            return
+        self.hiveID = device["hiveID"]
+        self.hiveName = device["hiveName"]
+        self.hiveType = device["hiveType"]
+        self.haName = device["haName"]
+        self.haType = device["haType"]
+        self.device_id = device["device_id"]
+        self.device_name = device["device_name"]
+        self.custom = device.get("custom", None)
+
+    def section(self, name: str):
+        """Get a nested dict of the device emptied to be filled again.
+
+        Args:
+            name (str): Field holding the dict.
+
+        Returns:
+            dict: Empty dict stored in the field.
+        """
+        value = getattr(self, name)
+        if value is UNSET:
+            value = {}
+            setattr(self, name, value)
+        else:
+            value.clear()
+        return value
+
+    def __getitem__(self, key: str):
+        """Get an entity data value."""
+        if key in DEVICE_FIELDS:
+            value = getattr(self, key)
+            if value is UNSET:
+                raise KeyError(key)
+            return value
+        if self.extra is None:
+            raise KeyError(key)
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: any):
+        """Set an entity data value."""
+        if key in DEVICE_FIELDS:
+            setattr(self, key, value)
+        elif self.extra is None:
+            self.extra = {key: value}
+        else:
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        """Remove an entity data value."""
+        if key in DEVICE_FIELDS:
+            if getattr(self, key) is UNSET:
+                raise KeyError(key)
+            setattr(self, key, UNSET)
+        elif self.extra is None:
+            raise KeyError(key)
+        else:
+            del self.extra[key]
+
+    def __iter__(self):
+        """Iterate over the entity data keys which are set."""
+        for key in DEVICE_FIELDS:
+            if getattr(self, key) is not UNSET:
+                yield key
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        """Get the number of entity data values which are set."""
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        """Represent the device as its entity data."""
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+DEVICE_FIELDS = dict.fromkeys(f.name for f in fields(Device) if f.name != "extra")
 
 
 @dataclass
-class Device:
-    """Class for keeping track of an device."""
+class NodeChange:
+    """Class for describing a change to a Hive node."""
 
     hiveID: str
-    hiveName: str
-    hiveType: str
-    haType: str
-    deviceData: dict
-    status: dict
-    data: dict
-    parentDevice: str
-    isGroup: bool
-    device_id: str
-    device_name: str
+    nodeType: str
+    changes: dict = field(default_factory=dict)
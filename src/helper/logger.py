@@ -14,14 +14,22 @@ class Logger:
 
     async def error(self, e="UNKNOWN"):
         """Process and unexpected error."""
+        self.logError(e, inspect.stack()[1][3])
+
+    def logError(self, e="UNKNOWN", caller=None):
+        """Process an unexpected error from synchronous code."""
         self.session.logger.error(
             f"An unexpected error has occurred whilst"
-            f" executing {inspect.stack()[1][3]}"
+            f" executing {caller or inspect.stack()[1][3]}"
             f" with exception {e.__class__} {e}"
         )
 
     async def errorCheck(self, n_id, n_type, error_type, **kwargs):
         """Error has occurred."""
+        self.logErrorCheck(n_id, n_type, error_type, **kwargs)
+
+    def logErrorCheck(self, n_id, n_type, error_type, **kwargs):
+        """Error has occurred in synchronous code."""
         message = None
         name = self.session.helper.getDeviceName(n_id)
 
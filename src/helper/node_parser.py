@@ -0,0 +1,154 @@
+"""Incremental parser for the Hive nodes response."""
+
+# pylint: skip-file
+import codecs
+import json
+import re
+
+NODE_TYPES = ("products", "devices", "actions")
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class HiveNodeParser:
+    """Parse the nodes response as it is received.
+
+    The products, devices and actions lists are decoded one node at a time
+    into maps keyed by node id, so the raw response is never held in full.
+
+    Returns:
+        object: Node parser object.
+    """
+
+    def __init__(self):
+        """Initialise the node parser."""
+        self.decoder = json.JSONDecoder()
+        self.textDecoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.state = "start"
+        self.key = None
+        self.result = {}
+
+    def feed(self, chunk: bytes):
+        """Parse the next chunk of the response.
+
+        Args:
+            chunk (bytes): Next chunk of the response body.
+        """
+        self.buffer += self.textDecoder.decode(chunk)
+        self.parse()
+
+    def close(self):
+        """Finish parsing the response.
+
+        Raises:
+            JSONDecodeError: The response is incomplete or invalid.
+
+        Returns:
+            dict: Parsed response with the nodes keyed by id.
+        """
+        self.buffer += self.textDecoder.decode(b"", final=True)
+        self.parse(final=True)
+        if self.state != "done":
+            raise json.JSONDecodeError("Incomplete nodes response", self.buffer, 0)
+        return self.result
+
+    def decode(self, pos: int, final: bool):
+        """Decode the JSON value starting at a position in the buffer.
+
+        Args:
+            pos (int): Position the value starts at.
+            final (bool): Whether the whole response has been received.
+
+        Returns:
+            tuple: Decoded value and end position, or None if more data is needed.
+        """
+        try:
+            value, end = self.decoder.raw_decode(self.buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        if end == len(self.buffer) and not final:
+            return None
+        return value, end
+
+    def parse(self, final: bool = False):
+        """Parse as much of the buffer as possible.
+
+        Args:
+            final (bool, optional): Whether the whole response has been received. Defaults to False.
+
+        Raises:
+            JSONDecodeError: The response is not a valid nodes response.
+        """
+        pos = 0
+        while True:
+            pos = WHITESPACE.match(self.buffer, pos).end()
+            if pos == len(self.buffer):
+                break
+            char = self.buffer[pos]
+
+            if self.state == "start" and char == "{":
+                self.state = "key"
+                pos += 1
+            elif self.state == "key" and char == "}":
+                self.state = "done"
+                pos += 1
+            elif self.state == "key" and char == '"':
+                decoded = self.decode(pos, final)
+                if decoded is None:
+                    break
+                self.key, pos = decoded
+                self.state = "colon"
+            elif self.state == "colon" and char == ":":
+                self.state = "value"
+                pos += 1
+            elif self.state == "value" and self.key in NODE_TYPES and char == "[":
+                self.result[self.key] = {}
+                self.state = "node"
+                pos += 1
+            elif self.state == "value":
+                decoded = self.decode(pos, final)
+                if decoded is None:
+                    break
+                self.result[self.key], pos = decoded
+                self.state = "next"
+            elif self.state in ("node", "nextNode") and char == "]":
+                self.state = "next"
+                pos += 1
+            elif self.state == "node":
+                decoded = self.decode(pos, final)
+                if decoded is None:
+                    break
+                node, pos = decoded
+                self.result[self.key][node["id"]] = node
+                self.state = "nextNode"
+            elif self.state == "nextNode" and char == ",":
+                self.state = "node"
+                pos += 1
+            elif self.state == "next" and char == ",":
+                self.state = "key"
+                pos += 1
+            elif self.state == "next" and char == "}":
+                self.state = "done"
+                pos += 1
+            else:
+                raise json.JSONDecodeError("Unexpected character", self.buffer, pos)
+
+        self.buffer = self.buffer[pos:]
+
+
+async def parseNodes(stream: object, chunk_size: int = 65536):
+    """Parse a nodes response from a stream.
+
+    Args:
+        stream (object): Response content stream.
+        chunk_size (int, optional): Bytes to read at a time. Defaults to 65536.
+
+    Returns:
+        dict: Parsed response with the nodes keyed by id.
+    """
+    parser = HiveNodeParser()
+    async for chunk in stream.iter_chunked(chunk_size):
+        parser.feed(chunk)
+    return parser.close()
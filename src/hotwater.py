@@ -3,6 +3,7 @@
 # pylint: skip-file
 
 from .helper.const import HIVETOHA
+from .helper.hivedataclasses import Device
 
 
 class HiveHotwater:
@@ -17,6 +18,17 @@ class HiveHotwater:
     async def getMode(self, device: dict):
         """Get hotwater current mode.
 
+        Args:
+            device (dict): Device to get the mode for.
+
+        Returns:
+            str: Return mode.
+        """
+        return self.readMode(device)
+
+    def readMode(self, device: dict):
+        """Read hotwater current mode.
+
         Args:
             device (dict): Device to get the mode for.
 
@@ -33,7 +45,7 @@ class HiveHotwater:
                 state = data["props"]["previous"]["mode"]
             final = HIVETOHA[self.hotwaterType].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
@@ -49,6 +61,17 @@ class HiveHotwater:
     async def getBoost(self, device: dict):
         """Get hot water current boost status.
 
+        Args:
+            device (dict): Device to get boost status for
+
+        Returns:
+            str: Return boost status.
+        """
+        return self.readBoost(device)
+
+    def readBoost(self, device: dict):
+        """Read hot water current boost status.
+
         Args:
             device (dict): Device to get boost status for
 
@@ -63,7 +86,7 @@ class HiveHotwater:
             state = data["state"]["boost"]
             final = HIVETOHA["Boost"].get(state, "ON")
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
@@ -89,6 +112,17 @@ class HiveHotwater:
     async def getState(self, device: dict):
         """Get hot water current state.
 
+        Args:
+            device (dict): Device to get the state for.
+
+        Returns:
+            str: return state of device.
+        """
+        return self.readState(device)
+
+    def readState(self, device: dict):
+        """Read hot water current state.
+
         Args:
             device (dict): Device to get the state for.
 
@@ -101,9 +135,9 @@ class HiveHotwater:
         try:
             data = self.session.data.products[device["hiveID"]]
             state = data["state"]["status"]
-            mode_current = await self.getMode(device)
+            mode_current = self.readMode(device)
             if mode_current == "SCHEDULE":
-                if await self.getBoost(device) == "ON":
+                if self.readBoost(device) == "ON":
                     state = "ON"
                 else:
                     snan = self.session.helper.getScheduleNNL(data["state"]["schedule"])
@@ -111,7 +145,7 @@ class HiveHotwater:
 
             final = HIVETOHA[self.hotwaterType].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
@@ -130,12 +164,11 @@ class HiveHotwater:
         if device["hiveID"] in self.session.data.products:
             await self.session.hiveRefreshTokens()
             data = self.session.data.products[device["hiveID"]]
-            resp = await self.session.api.setState(
+            resp = await self.session.writeState(
                 data["type"], device["hiveID"], mode=new_mode
             )
             if resp["original"] == 200:
                 final = True
-                await self.session.getDevices(device["hiveID"])
 
         return final
 
@@ -158,12 +191,11 @@ class HiveHotwater:
         ):
             await self.session.hiveRefreshTokens()
             data = self.session.data.products[device["hiveID"]]
-            resp = await self.session.api.setState(
+            resp = await self.session.writeState(
                 data["type"], device["hiveID"], mode="BOOST", boost=mins
             )
             if resp["original"] == 200:
                 final = True
-                await self.session.getDevices(device["hiveID"])
 
         return final
 
@@ -186,11 +218,10 @@ class HiveHotwater:
             await self.session.hiveRefreshTokens()
             data = self.session.data.products[device["hiveID"]]
             prev_mode = data["props"]["previous"]["mode"]
-            resp = await self.session.api.setState(
+            resp = await self.session.writeState(
                 data["type"], device["hiveID"], mode=prev_mode
             )
             if resp["original"] == 200:
-                await self.session.getDevices(device["hiveID"])
                 final = True
 
         return final
@@ -225,28 +256,10 @@ class WaterHeater(HiveHotwater):
         )
 
         if device["deviceData"]["online"]:
-
-            dev_data = {}
             self.session.helper.deviceRecovered(device["device_id"])
-            data = self.session.data.devices[device["device_id"]]
-            dev_data = {
-                "hiveID": device["hiveID"],
-                "hiveName": device["hiveName"],
-                "hiveType": device["hiveType"],
-                "haName": device["haName"],
-                "haType": device["haType"],
-                "device_id": device["device_id"],
-                "device_name": device["device_name"],
-                "status": {"current_operation": await self.getMode(device)},
-                "deviceData": data.get("props", None),
-                "parentDevice": data.get("parent", None),
-                "custom": device.get("custom", None),
-                "attributes": await self.session.attr.stateAttributes(
-                    device["device_id"], device["hiveType"]
-                ),
-            }
-
-            self.session.devices.update({device["hiveID"]: dev_data})
+            self.session.devices.update(
+                {device["hiveID"]: self.readWaterHeater(device)}
+            )
             return self.session.devices[device["hiveID"]]
         else:
             await self.session.log.errorCheck(
@@ -254,6 +267,27 @@ class WaterHeater(HiveHotwater):
             )
             return device
 
+    def readWaterHeater(self, device: dict):
+        """Read water heater data.
+
+        Args:
+            device (dict): Online device to read, updated in place if it is a Device.
+
+        Returns:
+            Device: Device data.
+        """
+        data = self.session.data.devices[device["device_id"]]
+        dev_data = Device.reuse(device)
+        dev_data.identify(device)
+        dev_data.section("status")["current_operation"] = self.readMode(device)
+        dev_data.deviceData = data.get("props", None)
+        dev_data.parentDevice = data.get("parent", None)
+        dev_data.attributes = self.session.attr.readAttributes(
+            device["device_id"], device["hiveType"]
+        )
+
+        return dev_data
+
     async def getScheduleNowNextLater(self, device: dict):
         """Hive get hotwater schedule now, next and later.
 
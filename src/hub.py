@@ -25,6 +25,17 @@ class HiveHub:
     async def getSmokeStatus(self, device: dict):
         """Get the hub smoke status.
 
+        Args:
+            device (dict): device to get status for
+
+        Returns:
+            str: Return smoke status.
+        """
+        return self.readSmokeStatus(device)
+
+    def readSmokeStatus(self, device: dict):
+        """Read the hub smoke status.
+
         Args:
             device (dict): device to get status for
 
@@ -39,13 +50,24 @@ class HiveHub:
             state = data["props"]["sensors"]["SMOKE_CO"]["active"]
             final = HIVETOHA[self.hubType]["Smoke"].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getDogBarkStatus(self, device: dict):
         """Get dog bark status.
 
+        Args:
+            device (dict): Device to get status for.
+
+        Returns:
+            str: Return status.
+        """
+        return self.readDogBarkStatus(device)
+
+    def readDogBarkStatus(self, device: dict):
+        """Read dog bark status.
+
         Args:
             device (dict): Device to get status for.
 
@@ -60,13 +82,24 @@ class HiveHub:
             state = data["props"]["sensors"]["DOG_BARK"]["active"]
             final = HIVETOHA[self.hubType]["Dog"].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getGlassBreakStatus(self, device: dict):
         """Get the glass detected status from the Hive hub.
 
+        Args:
+            device (dict): Device to get status for.
+
+        Returns:
+            str: Return status.
+        """
+        return self.readGlassBreakStatus(device)
+
+    def readGlassBreakStatus(self, device: dict):
+        """Read the glass detected status from the Hive hub.
+
         Args:
             device (dict): Device to get status for.
 
@@ -81,6 +114,6 @@ class HiveHub:
             state = data["props"]["sensors"]["GLASS_BREAK"]["active"]
             final = HIVETOHA[self.hubType]["Glass"].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
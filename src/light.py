@@ -4,6 +4,7 @@
 import colorsys
 
 from .helper.const import HIVETOHA
+from .helper.hivedataclasses import Device
 
 
 class HiveLight:
@@ -18,6 +19,17 @@ class HiveLight:
     async def getState(self, device: dict):
         """Get light current state.
 
+        Args:
+            device (dict): Device to get the state of.
+
+        Returns:
+            str: State of the light.
+        """
+        return self.readState(device)
+
+    def readState(self, device: dict):
+        """Read light current state.
+
         Args:
             device (dict): Device to get the state of.
 
@@ -32,13 +44,24 @@ class HiveLight:
             state = data["state"]["status"]
             final = HIVETOHA[self.lightType].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getBrightness(self, device: dict):
         """Get light current brightness.
 
+        Args:
+            device (dict): Device to get the brightness of.
+
+        Returns:
+            int: Brightness value.
+        """
+        return self.readBrightness(device)
+
+    def readBrightness(self, device: dict):
+        """Read light current brightness.
+
         Args:
             device (dict): Device to get the brightness of.
 
@@ -53,13 +76,24 @@ class HiveLight:
             state = data["state"]["brightness"]
             final = (state / 100) * 255
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getMinColorTemp(self, device: dict):
         """Get light minimum color temperature.
 
+        Args:
+            device (dict): Device to get min colour temp for.
+
+        Returns:
+            int: Min color temperature.
+        """
+        return self.readMinColorTemp(device)
+
+    def readMinColorTemp(self, device: dict):
+        """Read light minimum color temperature.
+
         Args:
             device (dict): Device to get min colour temp for.
 
@@ -74,13 +108,24 @@ class HiveLight:
             state = data["props"]["colourTemperature"]["max"]
             final = round((1 / state) * 1000000)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getMaxColorTemp(self, device: dict):
         """Get light maximum color temperature.
 
+        Args:
+            device (dict): Device to get max colour temp for.
+
+        Returns:
+            int: Min color temperature.
+        """
+        return self.readMaxColorTemp(device)
+
+    def readMaxColorTemp(self, device: dict):
+        """Read light maximum color temperature.
+
         Args:
             device (dict): Device to get max colour temp for.
 
@@ -95,13 +140,24 @@ class HiveLight:
             state = data["props"]["colourTemperature"]["min"]
             final = round((1 / state) * 1000000)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getColorTemp(self, device: dict):
         """Get light current color temperature.
 
+        Args:
+            device (dict): Device to get colour temp for.
+
+        Returns:
+            int: Current Color Temp.
+        """
+        return self.readColorTemp(device)
+
+    def readColorTemp(self, device: dict):
+        """Read light current color temperature.
+
         Args:
             device (dict): Device to get colour temp for.
 
@@ -116,13 +172,24 @@ class HiveLight:
             state = data["state"]["colourTemperature"]
             final = round((1 / state) * 1000000)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getColor(self, device: dict):
         """Get light current colour.
 
+        Args:
+            device (dict): Device to get color for.
+
+        Returns:
+            tuple: RGB values for the color.
+        """
+        return self.readColor(device)
+
+    def readColor(self, device: dict):
+        """Read light current colour.
+
         Args:
             device (dict): Device to get color for.
 
@@ -143,13 +210,24 @@ class HiveLight:
                 int(i * 255) for i in colorsys.hsv_to_rgb(state[0], state[1], state[2])
             )
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def getColorMode(self, device: dict):
         """Get Colour Mode.
 
+        Args:
+            device (dict): Device to get the color mode for.
+
+        Returns:
+            str: Colour mode.
+        """
+        return self.readColorMode(device)
+
+    def readColorMode(self, device: dict):
+        """Read Colour Mode.
+
         Args:
             device (dict): Device to get the color mode for.
 
@@ -162,7 +240,7 @@ class HiveLight:
             data = self.session.data.products[device["hiveID"]]
             state = data["state"]["colourMode"]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
@@ -183,13 +261,12 @@ class HiveLight:
         ):
             await self.session.hiveRefreshTokens()
             data = self.session.data.products[device["hiveID"]]
-            resp = await self.session.api.setState(
+            resp = await self.session.writeState(
                 data["type"], device["hiveID"], status="OFF"
             )
 
             if resp["original"] == 200:
                 final = True
-                await self.session.getDevices(device["hiveID"])
 
         return final
 
@@ -211,12 +288,11 @@ class HiveLight:
             await self.session.hiveRefreshTokens()
             data = self.session.data.products[device["hiveID"]]
 
-            resp = await self.session.api.setState(
+            resp = await self.session.writeState(
                 data["type"], device["hiveID"], status="ON"
             )
             if resp["original"] == 200:
                 final = True
-                await self.session.getDevices(device["hiveID"])
 
         return final
 
@@ -238,7 +314,7 @@ class HiveLight:
         ):
             await self.session.hiveRefreshTokens()
             data = self.session.data.products[device["hiveID"]]
-            resp = await self.session.api.setState(
+            resp = await self.session.writeState(
                 data["type"],
                 device["hiveID"],
                 status="ON",
@@ -246,7 +322,6 @@ class HiveLight:
             )
             if resp["original"] == 200:
                 final = True
-                await self.session.getDevices(device["hiveID"])
 
         return final
 
@@ -270,13 +345,13 @@ class HiveLight:
             data = self.session.data.products[device["hiveID"]]
 
             if data["type"] == "tuneablelight":
-                resp = await self.session.api.setState(
+                resp = await self.session.writeState(
                     data["type"],
                     device["hiveID"],
                     colourTemperature=color_temp,
                 )
             else:
-                resp = await self.session.api.setState(
+                resp = await self.session.writeState(
                     data["type"],
                     device["hiveID"],
                     colourMode="WHITE",
@@ -285,7 +360,6 @@ class HiveLight:
 
             if resp["original"] == 200:
                 final = True
-                await self.session.getDevices(device["hiveID"])
 
         return final
 
@@ -308,7 +382,7 @@ class HiveLight:
             await self.session.hiveRefreshTokens()
             data = self.session.data.products[device["hiveID"]]
 
-            resp = await self.session.api.setState(
+            resp = await self.session.writeState(
                 data["type"],
                 device["hiveID"],
                 colourMode="COLOUR",
@@ -318,7 +392,6 @@ class HiveLight:
             )
             if resp["original"] == 200:
                 final = True
-                await self.session.getDevices(device["hiveID"])
 
         return final
 
@@ -350,58 +423,10 @@ class Light(HiveLight):
         device["deviceData"].update(
             {"online": await self.session.attr.onlineOffline(device["device_id"])}
         )
-        dev_data = {}
 
         if device["deviceData"]["online"]:
             self.session.helper.deviceRecovered(device["device_id"])
-            data = self.session.data.devices[device["device_id"]]
-            dev_data = {
-                "hiveID": device["hiveID"],
-                "hiveName": device["hiveName"],
-                "hiveType": device["hiveType"],
-                "haName": device["haName"],
-                "haType": device["haType"],
-                "device_id": device["device_id"],
-                "device_name": device["device_name"],
-                "status": {
-                    "state": await self.getState(device),
-                    "brightness": await self.getBrightness(device),
-                },
-                "deviceData": data.get("props", None),
-                "parentDevice": data.get("parent", None),
-                "custom": device.get("custom", None),
-                "attributes": await self.session.attr.stateAttributes(
-                    device["device_id"], device["hiveType"]
-                ),
-            }
-
-            if device["hiveType"] in ("tuneablelight", "colourtuneablelight"):
-                dev_data.update(
-                    {
-                        "min_mireds": await self.getMinColorTemp(device),
-                        "max_mireds": await self.getMaxColorTemp(device),
-                    }
-                )
-                dev_data["status"].update(
-                    {"color_temp": await self.getColorTemp(device)}
-                )
-            if device["hiveType"] == "colourtuneablelight":
-                mode = await self.getColorMode(device)
-                if mode == "COLOUR":
-                    dev_data["status"].update(
-                        {
-                            "hs_color": await self.getColor(device),
-                            "mode": await self.getColorMode(device),
-                        }
-                    )
-                else:
-                    dev_data["status"].update(
-                        {
-                            "mode": await self.getColorMode(device),
-                        }
-                    )
-
-            self.session.devices.update({device["hiveID"]: dev_data})
+            self.session.devices.update({device["hiveID"]: self.readLight(device)})
             return self.session.devices[device["hiveID"]]
         else:
             await self.session.log.errorCheck(
@@ -409,6 +434,39 @@ class Light(HiveLight):
             )
             return device
 
+    def readLight(self, device: dict):
+        """Read light data.
+
+        Args:
+            device (dict): Online device to read, updated in place if it is a Device.
+
+        Returns:
+            Device: Device data.
+        """
+        data = self.session.data.devices[device["device_id"]]
+        dev_data = Device.reuse(device)
+        dev_data.identify(device)
+        status = dev_data.section("status")
+        status["state"] = self.readState(device)
+        status["brightness"] = self.readBrightness(device)
+        dev_data.deviceData = data.get("props", None)
+        dev_data.parentDevice = data.get("parent", None)
+        dev_data.attributes = self.session.attr.readAttributes(
+            device["device_id"], device["hiveType"]
+        )
+
+        if device["hiveType"] in ("tuneablelight", "colourtuneablelight"):
+            dev_data.min_mireds = self.readMinColorTemp(device)
+            dev_data.max_mireds = self.readMaxColorTemp(device)
+            status["color_temp"] = self.readColorTemp(device)
+        if device["hiveType"] == "colourtuneablelight":
+            mode = self.readColorMode(device)
+            if mode == "COLOUR":
+                status["hs_color"] = self.readColor(device)
+            status["mode"] = mode
+
+        return dev_data
+
     async def turnOn(self, device: dict, brightness: int, color_temp: int, color: list):
         """Set light to turn on.
 
@@ -0,0 +1,174 @@
+"""Hive Session Manager Module."""
+
+# pylint: skip-file
+import asyncio
+from datetime import datetime
+
+from aiohttp import ClientSession, TCPConnector
+
+from .hive import Hive
+from .poller import HivePoller, HiveRateLimiter
+
+
+class HiveSessionManager:
+    """Manage many Hive sessions sharing one connection pool.
+
+    The connection pool belongs to the running event loop, so it is only
+    created once the first session is created from a coroutine. The manager
+    is only exported by apyhiveapi, as pyhiveapi has no event loop to run
+    the pool in.
+
+    Returns:
+        object: Session manager object.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        keepalive_timeout: float = 60,
+        dns_cache_ttl: int = 300,
+        max_concurrent_polls: int = 10,
+    ):
+        """Initialise the session manager.
+
+        Args:
+            limit (int, optional): Total number of open connections. Defaults to 100.
+            limit_per_host (int, optional): Open connections to a single host. Defaults to 20.
+            keepalive_timeout (float, optional): Seconds to keep idle connections open. Defaults to 60.
+            dns_cache_ttl (int, optional): Seconds to cache DNS lookups. Defaults to 300.
+            max_concurrent_polls (int, optional): Sessions polled at the same time. Defaults to 10.
+        """
+        self.connectorOptions = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": dns_cache_ttl,
+            "use_dns_cache": True,
+        }
+        self.pollLimit = asyncio.Semaphore(max_concurrent_polls)
+        self.websession = None
+        self.sessions = []
+        self.poller = None
+
+    async def __aenter__(self):
+        """Enter the session manager context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Close the shared connection pool on exit."""
+        await self.close()
+
+    async def getWebsession(self):
+        """Get the websession shared by all sessions.
+
+        Returns:
+            ClientSession: Shared websession.
+        """
+        if self.websession is None or self.websession.closed:
+            self.websession = ClientSession(
+                connector=TCPConnector(**self.connectorOptions)
+            )
+
+        return self.websession
+
+    async def createSession(self, username: str = None, password: str = None):
+        """Create a Hive session using the shared connection pool.
+
+        Args:
+            username (str, optional): Hive username. Defaults to None.
+            password (str, optional): Hive password. Defaults to None.
+
+        Returns:
+            Hive: New Hive session.
+        """
+        session = Hive(
+            websession=await self.getWebsession(),
+            username=username,
+            password=password,
+        )
+        self.sessions.append(session)
+        if self.poller is not None:
+            self.poller.addSession(session)
+        return session
+
+    async def removeSession(self, session: Hive):
+        """Stop managing a Hive session.
+
+        Args:
+            session (Hive): Session to remove.
+        """
+        if session in self.sessions:
+            self.sessions.remove(session)
+        if self.poller is not None:
+            await self.poller.removeSession(session)
+
+    async def pollSession(self, session: Hive):
+        """Poll a session once a polling slot is free.
+
+        Args:
+            session (Hive): Session to poll.
+
+        Returns:
+            boolean: True/False if the update was successful.
+        """
+        async with self.pollLimit:
+            return await session.refreshData("No_ID")
+
+    async def pollAll(self, force: bool = False):
+        """Poll every session which is due an update.
+
+        Args:
+            force (bool, optional): Poll sessions even if they are not due. Defaults to False.
+
+        Returns:
+            list: Update results in the same order as the polled sessions.
+        """
+        now = datetime.now()
+        due = [
+            session
+            for session in self.sessions
+            if force or now >= session.config.lastUpdated + session.config.scanInterval
+        ]
+        return await asyncio.gather(
+            *(self.pollSession(session) for session in due), return_exceptions=True
+        )
+
+    async def startPolling(
+        self, jitter: float = 0.1, requests_per_second: float = None, burst: int = 1
+    ):
+        """Poll all sessions in the background.
+
+        Sessions are spread evenly across the scan interval, each delay is
+        jittered and all polls share one request budget.
+
+        Args:
+            jitter (float, optional): Fraction of the scan interval to vary each poll by. Defaults to 0.1.
+            requests_per_second (float, optional): Poll requests allowed per second across all sessions. Defaults to None.
+            burst (int, optional): Poll requests allowed at once within the budget. Defaults to 1.
+        """
+        if self.poller is not None:
+            return
+
+        rate_limiter = None
+        if requests_per_second:
+            rate_limiter = HiveRateLimiter(requests_per_second, burst)
+        self.poller = HivePoller(
+            jitter=jitter, rate_limiter=rate_limiter, limit=self.pollLimit
+        )
+        for index, session in enumerate(self.sessions):
+            interval = session.config.scanInterval.total_seconds()
+            self.poller.addSession(session, interval * index / len(self.sessions))
+
+    async def stopPolling(self):
+        """Stop polling sessions in the background."""
+        if self.poller is not None:
+            await self.poller.stop()
+            self.poller = None
+
+    async def close(self):
+        """Stop polling and close the shared connection pool."""
+        await self.stopPolling()
+        if self.websession is not None and not self.websession.closed:
+            await self.websession.close()
+        self.websession = None
@@ -2,6 +2,7 @@
 
 # pylint: skip-file
 from .helper.const import HIVETOHA
+from .helper.hivedataclasses import Device
 
 
 class HiveSmartPlug:
@@ -16,6 +17,17 @@ class HiveSmartPlug:
     async def getState(self, device: dict):
         """Get smart plug state.
 
+        Args:
+            device (dict): Device to get the plug state for.
+
+        Returns:
+            boolean: Returns True or False based on if the plug is on
+        """
+        return self.readState(device)
+
+    def readState(self, device: dict):
+        """Read smart plug state.
+
         Args:
             device (dict): Device to get the plug state for.
 
@@ -29,13 +41,24 @@ class HiveSmartPlug:
             state = data["state"]["status"]
             state = HIVETOHA["Switch"].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
     async def getPowerUsage(self, device: dict):
         """Get smart plug current power usage.
 
+        Args:
+            device (dict): [description]
+
+        Returns:
+            [type]: [description]
+        """
+        return self.readPowerUsage(device)
+
+    def readPowerUsage(self, device: dict):
+        """Read smart plug current power usage.
+
         Args:
             device (dict): [description]
 
@@ -48,7 +71,7 @@ class HiveSmartPlug:
             data = self.session.data.products[device["hiveID"]]
             state = data["props"]["powerConsumption"]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return state
 
@@ -69,12 +92,9 @@ class HiveSmartPlug:
         ):
             await self.session.hiveRefreshTokens()
             data = self.session.data.products[device["hiveID"]]
-            resp = await self.session.api.setState(
-                data["type"], data["id"], status="ON"
-            )
+            resp = await self.session.writeState(data["type"], data["id"], status="ON")
             if resp["original"] == 200:
                 final = True
-                await self.session.getDevices(device["hiveID"])
 
         return final
 
@@ -95,12 +115,9 @@ class HiveSmartPlug:
         ):
             await self.session.hiveRefreshTokens()
             data = self.session.data.products[device["hiveID"]]
-            resp = await self.session.api.setState(
-                data["type"], data["id"], status="OFF"
-            )
+            resp = await self.session.writeState(data["type"], data["id"], status="OFF")
             if resp["original"] == 200:
                 final = True
-                await self.session.getDevices(device["hiveID"])
 
         return final
 
@@ -132,42 +149,10 @@ class Switch(HiveSmartPlug):
         device["deviceData"].update(
             {"online": await self.session.attr.onlineOffline(device["device_id"])}
         )
-        dev_data = {}
 
         if device["deviceData"]["online"]:
             self.session.helper.deviceRecovered(device["device_id"])
-            data = self.session.data.devices[device["device_id"]]
-            dev_data = {
-                "hiveID": device["hiveID"],
-                "hiveName": device["hiveName"],
-                "hiveType": device["hiveType"],
-                "haName": device["haName"],
-                "haType": device["haType"],
-                "device_id": device["device_id"],
-                "device_name": device["device_name"],
-                "status": {
-                    "state": await self.getSwitchState(device),
-                },
-                "deviceData": data.get("props", None),
-                "parentDevice": data.get("parent", None),
-                "custom": device.get("custom", None),
-                "attributes": {},
-            }
-
-            if device["hiveType"] == "activeplug":
-                dev_data.update(
-                    {
-                        "status": {
-                            "state": dev_data["status"]["state"],
-                            "power_usage": await self.getPowerUsage(device),
-                        },
-                        "attributes": await self.session.attr.stateAttributes(
-                            device["device_id"], device["hiveType"]
-                        ),
-                    }
-                )
-
-            self.session.devices.update({device["hiveID"]: dev_data})
+            self.session.devices.update({device["hiveID"]: self.readSwitch(device)})
             return self.session.devices[device["hiveID"]]
         else:
             await self.session.log.errorCheck(
@@ -175,9 +160,46 @@ class Switch(HiveSmartPlug):
             )
             return device
 
+    def readSwitch(self, device: dict):
+        """Read switch data.
+
+        Args:
+            device (dict): Online device to read, updated in place if it is a Device.
+
+        Returns:
+            Device: Device data.
+        """
+        data = self.session.data.devices[device["device_id"]]
+        dev_data = Device.reuse(device)
+        dev_data.identify(device)
+        status = dev_data.section("status")
+        status["state"] = self.readSwitchState(device)
+        dev_data.deviceData = data.get("props", None)
+        dev_data.parentDevice = data.get("parent", None)
+        dev_data.attributes = {}
+
+        if device["hiveType"] == "activeplug":
+            status["power_usage"] = self.readPowerUsage(device)
+            dev_data.attributes = self.session.attr.readAttributes(
+                device["device_id"], device["hiveType"]
+            )
+
+        return dev_data
+
     async def getSwitchState(self, device: dict):
         """Home Assistant wrapper to get updated switch state.
 
+        Args:
+            device (dict): Device to get state for
+
+        Returns:
+            boolean: Return True or False for the state.
+        """
+        return self.readSwitchState(device)
+
+    def readSwitchState(self, device: dict):
+        """Home Assistant wrapper to get updated switch state.
+
         Args:
             device (dict): Device to get state for
 
@@ -185,9 +207,9 @@ class Switch(HiveSmartPlug):
             boolean: Return True or False for the state.
         """
         if device["hiveType"] == "Heating_Heat_On_Demand":
-            return await self.session.heating.getHeatOnDemand(device)
+            return self.session.heating.readHeatOnDemand(device)
         else:
-            return await self.getState(device)
+            return self.readState(device)
 
     async def turnOn(self, device: dict):
         """Home Assisatnt wrapper for turning switch on.
@@ -0,0 +1,147 @@
+"""Hive Poller Module."""
+
+# pylint: skip-file
+import asyncio
+import random
+import time
+
+from .helper.hive_tasks import sleep, startTask, stopTask
+
+
+class HiveRateLimiter:
+    """Token bucket limiting the rate of requests across sessions.
+
+    Returns:
+        object: Rate limiter object.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialise the rate limiter.
+
+        Args:
+            rate (float): Requests allowed per second.
+            burst (int, optional): Requests which can be made at once. Defaults to 1.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = None
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request is allowed."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if self.updated is not None:
+                    self.tokens = min(
+                        self.burst, self.tokens + (now - self.updated) * self.rate
+                    )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await sleep((1 - self.tokens) / self.rate)
+
+
+class HivePoller:
+    """Background poller which refreshes sessions on their scan interval.
+
+    Each session is polled from its own phase offset within the interval and
+    every delay is jittered, so polls from many sessions stay spread out.
+
+    Returns:
+        object: Poller object.
+    """
+
+    def __init__(
+        self,
+        jitter: float = 0.1,
+        rate_limiter: HiveRateLimiter = None,
+        limit: asyncio.Semaphore = None,
+    ):
+        """Initialise the poller.
+
+        Args:
+            jitter (float, optional): Fraction of the interval to randomly vary each delay by. Defaults to 0.1.
+            rate_limiter (HiveRateLimiter, optional): Request budget shared by all polls. Defaults to None.
+            limit (asyncio.Semaphore, optional): Limit on concurrent polls. Defaults to None.
+        """
+        self.jitter = jitter
+        self.rateLimiter = rate_limiter
+        self.limit = limit
+        self.tasks = {}
+
+    def addSession(self, session: object, offset: float = None):
+        """Start polling a session.
+
+        Args:
+            session (object): Session to poll.
+            offset (float, optional): Seconds to wait before the first poll. Defaults to a random point in the scan interval.
+        """
+        if session in self.tasks:
+            return
+
+        if offset is None:
+            offset = random.uniform(0, session.config.scanInterval.total_seconds())
+        session.config.scheduledPolling = True
+        self.tasks[session] = startTask(self.pollLoop, session, offset)
+
+    async def removeSession(self, session: object):
+        """Stop polling a session.
+
+        Args:
+            session (object): Session to stop polling.
+        """
+        task = self.tasks.pop(session, None)
+        session.config.scheduledPolling = False
+        if task is not None:
+            await stopTask(task)
+
+    async def stop(self):
+        """Stop polling all sessions."""
+        for session in list(self.tasks):
+            await self.removeSession(session)
+
+    def nextDelay(self, session: object):
+        """Get the jittered delay before the next poll of a session.
+
+        Args:
+            session (object): Session which has just been polled.
+
+        Returns:
+            float: Seconds until the next poll.
+        """
+        interval = session.config.scanInterval.total_seconds()
+        return max(0, interval * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    async def poll(self, session: object):
+        """Poll a session once the rate and concurrency limits allow.
+
+        Args:
+            session (object): Session to poll.
+
+        Returns:
+            boolean: True/False if the update was successful.
+        """
+        if self.rateLimiter is not None:
+            await self.rateLimiter.acquire()
+        if self.limit is None:
+            return await session.refreshData("No_ID")
+        async with self.limit:
+            return await session.refreshData("No_ID")
+
+    async def pollLoop(self, session: object, offset: float):
+        """Poll a session until polling is stopped.
+
+        Args:
+            session (object): Session to poll.
+            offset (float): Seconds to wait before the first poll.
+        """
+        await sleep(offset)
+        while True:
+            try:
+                await self.poll(session)
+            except Exception as e:
+                await session.log.error(e)
+            await sleep(self.nextDelay(session))
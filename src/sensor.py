@@ -1,7 +1,9 @@
 """Hive Sensor Module."""
 
 # pylint: skip-file
-from .helper.const import HIVE_TYPES, HIVETOHA, sensor_commands
+from .helper.const import HIVE_TYPES, HIVETOHA
+from .helper.entity_factory import SENSOR_READERS
+from .helper.hivedataclasses import Device
 
 
 class HiveSensor:
@@ -12,6 +14,17 @@ class HiveSensor:
     async def getState(self, device: dict):
         """Get sensor state.
 
+        Args:
+            device (dict): Device to get state off.
+
+        Returns:
+            str: State of device.
+        """
+        return self.readState(device)
+
+    def readState(self, device: dict):
+        """Read sensor state.
+
         Args:
             device (dict): Device to get state off.
 
@@ -29,13 +42,24 @@ class HiveSensor:
             elif data["type"] == "motionsensor":
                 final = data["props"]["motion"]["status"]
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
     async def online(self, device: dict):
         """Get the online status of the Hive hub.
 
+        Args:
+            device (dict): Device to get the state of.
+
+        Returns:
+            boolean: True/False if the device is online.
+        """
+        return self.readOnline(device)
+
+    def readOnline(self, device: dict):
+        """Read the online status of the Hive hub.
+
         Args:
             device (dict): Device to get the state of.
 
@@ -50,7 +74,7 @@ class HiveSensor:
             state = data["props"]["online"]
             final = HIVETOHA[self.sensorType].get(state, state)
         except KeyError as e:
-            await self.session.log.error(e)
+            self.session.log.logError(e)
 
         return final
 
@@ -82,7 +106,6 @@ class Sensor(HiveSensor):
         device["deviceData"].update(
             {"online": await self.session.attr.onlineOffline(device["device_id"])}
         )
-        data = {}
 
         if device["deviceData"]["online"] or device["hiveType"] in (
             "Availability",
@@ -91,56 +114,47 @@ class Sensor(HiveSensor):
             if device["hiveType"] not in ("Availability", "Connectivity"):
                 self.session.helper.deviceRecovered(device["device_id"])
 
-            dev_data = {}
-            dev_data = {
-                "hiveID": device["hiveID"],
-                "hiveName": device["hiveName"],
-                "hiveType": device["hiveType"],
-                "haName": device["haName"],
-                "haType": device["haType"],
-                "device_id": device.get("device_id", None),
-                "device_name": device.get("device_name", None),
-                "deviceData": {},
-                "custom": device.get("custom", None),
-            }
-
-            if device["device_id"] in self.session.data.devices:
-                data = self.session.data.devices.get(device["device_id"], {})
-            elif device["hiveID"] in self.session.data.products:
-                data = self.session.data.products.get(device["hiveID"], {})
-
-            if (
-                dev_data["hiveType"] in sensor_commands
-                or dev_data.get("custom", None) in sensor_commands
-            ):
-                code = sensor_commands.get(
-                    dev_data["hiveType"],
-                    sensor_commands.get(dev_data["custom"]),
-                )
-                dev_data.update(
-                    {
-                        "status": {"state": await eval(code)},
-                        "deviceData": data.get("props", None),
-                        "parentDevice": data.get("parent", None),
-                    }
-                )
-            elif device["hiveType"] in HIVE_TYPES["Sensor"]:
-                data = self.session.data.devices.get(device["hiveID"], {})
-                dev_data.update(
-                    {
-                        "status": {"state": await self.getState(device)},
-                        "deviceData": data.get("props", None),
-                        "parentDevice": data.get("parent", None),
-                        "attributes": await self.session.attr.stateAttributes(
-                            device["device_id"], device["hiveType"]
-                        ),
-                    }
-                )
-
-            self.session.devices.update({device["hiveID"]: dev_data})
+            self.session.devices.update({device["hiveID"]: self.readSensor(device)})
             return self.session.devices[device["hiveID"]]
         else:
             await self.session.log.errorCheck(
                 device["device_id"], "ERROR", device["deviceData"]["online"]
             )
             return device
+
+    def readSensor(self, device: dict):
+        """Read sensor data.
+
+        Args:
+            device (dict): Online or availability device to read, updated in place if it is a Device.
+
+        Returns:
+            Device: Device data.
+        """
+        data = {}
+        dev_data = Device.reuse(device)
+        dev_data.identify(device)
+        dev_data.deviceData = {}
+
+        if device["device_id"] in self.session.data.devices:
+            data = self.session.data.devices.get(device["device_id"], {})
+        elif device["hiveID"] in self.session.data.products:
+            data = self.session.data.products.get(device["hiveID"], {})
+
+        reader = SENSOR_READERS.get(
+            dev_data.hiveType, SENSOR_READERS.get(dev_data.custom)
+        )
+        if reader is not None:
+            dev_data.section("status")["state"] = reader(self, device)
+            dev_data.deviceData = data.get("props", None)
+            dev_data.parentDevice = data.get("parent", None)
+        elif device["hiveType"] in HIVE_TYPES["Sensor"]:
+            data = self.session.data.devices.get(device["hiveID"], {})
+            dev_data.section("status")["state"] = self.readState(device)
+            dev_data.deviceData = data.get("props", None)
+            dev_data.parentDevice = data.get("parent", None)
+            dev_data.attributes = self.session.attr.readAttributes(
+                device["device_id"], device["hiveType"]
+            )
+
+        return dev_data
@@ -3,7 +3,9 @@
 # pylint: skip-file
 import asyncio
 import copy
+import inspect
 import json
+import logging
 import operator
 import os
 import time
@@ -13,7 +15,13 @@ from aiohttp.web import HTTPException
 from apyhiveapi import API, Auth
 
 from .device_attributes import HiveAttributes
-from .helper.const import ACTIONS, DEVICES, HIVE_TYPES, PRODUCTS
+from .helper.const import HIVE_TYPES, HTTP_NOT_MODIFIED, NUMERIC_STATE_FIELDS
+from .helper.entity_factory import (
+    ACTION_ENTITIES,
+    DEVICE_ENTITIES,
+    ENTITY_READERS,
+    PRODUCT_ENTITIES,
+)
 from .helper.hive_exceptions import (
     HiveApiError,
     HiveFailedToRefreshTokens,
@@ -26,8 +34,16 @@ from .helper.hive_exceptions import (
     NoApiToken,
 )
 from .helper.hive_helper import HiveHelper
+from .helper.hive_tasks import inEventLoop, sharedCall
+from .helper.hivedataclasses import NodeChange
 from .helper.logger import Logger
 from .helper.map import Map
+from .poller import HivePoller
+from .token_refresher import HiveTokenRefresher
+from .token_store import HiveFileTokenStore
+from .writer import HiveWriteQueue
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class HiveSession:
@@ -58,15 +74,20 @@ class HiveSession:
             password (str, optional): Hive Password. Defaults to None.
             websession (object, optional): Websession for api calls. Defaults to None.
         """
+        self.api = API(hiveSession=self, websession=websession)
         self.auth = Auth(
             username=username,
             password=password,
+            websession=self.api.websession,
         )
-        self.api = API(hiveSession=self, websession=websession)
         self.helper = HiveHelper(self)
         self.attr = HiveAttributes(self)
         self.log = Logger(self)
         self.updateLock = asyncio.Lock()
+        self.updateTask = None
+        self.tokenTask = None
+        self.tokenRefresher = None
+        self.tokenStore = None
         self.tokens = Map(
             {
                 "tokenData": {},
@@ -77,16 +98,23 @@ class HiveSession:
         self.config = Map(
             {
                 "alarm": False,
+                "backgroundTokenRefresh": False,
                 "battery": [],
                 "camera": False,
                 "errorList": {},
                 "file": False,
                 "homeID": None,
+                "incrementalUpdate": True,
                 "lastUpdated": datetime.now(),
                 "mode": [],
+                "optimisticUpdate": False,
+                "requestDeadline": None,
                 "scanInterval": timedelta(seconds=120),
+                "scheduledPolling": False,
+                "streamNodes": True,
                 "userID": None,
                 "username": username,
+                "writeDelay": 0,
             }
         )
         self.data = Map(
@@ -98,10 +126,15 @@ class HiveSession:
                 "minMax": {},
                 "alarm": {},
                 "camera": {},
+                "pending": {},
             }
         )
         self.devices = {}
         self.deviceList = {}
+        self.changedNodes = set()
+        self.subscribers = {}
+        self.poller = None
+        self.writeQueue = HiveWriteQueue(self)
         self.hub_id = None
 
     def openFile(self, file: str):
@@ -169,6 +202,77 @@ class HiveSession:
             self.logger.error(error)
             return None
 
+    def subscribe(self, callback: callable, n_id: str = None):
+        """Subscribe to node change events.
+
+        The callback is called with a NodeChange for every node which has
+        changed after each update of the Hive data. Coroutine callbacks
+        are awaited.
+
+        Args:
+            callback (callable): Function to call with each change.
+            n_id (str, optional): Only report changes for this node. Defaults to None.
+
+        Returns:
+            callable: Function which removes the subscription.
+        """
+        self.subscribers.setdefault(n_id, []).append(callback)
+        return lambda: self.unsubscribe(callback, n_id)
+
+    def unsubscribe(self, callback: callable, n_id: str = None):
+        """Remove a node change subscription.
+
+        Args:
+            callback (callable): Function which was subscribed.
+            n_id (str, optional): Node the callback was subscribed to. Defaults to None.
+        """
+        callbacks = self.subscribers.get(n_id, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            self.subscribers.pop(n_id, None)
+
+    async def notifySubscribers(self, events: list):
+        """Send node change events to the subscribed callbacks.
+
+        Args:
+            events (list): NodeChange events to send.
+        """
+        for event in events:
+            callbacks = self.subscribers.get(None, []) + self.subscribers.get(
+                event.hiveID, []
+            )
+            for callback in callbacks:
+                try:
+                    result = callback(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    await self.log.error(e)
+
+    def addEntity(self, entity: tuple, data: dict):
+        """Add a precompiled entity for a node to the list.
+
+        Args:
+            entity (tuple): Precompiled entity from the entity factory.
+            data (dict): Node to create the entity from.
+        """
+        entityType, fixed, lookups = entity
+        kwargs = dict(fixed)
+        for name, getArgument in lookups:
+            kwargs[name] = getArgument(self, data)
+        self.addList(entityType, data, **kwargs)
+
+    def addEntities(self, entities: tuple, data: dict):
+        """Add each of the precompiled entities for a node to the list.
+
+        Args:
+            entities (tuple): Precompiled entities from the entity factory.
+            data (dict): Node to create the entities from.
+        """
+        for entity in entities:
+            self.addEntity(entity, data)
+
     async def updateInterval(self, new_interval: timedelta):
         """Update the scan interval.
 
@@ -221,8 +325,54 @@ class HiveSession:
         if "ExpiresIn" in data:
             self.tokens.tokenExpiry = timedelta(seconds=data["ExpiresIn"])
 
+        await self.storeTokens()
         return self.tokens
 
+    async def storeTokens(self):
+        """Save the session tokens and device keys to the token store."""
+        if self.tokenStore is None or not self.tokens.tokenData.get("refreshToken"):
+            return
+
+        try:
+            await self.tokenStore.save(
+                self.auth.username,
+                {
+                    "tokens": self.tokens.tokenData,
+                    "tokenCreated": self.tokens.tokenCreated.isoformat(),
+                    "tokenExpiry": self.tokens.tokenExpiry.total_seconds(),
+                    "device_data": [
+                        self.auth.device_group_key,
+                        self.auth.device_key,
+                        self.auth.device_password,
+                    ],
+                },
+            )
+        except Exception as e:
+            _LOGGER.warning("Unable to store Hive tokens - %s", e)
+
+    async def restoreTokens(self):
+        """Load the session tokens and device keys from the token store.
+
+        Returns:
+            boolean: True/False if tokens were restored.
+        """
+        if self.tokenStore is None:
+            return False
+
+        stored = await self.tokenStore.load(self.auth.username)
+        if not stored or not stored.get("tokens", {}).get("refreshToken"):
+            return False
+
+        self.tokens.tokenData.update(stored["tokens"])
+        self.tokens.tokenCreated = datetime.fromisoformat(stored["tokenCreated"])
+        self.tokens.tokenExpiry = timedelta(seconds=stored["tokenExpiry"])
+        device_data = stored.get("device_data") or [None, None, None]
+        if device_data[1] is not None:
+            self.auth.device_group_key = device_data[0]
+            self.auth.device_key = device_data[1]
+            self.auth.device_password = device_data[2]
+        return True
+
     async def login(self):
         """Login to hive account.
 
@@ -297,33 +447,78 @@ class HiveSession:
             self.tokens.tokenExpiry = timedelta(seconds=0)
         return result
 
-    async def hiveRefreshTokens(self):
+    async def hiveRefreshTokens(self, force: bool = False):
         """Refresh Hive tokens.
 
+        Callers arriving while a refresh is running wait for that refresh
+        instead of starting another.
+
+        Args:
+            force (bool, optional): Refresh even if the tokens have not expired. Defaults to False.
+
         Returns:
             boolean: True/False if update was successful
         """
-        result = None
-
         if self.config.file:
             return None
-        else:
-            expiry_time = self.tokens.tokenCreated + self.tokens.tokenExpiry
-            if datetime.now() >= expiry_time:
-                try:
-                    result = await self.auth.refresh_token(
-                        self.tokens.tokenData["refreshToken"]
-                    )
 
-                    if "AuthenticationResult" in result:
-                        await self.updateTokens(result)
-                except HiveFailedToRefreshTokens:
-                    await self.deviceLogin()
-                except HiveApiError:
-                    raise HiveApiError
+        expiry_time = self.tokens.tokenCreated + self.tokens.tokenExpiry
+        if self.tokenTask is None and not force and datetime.now() < expiry_time:
+            return None
+
+        return await sharedCall(self, "tokenTask", self.renewTokens)
+
+    async def renewTokens(self):
+        """Renew the Hive tokens using the refresh token.
+
+        Raises:
+            HiveApiError: An API error code has been returned.
+
+        Returns:
+            dict: Result of the refresh request.
+        """
+        result = None
+
+        try:
+            result = await self.auth.refresh_token(
+                self.tokens.tokenData["refreshToken"]
+            )
+
+            if "AuthenticationResult" in result:
+                await self.updateTokens(result)
+        except HiveFailedToRefreshTokens:
+            await self.deviceLogin()
+        except HiveApiError:
+            raise HiveApiError
+        finally:
+            self.tokenTask = None
 
         return result
 
+    def startTokenRefresh(
+        self, margin: float = 300, jitter: float = 0.1, retry_delay: float = 30
+    ):
+        """Renew the tokens in the background before they expire.
+
+        Args:
+            margin (float, optional): Seconds before expiry to renew the tokens. Defaults to 300.
+            jitter (float, optional): Fraction of the token lifetime to vary each renewal by. Defaults to 0.1.
+            retry_delay (float, optional): Seconds to wait after a failed renewal. Defaults to 30.
+        """
+        if self.config.file:
+            return
+        if self.tokenRefresher is None:
+            self.tokenRefresher = HiveTokenRefresher(
+                self, margin=margin, jitter=jitter, retry_delay=retry_delay
+            )
+        self.tokenRefresher.start()
+
+    async def stopTokenRefresh(self):
+        """Stop renewing the tokens in the background."""
+        if self.tokenRefresher is not None:
+            await self.tokenRefresher.stop()
+            self.tokenRefresher = None
+
     async def updateData(self, device: dict):
         """Get latest data for Hive nodes - rate limiting.
 
@@ -334,23 +529,201 @@ class HiveSession:
             boolean: True/False if update was successful
         """
         updated = False
-        ep = self.config.lastUpdate + self.config.scanInterval
-        if datetime.now() >= ep and not self.updateLock.locked():
-            try:
-                await self.updateLock.acquire()
-                await self.getDevices(device["hiveID"])
-                if len(self.deviceList["camera"]) > 0:
+        if self.config.scheduledPolling:
+            return updated
+
+        ep = self.config.lastUpdated + self.config.scanInterval
+        if datetime.now() >= ep or self.updateTask is not None:
+            updated = await self.refreshData(device["hiveID"])
+
+        return updated
+
+    async def refreshData(self, n_id: str):
+        """Get latest data for Hive nodes and cameras.
+
+        Concurrent callers share a single in-flight refresh and all
+        receive its result.
+
+        Args:
+            n_id (str): ID of the device requesting data.
+
+        Returns:
+            boolean: True/False if update was successful.
+        """
+        return await sharedCall(self, "updateTask", self.fetchData, n_id)
+
+    async def fetchData(self, n_id: str):
+        """Fetch latest data for Hive nodes and cameras.
+
+        Args:
+            n_id (str): ID of the device requesting data.
+
+        Returns:
+            boolean: True/False if update was successful.
+        """
+        try:
+            async with self.updateLock:
+                deadline = self.getDeadline()
+                updated = await self.getDevices(n_id, deadline)
+                if len(self.deviceList.get("camera", [])) > 0:
                     for camera in self.data.camera:
-                        await self.getCamera(self.devices[camera])
-                updated = True
-            finally:
-                self.updateLock.release()
+                        await self.getCamera(self.devices[camera], deadline)
+        finally:
+            self.updateTask = None
 
         return updated
 
-    async def getAlarm(self):
+    async def startPolling(
+        self, jitter: float = 0.1, offset: float = None, rate_limiter: object = None
+    ):
+        """Poll the Hive data in the background instead of on entity updates.
+
+        Args:
+            jitter (float, optional): Fraction of the scan interval to vary each poll by. Defaults to 0.1.
+            offset (float, optional): Seconds to wait before the first poll. Defaults to a random offset.
+            rate_limiter (object, optional): HiveRateLimiter shared with other sessions. Defaults to None.
+        """
+        if self.poller is None:
+            self.poller = HivePoller(jitter=jitter, rate_limiter=rate_limiter)
+        self.poller.addSession(self, offset)
+
+    async def stopPolling(self):
+        """Stop polling the Hive data in the background."""
+        if self.poller is not None:
+            await self.poller.stop()
+            self.poller = None
+
+    def getDeadline(self, deadline: float = None):
+        """Get the deadline of a call, defaulting to the configured request deadline.
+
+        Args:
+            deadline (float, optional): time.monotonic() time to finish by. Defaults to None.
+
+        Returns:
+            float: time.monotonic() time to finish by, or None for no deadline.
+        """
+        if deadline is None and self.config.requestDeadline:
+            deadline = time.monotonic() + self.config.requestDeadline
+        return deadline
+
+    async def writeState(
+        self, n_type: str, n_id: str, deadline: float = None, **kwargs
+    ):
+        """Write new state to a node and refresh the Hive data.
+
+        When a write delay is configured, writes from an event loop are
+        queued so that the writes to a node within the delay are sent as one.
+
+        Args:
+            n_type (str): Type of the node.
+            n_id (str): ID of the node.
+            deadline (float, optional): time.monotonic() time to finish by. Defaults to the request deadline.
+
+        Returns:
+            dict: API response for the write.
+        """
+        if self.config.writeDelay > 0 and inEventLoop():
+            return await self.writeQueue.add(n_type, n_id, **kwargs)
+
+        deadline = self.getDeadline(deadline)
+        resp = await self.api.setState(n_type, n_id, deadline=deadline, **kwargs)
+        if resp["original"] == 200:
+            await self.refreshWritten({n_id: kwargs}, deadline)
+
+        return resp
+
+    async def refreshWritten(self, written: dict, deadline: float = None):
+        """Bring the Hive data up to date after successful writes.
+
+        In optimistic mode the written fields are applied to the local data
+        and confirmed by the next poll, otherwise the written product and
+        the thermostat or TRV linked to it are fetched again.
+
+        Args:
+            written (dict): Written fields keyed by node id.
+            deadline (float, optional): time.monotonic() time to finish by. Defaults to the request deadline.
+        """
+        if not self.config.optimisticUpdate:
+            n_id = next(iter(written))
+            product = self.data.products.get(n_id)
+            if len(written) > 1 or product is None:
+                await self.getDevices(n_id, deadline)
+                return
+
+            try:
+                device = self.helper.getDeviceData(product)
+            except KeyError:
+                device = product
+            await self.refreshNode(product["type"], n_id, deadline)
+            if device.get("id", n_id) != n_id:
+                await self.refreshNode(device["type"], device["id"], deadline)
+            return
+
+        for n_id, fields in written.items():
+            self.applyState(n_id, fields)
+            self.data.pending[n_id] = {"fields": fields, "time": datetime.now()}
+
+    def applyState(self, n_id: str, fields: dict):
+        """Apply written fields to the local product data.
+
+        Args:
+            n_id (str): ID of the product which was written to.
+            fields (dict): Fields sent to the Hive API.
+        """
+        product = self.data.products.get(n_id)
+        if product is None:
+            return
+
+        state = product.setdefault("state", {})
+        props = product.setdefault("props", {})
+        for key, value in fields.items():
+            if key in NUMERIC_STATE_FIELDS:
+                value = float(value)
+                if value.is_integer():
+                    value = int(value)
+
+            if key == "autoBoost":
+                props.setdefault("autoBoost", {})["active"] = value == "ENABLED"
+                continue
+            if key == "mode" and value != state.get("mode"):
+                if value == "BOOST":
+                    props["previous"] = {
+                        "mode": state.get("mode"),
+                        "target": state.get("target"),
+                    }
+                elif state.get("mode") == "BOOST":
+                    state["boost"] = False
+            state[key] = value
+
+    def expiredPending(self, started: datetime):
+        """Check for optimistic writes made before a fetch started.
+
+        Args:
+            started (datetime): Time the fetch of the Hive data started.
+
+        Returns:
+            boolean: True if a fetch should have confirmed a pending write.
+        """
+        return any(pending["time"] < started for pending in self.data.pending.values())
+
+    def reconcilePending(self, started: datetime):
+        """Drop optimistic writes confirmed by a fetch and reapply the rest.
+
+        Args:
+            started (datetime): Time the fetch of the Hive data started.
+        """
+        for pending_id, pending in list(self.data.pending.items()):
+            if pending["time"] < started:
+                self.data.pending.pop(pending_id)
+            else:
+                self.applyState(pending_id, pending["fields"])
+
+    async def getAlarm(self, deadline: float = None):
         """Get alarm data.
 
+        Args:
+            deadline (float, optional): time.monotonic() time to finish by. Defaults to None.
+
         Raises:
             HTTPException: HTTP error has occurred updating the devices.
             HiveApiError: An API error code has been returned.
@@ -358,7 +731,7 @@ class HiveSession:
         if self.config.file:
             api_resp_d = self.openFile("alarm.json")
         elif self.tokens is not None:
-            api_resp_d = await self.api.getAlarm()
+            api_resp_d = await self.api.getAlarm(deadline=deadline)
             if operator.contains(str(api_resp_d["original"]), "20") is False:
                 raise HTTPException
             elif api_resp_d["parsed"] is None:
@@ -366,9 +739,13 @@ class HiveSession:
 
         self.data.alarm = api_resp_d["parsed"]
 
-    async def getCamera(self, device):
+    async def getCamera(self, device, deadline: float = None):
         """Get camera data.
 
+        Args:
+            device (dict): Camera device.
+            deadline (float, optional): time.monotonic() time to finish by. Defaults to the request deadline.
+
         Raises:
             HTTPException: HTTP error has occurred updating the devices.
             HiveApiError: An API error code has been returned.
@@ -382,13 +759,16 @@ class HiveSession:
             cameraImage = self.openFile("camera.json")
             cameraRecording = self.openFile("camera.json")
         elif self.tokens is not None:
-            cameraImage = await self.api.getCameraImage(device)
+            deadline = self.getDeadline(deadline)
+            cameraImage = await self.api.getCameraImage(device, deadline=deadline)
             hasCameraRecording = bool(
                 cameraImage["parsed"]["events"][0]["hasRecording"]
             )
             if hasCameraRecording:
                 cameraRecording = await self.api.getCameraRecording(
-                    device, cameraImage["parsed"]["events"][0]["eventId"]
+                    device,
+                    cameraImage["parsed"]["events"][0]["eventId"],
+                    deadline=deadline,
                 )
 
             if operator.contains(str(cameraImage["original"]), "20") is False:
@@ -414,11 +794,66 @@ class HiveSession:
                 "parsed"
             ]
 
-    async def getDevices(self, n_id: str):
+    @staticmethod
+    def iterNodes(nodes: any):
+        """Iterate over nodes from the Hive API.
+
+        Args:
+            nodes (any): List of nodes, or nodes keyed by id when streamed.
+
+        Returns:
+            iterable: The nodes.
+        """
+        return nodes.values() if isinstance(nodes, dict) else nodes
+
+    @staticmethod
+    def mergeNodes(current: dict, latest: dict, changes: dict = None):
+        """Merge the latest nodes into the current node data in place.
+
+        Only nodes which differ from the latest data are touched, so
+        unchanged nodes keep their existing objects.
+
+        Args:
+            current (dict): Current nodes keyed by id, updated in place.
+            latest (dict): Latest nodes from the Hive API keyed by id.
+            changes (dict, optional): Filled with the field changes of each changed node. Defaults to None.
+
+        Returns:
+            set: IDs of the nodes which were added, changed or removed.
+        """
+        changed = set()
+
+        for n_id in [n_id for n_id in current if n_id not in latest]:
+            removed = current.pop(n_id)
+            changed.add(n_id)
+            if changes is not None:
+                changes[n_id] = HiveHelper.diffNode(removed, {})
+
+        for n_id, node in latest.items():
+            existing = current.get(n_id)
+            if existing is None:
+                current[n_id] = node
+                changed.add(n_id)
+                if changes is not None:
+                    changes[n_id] = HiveHelper.diffNode({}, node)
+            elif existing != node:
+                if changes is not None:
+                    changes[n_id] = HiveHelper.diffNode(existing, node)
+                for key in [key for key in existing if key not in node]:
+                    existing.pop(key)
+                for key, value in node.items():
+                    if existing.get(key) != value:
+                        existing[key] = value
+                changed.add(n_id)
+
+        return changed
+
+    async def getDevices(self, n_id: str, deadline: float = None):
         """Get latest data for Hive nodes.
 
         Args:
             n_id (str): ID of the device requesting data.
+            deadline (float, optional): time.monotonic() time to finish by. Defaults to the request deadline.
 
         Raises:
             HTTPException: HTTP error has occurred updating the devices.
@@ -429,13 +864,33 @@ class HiveSession:
         """
         get_nodes_successful = False
         api_resp_d = None
+        events = []
+        started = datetime.now()
+        deadline = self.getDeadline(deadline)
 
         try:
             if self.config.file:
                 api_resp_d = self.openFile("data.json")
             elif self.tokens is not None:
                 await self.hiveRefreshTokens()
-                api_resp_d = await self.api.getAll()
+                api_resp_d = await self.api.getAll(self.config.streamNodes, deadline)
+                notModified = api_resp_d.get("original") == HTTP_NOT_MODIFIED
+                if notModified and self.expiredPending(started):
+                    # Hive has not applied the optimistic writes, so fetch its
+                    # state in full to replace them.
+                    self.api.clearValidators()
+                    api_resp_d = await self.api.getAll(
+                        self.config.streamNodes, deadline
+                    )
+                if api_resp_d.get("original") == HTTP_NOT_MODIFIED:
+                    # Nothing has changed since the last poll.
+                    self.changedNodes = set()
+                    self.reconcilePending(started)
+                    if self.config.alarm:
+                        await self.getAlarm(deadline)
+                    self.config.lastUpdated = datetime.now()
+                    get_nodes_successful = True
+                    return get_nodes_successful
                 if operator.contains(str(api_resp_d["original"]), "20") is False:
                     raise HTTPException
                 elif api_resp_d["parsed"] is None:
@@ -451,35 +906,169 @@ class HiveSession:
                     self.data.user = api_resp_p[hiveType]
                     self.config.userID = api_resp_p[hiveType]["id"]
                 if hiveType == "products":
-                    for aProduct in api_resp_p[hiveType]:
+                    for aProduct in self.iterNodes(api_resp_p[hiveType]):
                         tmpProducts.update({aProduct["id"]: aProduct})
                 if hiveType == "devices":
-                    for aDevice in api_resp_p[hiveType]:
+                    for aDevice in self.iterNodes(api_resp_p[hiveType]):
                         tmpDevices.update({aDevice["id"]: aDevice})
                         if aDevice["type"] == "siren":
                             self.config.alarm = True
                         # if aDevice["type"] == "hivecamera":
                         #    await self.getCamera(aDevice)
                 if hiveType == "actions":
-                    for aAction in api_resp_p[hiveType]:
+                    for aAction in self.iterNodes(api_resp_p[hiveType]):
                         tmpActions.update({aAction["id"]: aAction})
                 if hiveType == "homes":
                     self.config.homeID = api_resp_p[hiveType]["homes"][0]["id"]
 
-            if len(tmpProducts) > 0:
-                self.data.products = copy.deepcopy(tmpProducts)
-            if len(tmpDevices) > 0:
-                self.data.devices = copy.deepcopy(tmpDevices)
-            self.data.actions = copy.deepcopy(tmpActions)
+            if self.config.incrementalUpdate:
+                changed = set()
+                for nodeType, latest in (
+                    ("products", tmpProducts),
+                    ("devices", tmpDevices),
+                    ("actions", tmpActions),
+                ):
+                    if len(latest) == 0 and nodeType != "actions":
+                        continue
+                    changes = {} if self.subscribers else None
+                    changed |= self.mergeNodes(self.data[nodeType], latest, changes)
+                    for changedID, fields in (changes or {}).items():
+                        events.append(NodeChange(changedID, nodeType, fields))
+                self.changedNodes = changed
+            else:
+                if len(tmpProducts) > 0:
+                    self.data.products = copy.deepcopy(tmpProducts)
+                if len(tmpDevices) > 0:
+                    self.data.devices = copy.deepcopy(tmpDevices)
+                self.data.actions = copy.deepcopy(tmpActions)
+                self.changedNodes = (
+                    set(self.data.products)
+                    | set(self.data.devices)
+                    | set(self.data.actions)
+                )
+            if self.changedNodes:
+                self.helper.buildIndexes()
+            self.reconcilePending(started)
             if self.config.alarm:
-                await self.getAlarm()
-            self.config.lastUpdate = datetime.now()
+                await self.getAlarm(deadline)
+            self.config.lastUpdated = datetime.now()
             get_nodes_successful = True
-        except (OSError, RuntimeError, HiveApiError, ConnectionError, HTTPException):
+        except (
+            OSError,
+            RuntimeError,
+            HiveApiError,
+            ConnectionError,
+            HTTPException,
+        ):
             get_nodes_successful = False
+        finally:
+            if not get_nodes_successful and not self.config.file:
+                # Fetch everything next time, the last response may not be applied.
+                self.api.clearValidators()
+
+        if get_nodes_successful and events:
+            await self.notifySubscribers(events)
 
         return get_nodes_successful
 
+    async def refreshNode(self, n_type: str, n_id: str, deadline: float = None):
+        """Get latest data for a single Hive product or device.
+
+        Falls back to updating all nodes when the node can not be fetched
+        on its own.
+
+        Args:
+            n_type (str): Type of the node.
+            n_id (str): ID of the node.
+            deadline (float, optional): time.monotonic() time to finish by. Defaults to the request deadline.
+
+        Returns:
+            boolean: True/False if update was successful.
+        """
+        deadline = self.getDeadline(deadline)
+        if self.config.file or self.tokens is None:
+            return await self.getDevices(n_id, deadline)
+
+        if self.data.products.get(n_id, {}).get("type") == n_type:
+            nodeType = "products"
+        elif n_id in self.data.devices:
+            nodeType = "devices"
+        else:
+            return await self.getDevices(n_id, deadline)
+
+        started = datetime.now()
+        try:
+            await self.hiveRefreshTokens()
+            api_resp_d = await self.api.getNode(n_type, n_id, deadline)
+            if operator.contains(str(api_resp_d.get("original")), "20") is False:
+                raise HTTPException
+            node = api_resp_d["parsed"]
+            if isinstance(node, list):
+                node = next((item for item in node if item.get("id") == n_id), None)
+            if not isinstance(node, dict) or node.get("id") != n_id:
+                raise HiveApiError
+        except (
+            OSError,
+            RuntimeError,
+            HiveApiError,
+            ConnectionError,
+            HTTPException,
+        ):
+            return await self.getDevices(n_id, deadline)
+
+        current = self.data[nodeType]
+        nodes = {n_id: current[n_id]} if n_id in current else {}
+        changes = {} if self.subscribers else None
+        if self.mergeNodes(nodes, {n_id: node}, changes):
+            current[n_id] = nodes[n_id]
+            self.changedNodes = {n_id}
+            self.helper.buildIndexes()
+
+        pending = self.data.pending.get(n_id)
+        if pending is not None:
+            if pending["time"] < started:
+                self.data.pending.pop(n_id)
+            else:
+                self.applyState(n_id, pending["fields"])
+
+        if changes:
+            await self.notifySubscribers(
+                [NodeChange(n_id, nodeType, fields) for fields in changes.values()]
+            )
+
+        return True
+
+    def refreshAllEntities(self):
+        """Read every entity from the current Hive data in one pass.
+
+        The entities in the device list are left unchanged and offline
+        entities are returned with their online flag updated.
+
+        Returns:
+            dict: Entity data keyed by entity type.
+        """
+        snapshot = {}
+        for entityType, entities in self.deviceList.items():
+            readEntity = ENTITY_READERS.get(entityType)
+            if readEntity is None:
+                continue
+            reader = readEntity(self)
+            snapshot[entityType] = []
+            for entity in entities:
+                try:
+                    online = self.attr.readOnline(entity["device_id"])
+                    if online or entity["hiveType"] in ("Availability", "Connectivity"):
+                        entity = reader(entity)
+                    else:
+                        entity = dict(
+                            entity, deviceData=dict(entity["deviceData"], online=online)
+                        )
+                except Exception as e:
+                    _LOGGER.error("Unable to read %s - %s", entity.get("haName"), e)
+                snapshot[entityType].append(entity)
+
+        return snapshot
+
     async def startSession(self, config: dict = {}):
         """Setup the Hive platform.
 
@@ -497,8 +1086,34 @@ class HiveSession:
         await self.updateInterval(
             config.get("options", {}).get("scan_interval", self.config.scanInterval)
         )
+        self.config.writeDelay = config.get("options", {}).get(
+            "write_delay", self.config.writeDelay
+        )
+        self.config.optimisticUpdate = config.get("options", {}).get(
+            "optimistic_update", self.config.optimisticUpdate
+        )
+        self.config.backgroundTokenRefresh = config.get("options", {}).get(
+            "background_token_refresh", self.config.backgroundTokenRefresh
+        )
+        self.auth.native_client = config.get("options", {}).get(
+            "native_cognito", self.auth.native_client
+        )
+        if "retry_policy" in config.get("options", {}):
+            self.api.retryPolicy = config["options"]["retry_policy"]
+        if "timeouts" in config.get("options", {}):
+            self.api.setTimeouts(**config["options"]["timeouts"])
+        self.config.requestDeadline = config.get("options", {}).get(
+            "request_deadline", self.config.requestDeadline
+        )
 
         if config != {}:
+            if "token_store" in config and not self.config.file:
+                self.tokenStore = (
+                    HiveFileTokenStore(config["token_store"])
+                    if isinstance(config["token_store"], (str, bytes))
+                    else config["token_store"]
+                )
+
             if "tokens" in config and not self.config.file:
                 await self.updateTokens(config["tokens"], False)
 
@@ -514,7 +1129,8 @@ class HiveSession:
                 self.auth.device_password = config["device_data"][2]
 
             if not self.config.file and "tokens" not in config:
-                raise HiveUnknownConfiguration
+                if not await self.restoreTokens():
+                    raise HiveUnknownConfiguration
 
         try:
             await self.getDevices("No_ID")
@@ -524,6 +1140,9 @@ class HiveSession:
         if self.data.devices == {} or self.data.products == {}:
             raise HiveReauthRequired
 
+        if self.config.backgroundTokenRefresh:
+            self.startTokenRefresh()
+
         return await self.createDevices()
 
     async def createDevices(self):
@@ -549,17 +1168,16 @@ class HiveSession:
                 break
         for aDevice in self.data["devices"]:
             d = self.data.devices[aDevice]
-            device_list = DEVICES.get(self.data.devices[aDevice]["type"], [])
-            for code in device_list:
-                eval("self." + code)
+            device_list = DEVICE_ENTITIES.get(self.data.devices[aDevice]["type"], ())
+            self.addEntities(device_list, d)
 
             if self.data["devices"][aDevice]["type"] in hive_type:
                 self.config.battery.append(d["id"])
 
         if "action" in HIVE_TYPES["Switch"]:
             for action in self.data["actions"]:
-                a = self.data["actions"][action]  # noqa: F841
-                eval("self." + ACTIONS)
+                a = self.data["actions"][action]
+                self.addEntities(ACTION_ENTITIES, a)
 
         hive_type = HIVE_TYPES["Heating"] + HIVE_TYPES["Switch"] + HIVE_TYPES["Light"]
         for aProduct in self.data.products:
@@ -572,12 +1190,14 @@ class HiveSession:
                 and self.data.products[aProduct]["type"] not in HIVE_TYPES["Heating"]
             ):
                 continue
-            product_list = PRODUCTS.get(self.data.products[aProduct]["type"], [])
+            product_list = PRODUCT_ENTITIES.get(
+                self.data.products[aProduct]["type"], ()
+            )
             product_name = self.data.products[aProduct]["state"].get("name", "Unknown")
-            for code in product_list:
+            for entity in product_list:
                 try:
-                    eval("self." + code)
-                except (NameError, AttributeError) as e:
+                    self.addEntity(entity, p)
+                except (KeyError, AttributeError) as e:
                     self.logger.warning(f"Device {product_name} cannot be setup - {e}")
 
             if self.data.products[aProduct]["type"] in hive_type:
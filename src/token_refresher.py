@@ -0,0 +1,75 @@
+"""Hive Token Refresher Module."""
+
+# pylint: skip-file
+import random
+from datetime import datetime
+
+from .helper.hive_tasks import sleep, startTask, stopTask
+
+
+class HiveTokenRefresher:
+    """Background task which renews the session tokens before they expire.
+
+    Each renewal is brought forward by a margin and a random jitter, so
+    commands rarely have to wait for a token refresh.
+
+    Returns:
+        object: Token refresher object.
+    """
+
+    def __init__(
+        self,
+        session: object,
+        margin: float = 300,
+        jitter: float = 0.1,
+        retry_delay: float = 30,
+    ):
+        """Initialise the token refresher.
+
+        Args:
+            session (object): Session to keep the tokens of.
+            margin (float, optional): Seconds before expiry to renew the tokens. Defaults to 300.
+            jitter (float, optional): Fraction of the token lifetime to vary each renewal by. Defaults to 0.1.
+            retry_delay (float, optional): Seconds to wait after a failed renewal. Defaults to 30.
+        """
+        self.session = session
+        self.margin = margin
+        self.jitter = jitter
+        self.retryDelay = retry_delay
+        self.task = None
+
+    def start(self):
+        """Start renewing the tokens in the background."""
+        if self.task is None:
+            self.task = startTask(self.refreshLoop)
+
+    async def stop(self):
+        """Stop renewing the tokens in the background."""
+        task, self.task = self.task, None
+        if task is not None:
+            await stopTask(task)
+
+    def nextDelay(self):
+        """Get the delay before the tokens should be renewed.
+
+        Returns:
+            float: Seconds until the next renewal.
+        """
+        tokens = self.session.tokens
+        expiry_time = tokens.tokenCreated + tokens.tokenExpiry
+        lifetime = tokens.tokenExpiry.total_seconds()
+        delay = (expiry_time - datetime.now()).total_seconds() - self.margin
+        return max(0, delay - random.uniform(0, self.jitter * lifetime))
+
+    async def refreshLoop(self):
+        """Renew the tokens until stopped."""
+        while True:
+            await sleep(self.nextDelay())
+            try:
+                await self.session.hiveRefreshTokens(force=True)
+            except Exception as e:
+                await self.session.log.error(e)
+                await sleep(self.retryDelay)
+                continue
+            if self.nextDelay() == 0:
+                await sleep(self.retryDelay)
@@ -0,0 +1,175 @@
+"""Hive Token Store Module."""
+
+# pylint: skip-file
+import hashlib
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from os.path import expanduser
+
+from .helper.hive_tasks import runBlocking
+
+
+class HiveTokenStore(ABC):
+    """Base class for storing session tokens between restarts.
+
+    Returns:
+        object: Token store object.
+    """
+
+    @abstractmethod
+    async def load(self, username: str):
+        """Load the stored tokens of an account.
+
+        Args:
+            username (str): Hive username.
+
+        Returns:
+            dict: Stored tokens, or None if there are none.
+        """
+
+    @abstractmethod
+    async def save(self, username: str, data: dict):
+        """Store the tokens of an account.
+
+        Args:
+            username (str): Hive username.
+            data (dict): Tokens to store.
+        """
+
+    @abstractmethod
+    async def clear(self, username: str):
+        """Remove the stored tokens of an account.
+
+        Args:
+            username (str): Hive username.
+        """
+
+
+class HiveFileTokenStore(HiveTokenStore):
+    """Token store which keeps encrypted tokens in files.
+
+    Each account is stored as JSON in its own file, encrypted with Fernet
+    using a key the caller keeps outside the store, e.g. one made with
+    cryptography.fernet.Fernet.generate_key(). The files are also only
+    readable by the current user (mode 0600) in a directory only the current
+    user can open (mode 0700). Requires the cryptography package.
+
+    Returns:
+        object: File token store object.
+    """
+
+    def __init__(self, key: any, path: str = None):
+        """Initialise the file token store.
+
+        Args:
+            key (any): Fernet key as str or bytes.
+            path (str, optional): Directory to store the tokens in. Defaults to ~/.pyhiveapi.
+        """
+        from cryptography.fernet import Fernet
+
+        self.fernet = Fernet(key)
+        self.path = path or os.path.join(expanduser("~"), ".pyhiveapi")
+
+    async def load(self, username: str):
+        """Load the stored tokens of an account.
+
+        Args:
+            username (str): Hive username.
+
+        Returns:
+            dict: Stored tokens, or None if there are none or they can not be read.
+        """
+        return await runBlocking(self.read, username)
+
+    async def save(self, username: str, data: dict):
+        """Store the tokens of an account.
+
+        Args:
+            username (str): Hive username.
+            data (dict): Tokens to store.
+        """
+        await runBlocking(self.write, username, data)
+
+    async def clear(self, username: str):
+        """Remove the stored tokens of an account.
+
+        Args:
+            username (str): Hive username.
+        """
+        await runBlocking(self.remove, username)
+
+    def filePath(self, username: str):
+        """Get the file the tokens of an account are stored in.
+
+        Args:
+            username (str): Hive username.
+
+        Returns:
+            str: Path of the token file.
+        """
+        name = hashlib.sha256(username.lower().encode("utf-8")).hexdigest()
+        return os.path.join(self.path, name + ".tokens")
+
+    def read(self, username: str):
+        """Read and decrypt the stored tokens of an account.
+
+        Args:
+            username (str): Hive username.
+
+        Returns:
+            dict: Stored tokens, or None if there are none or they can not be read.
+        """
+        from cryptography.fernet import InvalidToken
+
+        try:
+            with open(self.filePath(username), "rb") as token_file:
+                return json.loads(self.fernet.decrypt(token_file.read()))
+        except (OSError, ValueError, InvalidToken):
+            return None
+
+    def write(self, username: str, data: dict):
+        """Encrypt and write the tokens of an account.
+
+        Args:
+            username (str): Hive username.
+            data (dict): Tokens to store.
+        """
+        content = self.fernet.encrypt(json.dumps(data).encode("utf-8"))
+        self.writeFile(self.filePath(username), content)
+
+    def remove(self, username: str):
+        """Remove the token file of an account.
+
+        Args:
+            username (str): Hive username.
+        """
+        try:
+            os.remove(self.filePath(username))
+        except FileNotFoundError:
+            pass
+
+    def writeFile(self, path: str, content: bytes):
+        """Replace a file readable only by the current user.
+
+        The store directory is made private if it already exists. The content
+        is written to a temporary file in the directory, which is created with
+        mode 0600, and then moved over the file.
+
+        Args:
+            path (str): Path of the file.
+            content (bytes): New file content.
+        """
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        os.chmod(self.path, 0o700)
+        tmp_file = tempfile.NamedTemporaryFile(
+            dir=self.path, suffix=".tmp", delete=False
+        )
+        try:
+            with tmp_file:
+                tmp_file.write(content)
+            os.replace(tmp_file.name, path)
+        except Exception:
+            os.remove(tmp_file.name)
+            raise
@@ -0,0 +1,111 @@
+"""Hive Write Queue Module."""
+
+# pylint: skip-file
+from .helper.hive_tasks import createFuture, gatherCalls, shield, sleep, startTask
+
+# Fields which only apply while a node is in a mode, keyed by the mode field.
+MODE_FIELDS = {
+    "mode": {"BOOST": ("boost", "target")},
+    "colourMode": {
+        "WHITE": ("colourTemperature",),
+        "COLOUR": ("hue", "saturation", "value"),
+    },
+}
+
+
+class HiveWriteQueue:
+    """Queue which batches node writes made within a short window.
+
+    Writes to the same node within the window are merged into one, so a
+    brightness and a colour temperature set together are sent together.
+    Fields of a mode which a later write leaves are dropped, so a boost
+    which is cancelled straight away never reaches Hive. The Hive data is
+    refreshed once after each batch.
+
+    Returns:
+        object: Write queue object.
+    """
+
+    def __init__(self, session: object = None):
+        """Initialise the write queue.
+
+        Args:
+            session (object, optional): Session to interact with Hive account. Defaults to None.
+        """
+        self.session = session
+        self.pending = {}
+        self.flushTask = None
+
+    async def add(self, n_type: str, n_id: str, **kwargs):
+        """Queue new state for a node.
+
+        Args:
+            n_type (str): Type of the node.
+            n_id (str): ID of the node.
+
+        Returns:
+            dict: API response for the merged write to the node.
+        """
+        write = self.pending.get(n_id)
+        if write is None:
+            write = {"result": createFuture(), "fields": {}}
+            self.pending[n_id] = write
+        write["type"] = n_type
+        self.mergeFields(write["fields"], kwargs)
+
+        if self.flushTask is None:
+            self.flushTask = startTask(self.flushLater)
+
+        return await shield(write["result"])
+
+    @staticmethod
+    def mergeFields(queued: dict, fields: dict):
+        """Merge new fields into the fields queued for a node.
+
+        Args:
+            queued (dict): Fields queued for the node, updated in place.
+            fields (dict): New fields for the node.
+        """
+        for key, modes in MODE_FIELDS.items():
+            mode = queued.get(key)
+            if key in fields and fields[key] != mode:
+                for field in modes.get(mode, ()):
+                    queued.pop(field, None)
+        queued.update(fields)
+
+    async def flushLater(self):
+        """Send the queued writes once the write window has passed."""
+        await sleep(self.session.config.writeDelay)
+        self.flushTask = None
+        await self.flush()
+
+    async def flush(self):
+        """Send the queued writes and refresh the Hive data once."""
+        writes, self.pending = self.pending, {}
+        if not writes:
+            return
+
+        deadline = self.session.getDeadline()
+
+        def send(n_id: str):
+            write = writes[n_id]
+            return self.session.api.setState(
+                write["type"], n_id, deadline=deadline, **write["fields"]
+            )
+
+        results = await gatherCalls(send, list(writes))
+
+        written = {
+            n_id: write["fields"]
+            for (n_id, write), resp in zip(writes.items(), results)
+            if isinstance(resp, dict) and resp.get("original") == 200
+        }
+        try:
+            if written:
+                await self.session.refreshWritten(written, deadline)
+        finally:
+            for write, resp in zip(writes.values(), results):
+                if isinstance(resp, BaseException):
+                    write["result"].set_exception(resp)
+                else:
+                    write["result"].set_result(resp)
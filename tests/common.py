@@ -1,6 +1,7 @@
 """Mock services for tests."""
 
 # pylint: skip-file
+import json
 
 
 class MockConfig:
@@ -9,3 +10,102 @@ class MockConfig:
 
 class MockDevice:
     """Mock Device for tests."""
+
+
+class MockLogger:
+    """Mock logger which records errors."""
+
+    def __init__(self):
+        """Initialise the mock logger."""
+        self.errors = []
+
+    def error(self, message):
+        """Record an error."""
+        self.errors.append(message)
+
+
+class MockSession:
+    """Mock Hive session with a token for API requests."""
+
+    def __init__(self, token="token"):
+        """Initialise the mock session."""
+        self.tokens = MockConfig()
+        self.tokens.tokenData = {"token": token}
+        self.logger = MockLogger()
+
+
+class MockContent:
+    """Mock response content which counts the bytes read."""
+
+    def __init__(self, body=b""):
+        """Initialise the mock content."""
+        self.body = body
+        self.total_bytes = 0
+
+    async def read(self):
+        """Read the whole body."""
+        self.total_bytes = len(self.body)
+        return self.body
+
+    async def iter_chunked(self, size):
+        """Read the body in chunks."""
+        for start in range(0, len(self.body), size):
+            chunk = self.body[start:][:size]
+            self.total_bytes += len(chunk)
+            yield chunk
+
+
+class MockResponse:
+    """Mock aiohttp response."""
+
+    def __init__(self, status=200, body=b"", headers=None, content_length=None):
+        """Initialise the mock response."""
+        self.status = status
+        self.headers = headers or {}
+        self.content = MockContent(body)
+        self.content_length = content_length
+
+    async def read(self):
+        """Read the whole body."""
+        return await self.content.read()
+
+    async def text(self):
+        """Read the body as text."""
+        return (await self.read()).decode("utf-8")
+
+    async def json(self, content_type=None):
+        """Read the body as JSON."""
+        return json.loads(await self.text())
+
+    async def __aenter__(self):
+        """Enter the response context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Leave the response context."""
+        return False
+
+
+class MockWebsession:
+    """Mock aiohttp session which returns queued responses."""
+
+    def __init__(self, *responses):
+        """Initialise the mock websession."""
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        """Record a request and return or raise the next queued response."""
+        self.requests.append((method, url, kwargs))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def get(self, url, **kwargs):
+        """Record a GET request and return the next queued response."""
+        return self.request("get", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """Record a POST request and return the next queued response."""
+        return self.request("post", url, **kwargs)
@@ -0,0 +1,95 @@
+"""Tests for the native Cognito client."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import ClientConnectionError
+
+from apyhiveapi.api.cognito_async import (
+    CognitoClientAsync,
+    CognitoClientError,
+    EndpointConnectionError,
+    NativeCognitoClient,
+)
+
+from .common import MockResponse, MockWebsession
+
+REGION = "eu-west-1"
+
+
+def call(*responses, operation="initiate_auth", **params):
+    """Call a Cognito operation with queued responses."""
+    websession = MockWebsession(*responses)
+    client = NativeCognitoClient(REGION, websession, timeout=5)
+
+    async def run():
+        return await client.call(operation, **params)
+
+    return websession, asyncio.run(run())
+
+
+def test_the_base_client_is_abstract():
+    """Test a client must say how it calls Cognito."""
+    with pytest.raises(TypeError):
+        CognitoClientAsync()  # pylint: disable=abstract-class-instantiated
+
+
+def test_operations_are_posted_as_json():
+    """Test the operation is named in the target header and sent as JSON."""
+    body = {"ChallengeName": "PASSWORD_VERIFIER"}
+    websession, result = call(
+        MockResponse(200, json.dumps(body).encode()),
+        AuthFlow="USER_SRP_AUTH",
+        ClientId="client",
+    )
+
+    method, url, kwargs = websession.requests[0]
+    assert result == body
+    assert method == "post"
+    assert url == "https://cognito-idp.eu-west-1.amazonaws.com/"
+    assert kwargs["headers"] == {
+        "Content-Type": "application/x-amz-json-1.1",
+        "X-Amz-Target": "AWSCognitoIdentityProviderService.InitiateAuth",
+    }
+    assert json.loads(kwargs["data"]) == {
+        "AuthFlow": "USER_SRP_AUTH",
+        "ClientId": "client",
+    }
+    assert kwargs["timeout"] == 5
+
+
+def test_error_types_are_raised_as_named_classes():
+    """Test an error is raised as a class named after its Cognito type."""
+    body = {
+        "__type": "com.amazonaws.cognito#NotAuthorizedException",
+        "message": "Incorrect username or password.",
+    }
+    errors = []
+    for _ in range(2):
+        with pytest.raises(CognitoClientError) as err:
+            call(
+                MockResponse(400, json.dumps(body).encode()),
+                operation="respond_to_auth_challenge",
+            )
+        errors.append(err.value)
+
+    assert errors[0].__class__.__name__ == "NotAuthorizedException"
+    assert errors[0].__class__ is errors[1].__class__
+    assert errors[0].code == "NotAuthorizedException"
+    assert errors[0].message == "Incorrect username or password."
+    assert errors[0].response == body
+
+
+def test_error_without_a_body_is_unknown():
+    """Test an error response without a JSON body still raises."""
+    with pytest.raises(CognitoClientError) as err:
+        call(MockResponse(500, b""))
+
+    assert err.value.__class__.__name__ == "UnknownError"
+
+
+def test_connection_errors_are_endpoint_errors():
+    """Test a failed connection raises an endpoint connection error."""
+    with pytest.raises(EndpointConnectionError):
+        call(ClientConnectionError("offline"))
@@ -0,0 +1,90 @@
+"""Tests for the slotted entity records."""
+
+import asyncio
+import copy
+
+import pytest
+
+from apyhiveapi import Hive
+from apyhiveapi.helper.hivedataclasses import Device
+
+USERNAME = "use@file.com"
+
+
+async def start_session():
+    """Start a session which reads its data from the bundled files."""
+    hive = Hive(username=USERNAME, password="password")
+    await hive.startSession({"username": USERNAME})
+    return hive
+
+
+def find(hive, entity_type, ha_name):
+    """Get a copy of an entity from the device list by its name."""
+    return next(
+        copy.deepcopy(entity)
+        for entity in hive.deviceList[entity_type]
+        if entity["haName"] == ha_name
+    )
+
+
+def test_device_reads_as_a_dict():
+    """Test a device behaves as the dict of the fields which are set."""
+    device = Device(hiveID="1", status={"state": "ON"})
+    device["isGroup"] = False
+
+    assert device == {"hiveID": "1", "status": {"state": "ON"}, "isGroup": False}
+    assert device.get("haName") is None
+    assert "haName" not in device
+    with pytest.raises(KeyError):
+        _ = device["haName"]
+
+    del device["isGroup"]
+    device.update(haName="Light")
+    assert dict(device) == {"hiveID": "1", "haName": "Light", "status": {"state": "ON"}}
+    assert not hasattr(device, "__dict__")
+
+
+def test_read_again_updates_the_device_in_place():
+    """Test an entity read again fills its earlier device and status dict."""
+
+    async def run():
+        hive = await start_session()
+        try:
+            light = await hive.light.getLight(find(hive, "light", "Light 6"))
+            status = light["status"]
+            product = hive.data.products[light["hiveID"]]
+            product["state"]["brightness"] = 15
+
+            again = await hive.light.getLight(light)
+            assert again is light
+            assert again["status"] is status
+            assert status["brightness"] == 15 / 100 * 255
+            assert again == hive.light.readLight(find(hive, "light", "Light 6"))
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_entities_of_one_node_keep_their_own_devices():
+    """Test entities sharing a node id are never filled into each other."""
+
+    async def run():
+        hive = await start_session()
+        try:
+            climate = await hive.heating.getClimate(find(hive, "climate", "TRV 1"))
+            before = dict(climate)
+            battery = await hive.sensor.getSensor(
+                find(hive, "sensor", "TRV 1 Battery Level")
+            )
+            battery = await hive.sensor.getSensor(battery)
+
+            assert battery is not climate
+            assert battery["hiveID"] == climate["hiveID"]
+            assert dict(climate) == before
+            climate = await hive.heating.getClimate(climate)
+            assert climate["hiveType"] == "trvcontrol"
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
@@ -0,0 +1,133 @@
+"""Tests for the Hive API requests."""
+
+import asyncio
+import json
+
+import pytest
+
+from apyhiveapi.api.hive_async_api import HiveApiAsync
+from apyhiveapi.api.hive_retry import BREAKERS
+from apyhiveapi.helper.const import HTTP_NOT_MODIFIED
+from apyhiveapi.helper.hive_exceptions import HiveApiError
+
+from .common import MockResponse, MockSession, MockWebsession
+
+NODES = {"products": [{"id": "product-1", "type": "heating"}], "devices": []}
+BODY = json.dumps(NODES).encode("utf-8")
+PARSED = {"products": {"product-1": NODES["products"][0]}, "devices": {}}
+
+
+class StreamedResponse(MockResponse):
+    """Mock response whose body may only be read as a stream."""
+
+    async def read(self):
+        """Refuse to read the whole body at once."""
+        raise AssertionError("The body was read whole")
+
+
+@pytest.fixture(autouse=True)
+def clear_breakers():
+    """Start each test with closed circuit breakers."""
+    BREAKERS.clear()
+    yield
+    BREAKERS.clear()
+
+
+def get_all(*responses, stream=True):
+    """Poll the nodes once for each response."""
+    websession = MockWebsession(*responses)
+    api = HiveApiAsync(MockSession(), websession)
+
+    async def run():
+        return [await api.getAll(stream=stream) for _ in responses]
+
+    return websession, asyncio.run(run())
+
+
+def test_validators_are_sent_and_not_modified_is_reported():
+    """Test the ETag is sent back and a 304 is reported as not modified."""
+    websession, results = get_all(
+        MockResponse(200, BODY, headers={"ETag": '"v1"'}),
+        MockResponse(304),
+    )
+
+    assert results[0] == {"original": 200, "parsed": PARSED}
+    assert results[1] == {"original": HTTP_NOT_MODIFIED, "parsed": None}
+    assert "If-None-Match" not in websession.requests[0][2]["headers"]
+    assert websession.requests[1][2]["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_last_modified_is_sent_back():
+    """Test the Last-Modified date is sent as If-Modified-Since."""
+    modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+    websession, _ = get_all(
+        MockResponse(200, BODY, headers={"Last-Modified": modified}),
+        MockResponse(304),
+    )
+
+    assert websession.requests[1][2]["headers"]["If-Modified-Since"] == modified
+
+
+def test_streamed_body_is_hashed_as_it_is_parsed():
+    """Test a body without validators is compared by its hash while streamed."""
+    changed = json.dumps(dict(NODES, devices=[{"id": "device-1"}])).encode()
+    websession, results = get_all(
+        StreamedResponse(200, BODY),
+        StreamedResponse(200, BODY),
+        StreamedResponse(200, changed),
+    )
+
+    assert results[0] == {"original": 200, "parsed": PARSED}
+    assert results[1] == {"original": HTTP_NOT_MODIFIED, "parsed": None}
+    assert results[2]["original"] == 200
+    assert list(results[2]["parsed"]["devices"]) == ["device-1"]
+    assert "If-None-Match" not in websession.requests[1][2]["headers"]
+
+
+def test_unstreamed_body_is_hashed():
+    """Test an unchanged body is found without streaming too."""
+    _, results = get_all(MockResponse(200, BODY), MockResponse(200, BODY), stream=False)
+
+    assert results[0] == {"original": 200, "parsed": NODES}
+    assert results[1] == {"original": HTTP_NOT_MODIFIED, "parsed": None}
+
+
+def test_endpoint_names():
+    """Test URLs are named by the longest matching endpoint."""
+    api = HiveApiAsync(MockSession(), MockWebsession())
+
+    assert api.endpointName(api.urls["all"]) == "all"
+    assert api.endpointName(api.urls["nodes"].format("heating", "id")) == "nodes"
+    assert api.endpointName(api.urls["alarm"] + "home-1") == "alarm"
+    assert api.endpointName("https://example.com/other/path?a=1") == "/other/path"
+
+
+def test_compressed_and_decompressed_bytes_are_counted():
+    """Test each endpoint counts its requests and body sizes, failures too."""
+    raw = MockResponse(200, BODY)
+    raw.content.total_raw_bytes = 10
+    websession = MockWebsession(
+        MockResponse(200, BODY, content_length=20),
+        raw,
+        MockResponse(404, b"missing"),
+    )
+    api = HiveApiAsync(MockSession(), websession)
+    url = api.urls["nodes"].format("heating", "id")
+
+    async def run():
+        await api.request("get", api.urls["all"])
+        await api.request("get", url)
+        with pytest.raises(HiveApiError):
+            await api.request("get", url)
+
+    asyncio.run(run())
+
+    assert api.transferStats == {
+        "all": {"requests": 1, "compressedBytes": 20, "decompressedBytes": len(BODY)},
+        "nodes": {
+            "requests": 2,
+            "compressedBytes": 10 + len(b"missing"),
+            "decompressedBytes": len(BODY) + len(b"missing"),
+        },
+    }
+    assert "Accept-Encoding" not in websession.requests[0][2]["headers"]
@@ -0,0 +1,52 @@
+"""Tests for the SRP calculations of the async auth."""
+
+import secrets
+
+import pytest
+
+from apyhiveapi.api.hive_auth_async import (
+    BIG_N,
+    G_VALUE,
+    MOD_POW_WINDOW,
+    mod_pow,
+)
+
+WINDOW_EXPONENTS = [
+    (1 << MOD_POW_WINDOW) - 1,
+    1 << MOD_POW_WINDOW,
+    (1 << MOD_POW_WINDOW) + 1,
+    (1 << 2 * MOD_POW_WINDOW) - 1,
+    1 << 2 * MOD_POW_WINDOW,
+]
+
+
+@pytest.mark.parametrize("exponent", [0, 1, 2, *WINDOW_EXPONENTS])
+def test_small_exponents_match_pow(exponent):
+    """Test exponents around the window boundaries match pow."""
+    for base in (0, 1, G_VALUE, BIG_N - 1, 12345678901234567890):
+        assert mod_pow(base, exponent, BIG_N) == pow(base, exponent, BIG_N)
+
+
+@pytest.mark.parametrize("bits", [256, 1024, 3072])
+def test_srp_sized_values_match_pow(bits):
+    """Test random exponents and bases of SRP sizes match pow."""
+    for _ in range(3):
+        base = secrets.randbelow(BIG_N)
+        exponent = secrets.randbits(bits)
+        assert mod_pow(base, exponent, BIG_N) == pow(base, exponent, BIG_N)
+        assert mod_pow(G_VALUE, exponent, BIG_N) == pow(G_VALUE, exponent, BIG_N)
+
+
+@pytest.mark.parametrize("window", [1, 3, 8, 64])
+def test_any_window_matches_pow(window):
+    """Test the result does not depend on the window size."""
+    exponent = secrets.randbits(1024)
+
+    assert mod_pow(7, exponent, BIG_N, window) == pow(7, exponent, BIG_N)
+
+
+def test_small_moduli_match_pow():
+    """Test a modulus of one and exponents of zero are reduced like pow."""
+    assert mod_pow(5, 0, 1) == pow(5, 0, 1) == 0
+    assert mod_pow(5, 0, 7) == pow(5, 0, 7) == 1
+    assert mod_pow(10, 257, 7) == pow(10, 257, 7)
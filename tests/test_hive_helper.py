@@ -0,0 +1,82 @@
+"""Tests for the helper lookups of linked nodes."""
+
+import asyncio
+import copy
+
+from apyhiveapi import Hive
+
+USERNAME = "use@file.com"
+
+
+async def start_session():
+    """Start a session which reads its data from the bundled files."""
+    hive = Hive(username=USERNAME, password="password")
+    await hive.startSession({"username": USERNAME})
+    return hive
+
+
+def product_of(hive, n_type):
+    """Get the first product of a type."""
+    return next(node for node in hive.data.products.values() if node["type"] == n_type)
+
+
+def test_device_data_uses_the_zone_and_trv_indexes():
+    """Test products are linked to their thermostat and TRV devices."""
+
+    async def run():
+        hive = await start_session()
+        heating = product_of(hive, "heating")
+        trv = product_of(hive, "trvcontrol")
+        try:
+            device = hive.helper.getDeviceData(heating)
+            assert device["type"] in ("thermostatui", "trv")
+            assert device["props"]["zone"] == heating["props"]["zone"]
+            assert hive.helper.getDeviceData(trv) is (
+                hive.data.devices[trv["props"]["trvs"][0]]
+            )
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_names_follow_node_changes():
+    """Test the name index is rebuilt when nodes change."""
+
+    async def run():
+        hive = await start_session()
+        heating = product_of(hive, "heating")
+        data = hive.openFile("data.json")
+        for product in data["parsed"]["products"]:
+            if product["id"] == heating["id"]:
+                product["state"]["name"] = "Renamed"
+        hive.openFile = lambda file: copy.deepcopy(data)
+        try:
+            assert hive.helper.getDeviceName("No_ID") == "Hive"
+            assert hive.helper.getDeviceName("unknown") == "unknown"
+
+            assert await hive.getDevices("No_ID")
+            assert hive.helper.getDeviceName(heating["id"]) == "Renamed"
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_heat_on_demand_device_is_the_zone_product():
+    """Test the TRV control product is linked to the product of its zone."""
+
+    async def run():
+        hive = await start_session()
+        heating = product_of(hive, "heating")
+        trv = product_of(hive, "trvcontrol")
+        try:
+            trv["state"]["zone"] = heating["id"]
+            assert hive.helper.getHeatOnDemandDevice({"HiveID": trv["id"]}) is heating
+
+            trv["state"]["zone"] = heating["props"]["zone"]
+            assert hive.helper.getHeatOnDemandDevice({"HiveID": trv["id"]}) is None
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
@@ -0,0 +1,156 @@
+"""Tests for the API retry policy and circuit breaker."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from aiohttp import ClientConnectionError
+
+from apyhiveapi.api.hive_async_api import HiveApiAsync
+from apyhiveapi.api.hive_retry import (
+    BREAKERS,
+    HiveCircuitBreaker,
+    HiveRetryPolicy,
+    get_circuit_breaker,
+)
+from apyhiveapi.helper.hive_exceptions import HiveApiError, HiveApiUnavailable
+
+from .common import MockResponse, MockSession, MockWebsession
+
+URL = "https://beekeeper.hivehome.com/1.0/nodes/all"
+
+
+@pytest.fixture(autouse=True)
+def clear_breakers():
+    """Start each test with closed circuit breakers."""
+    BREAKERS.clear()
+    yield
+    BREAKERS.clear()
+
+
+def request(*responses, method="GET", retries=2):
+    """Make a request which gets the given responses."""
+    websession = MockWebsession(*responses)
+    api = HiveApiAsync(
+        MockSession(),
+        websession,
+        retry_policy=HiveRetryPolicy(retries=retries, backoff=0),
+    )
+    return websession, asyncio.run(api.request(method, URL))
+
+
+def test_only_safe_requests_are_retried():
+    """Test throttling is retried for any method and errors only for safe ones."""
+    policy = HiveRetryPolicy()
+
+    assert policy.is_retryable("POST", 429)
+    assert policy.is_retryable("post", 503)
+    assert not policy.is_retryable("POST", 500)
+    assert not policy.is_retryable("POST")
+    assert policy.is_retryable("GET", 502)
+    assert policy.is_retryable("GET")
+    assert not policy.is_retryable("GET", 404)
+
+
+def test_delay_uses_backoff_and_retry_after():
+    """Test the delay is jittered backoff, at least as long as Retry-After."""
+    policy = HiveRetryPolicy(retries=2, backoff=1, max_backoff=3, max_retry_after=30)
+
+    assert 0 <= policy.delay(1, "GET", 500) <= 2
+    assert policy.delay(2, "GET", 500) is None
+    assert policy.delay(0, "POST", 500) is None
+    assert policy.delay(0, "POST", 429, {"Retry-After": "20"}) == 20
+    assert policy.delay(0, "POST", 429, {"Retry-After": "31"}) is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+    wait = policy.retry_after({"Retry-After": format_datetime(retry_at)})
+    assert 8 < wait <= 10
+    assert policy.retry_after({"Retry-After": "soon"}) is None
+    assert policy.retry_after(None) is None
+
+
+def test_breaker_opens_and_lets_a_trial_through():
+    """Test the breaker sheds requests once open until a trial succeeds."""
+    breaker = HiveCircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.failure()
+    breaker.check(URL)
+    breaker.failure()
+
+    assert breaker.is_open
+    with pytest.raises(HiveApiUnavailable):
+        breaker.check(URL)
+
+    breaker.opened_at -= 60
+    breaker.check(URL)
+    with pytest.raises(HiveApiUnavailable):
+        breaker.check(URL)
+
+    breaker.success()
+    assert not breaker.is_open
+    breaker.check(URL)
+
+
+def test_breakers_are_shared_per_host():
+    """Test every URL of a host shares one breaker."""
+    breaker = get_circuit_breaker(URL)
+
+    assert get_circuit_breaker("https://beekeeper.hivehome.com/1.0/devices") is breaker
+    assert get_circuit_breaker("https://sso.hivehome.com/") is not breaker
+
+
+def test_throttled_and_failed_requests_are_retried():
+    """Test a request is retried after throttling and connection errors."""
+    websession, resp = request(
+        MockResponse(429, headers={"Retry-After": "0"}),
+        ClientConnectionError(),
+        MockResponse(200, b"{}"),
+    )
+
+    assert resp.status == 200
+    assert len(websession.requests) == 3
+    assert not get_circuit_breaker(URL).is_open
+
+
+def test_unsafe_request_is_not_retried_after_a_server_error():
+    """Test a POST which may have been processed is not sent again."""
+    websession = MockWebsession(MockResponse(500), MockResponse(200))
+    api = HiveApiAsync(MockSession(), websession, HiveRetryPolicy(backoff=0))
+
+    with pytest.raises(HiveApiError):
+        asyncio.run(api.request("POST", URL))
+    assert len(websession.requests) == 1
+
+
+def test_open_breaker_sheds_requests():
+    """Test requests fail without being sent while the breaker is open."""
+    with pytest.raises(HiveApiError):
+        request(*(MockResponse(503) for _ in range(5)), retries=4)
+    assert get_circuit_breaker(URL).is_open
+
+    websession = MockWebsession(MockResponse(200))
+    api = HiveApiAsync(MockSession(), websession)
+    with pytest.raises(HiveApiUnavailable):
+        asyncio.run(api.request("GET", URL))
+    assert not websession.requests
+
+
+def test_timed_out_request_raises_api_error():
+    """Test a request which times out on every attempt raises HiveApiError."""
+    websession = MockWebsession(asyncio.TimeoutError(), asyncio.TimeoutError())
+    api = HiveApiAsync(MockSession(), websession, HiveRetryPolicy(retries=1, backoff=0))
+
+    with pytest.raises(HiveApiError):
+        asyncio.run(api.request("GET", URL))
+    assert len(websession.requests) == 2
+
+
+def test_passed_deadline_raises_api_error():
+    """Test a request is not sent once its deadline has passed."""
+    websession = MockWebsession(MockResponse(200))
+    api = HiveApiAsync(MockSession(), websession)
+
+    with pytest.raises(HiveApiError):
+        asyncio.run(api.request("GET", URL, deadline=time.monotonic() - 1))
+    assert not websession.requests
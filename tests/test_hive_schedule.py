@@ -0,0 +1,102 @@
+"""Tests for the compiled weekly schedules."""
+
+import copy
+from datetime import datetime
+
+import pytest
+
+from apyhiveapi.helper.hive_helper import SCHEDULE_CACHE_SIZE, HiveHelper
+from apyhiveapi.helper.hive_schedule import DAYS, HiveSchedule
+
+WEEKDAY = [{"start": 390, "value": {"target": 20}}, {"start": 1320, "value": {}}]
+SCHEDULE = {day: copy.deepcopy(WEEKDAY) for day in DAYS}
+SCHEDULE["sunday"] = [{"start": 600, "value": {"target": 18}}]
+MONDAY = datetime(2024, 1, 1)
+
+
+def test_now_next_later_slots():
+    """Test the current slot and the two after it are found."""
+    slots = HiveSchedule(SCHEDULE).nowNextLater(MONDAY.replace(hour=12))
+
+    assert slots["now"]["start"] == 390
+    assert slots["now"]["Start_DateTime"] == MONDAY.replace(hour=6, minute=30)
+    assert slots["now"]["End_DateTime"] == MONDAY.replace(hour=22)
+    assert slots["next"]["Start_DateTime"] == MONDAY.replace(hour=22)
+    assert slots["later"]["Start_DateTime"] == datetime(2024, 1, 2, 6, 30)
+    assert slots["later"]["End_DateTime"] == datetime(2024, 1, 2, 22)
+
+
+def test_slots_wrap_around_the_week():
+    """Test the slots before Monday morning come from the previous week."""
+    slots = HiveSchedule(SCHEDULE).nowNextLater(MONDAY.replace(hour=5))
+
+    assert slots["now"]["Start_DateTime"] == datetime(2023, 12, 31, 10)
+    assert slots["next"]["Start_DateTime"] == MONDAY.replace(hour=6, minute=30)
+
+    slots = HiveSchedule(SCHEDULE).nowNextLater(datetime(2024, 1, 7, 23))
+    assert slots["now"]["Start_DateTime"] == datetime(2024, 1, 7, 10)
+    assert slots["next"]["Start_DateTime"] == datetime(2024, 1, 8, 6, 30)
+
+
+def test_slot_starting_now_is_current():
+    """Test a slot starting at the current minute is the current slot."""
+    slots = HiveSchedule(SCHEDULE).nowNextLater(MONDAY.replace(hour=22))
+
+    assert slots["now"]["Start_DateTime"] == MONDAY.replace(hour=22)
+
+
+def test_result_is_cached_until_the_next_slot():
+    """Test the slots are reused until the next slot starts."""
+    schedule = HiveSchedule(SCHEDULE)
+    first = schedule.nowNextLater(MONDAY.replace(hour=7))
+    cached = schedule.cached
+
+    assert schedule.nowNextLater(MONDAY.replace(hour=21, minute=59)) == first
+    assert schedule.cached is cached
+
+    later = schedule.nowNextLater(MONDAY.replace(hour=22))
+    assert schedule.cached is not cached
+    assert later["now"] == first["next"]
+
+
+def test_changing_a_result_leaves_the_cache_alone():
+    """Test a caller changing the slots it got does not change later results."""
+    schedule = HiveSchedule(SCHEDULE)
+    first = schedule.nowNextLater(MONDAY.replace(hour=7))
+    first["now"]["value"]["target"] = 5
+    first["next"]["start"] = 0
+
+    again = schedule.nowNextLater(MONDAY.replace(hour=8))
+    assert again["now"]["value"] == {"target": 20}
+    assert again["next"]["start"] == 1320
+    assert SCHEDULE["monday"][0]["value"] == {"target": 20}
+
+
+def test_source_schedule_is_not_changed():
+    """Test compiling and reading a schedule leaves the node data alone."""
+    source = copy.deepcopy(SCHEDULE)
+    HiveSchedule(source).nowNextLater(MONDAY)
+
+    assert source == SCHEDULE
+
+
+def test_empty_schedule_is_rejected():
+    """Test a schedule without slots raises an error."""
+    with pytest.raises(IndexError):
+        HiveSchedule({day: [] for day in DAYS}).nowNextLater(MONDAY)
+
+
+def test_helper_reuses_compiled_schedules():
+    """Test a schedule is compiled once until the node holds a new one."""
+    helper = HiveHelper()
+    source = copy.deepcopy(SCHEDULE)
+
+    helper.getScheduleNNL(source)
+    compiled = helper.schedules[id(source)]
+    helper.getScheduleNNL(source)
+    assert helper.schedules[id(source)] is compiled
+
+    sources = [copy.deepcopy(SCHEDULE) for _ in range(SCHEDULE_CACHE_SIZE)]
+    for other in sources:
+        helper.getScheduleNNL(other)
+    assert len(helper.schedules) <= SCHEDULE_CACHE_SIZE
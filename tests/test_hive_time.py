@@ -0,0 +1,43 @@
+"""Tests for the time helpers."""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from apyhiveapi.helper.hive_schedule import DAYS, HiveSchedule
+from apyhiveapi.helper.hive_time import startOfWeek
+
+LONDON = ZoneInfo("Europe/London")
+
+
+def test_week_starts_at_local_midnight_after_clocks_go_forward():
+    """Test a week with the change to summer time starts at local midnight."""
+    now = datetime(2024, 3, 31, 12, tzinfo=LONDON)
+    week_start = startOfWeek(now)
+
+    assert week_start == datetime(2024, 3, 25, tzinfo=LONDON)
+    assert week_start.utcoffset() == timedelta(0)
+    assert now.utcoffset() == timedelta(hours=1)
+    assert now - week_start == timedelta(days=6, hours=12)
+
+
+def test_week_starts_at_local_midnight_in_the_repeated_hour():
+    """Test the second pass of the repeated hour counts from the same midnight."""
+    first = datetime(2024, 10, 27, 1, 30, tzinfo=LONDON)
+    second = first.replace(fold=1)
+    week_start = startOfWeek(second)
+
+    assert week_start == startOfWeek(first) == datetime(2024, 10, 21, tzinfo=LONDON)
+    assert week_start.fold == 0
+    assert week_start.utcoffset() == timedelta(hours=1)
+
+
+def test_schedule_slots_keep_local_times_across_the_change():
+    """Test slots after the clocks go forward start at their local times."""
+    schedule = {day: [{"start": 390, "value": {"target": 20}}] for day in DAYS}
+    slots = HiveSchedule(schedule).nowNextLater(datetime(2024, 3, 31, 3, tzinfo=LONDON))
+
+    assert slots["now"]["Start_DateTime"] == datetime(2024, 3, 30, 6, 30, tzinfo=LONDON)
+    assert slots["next"]["Start_DateTime"] == datetime(
+        2024, 3, 31, 6, 30, tzinfo=LONDON
+    )
+    assert slots["next"]["Start_DateTime"].utcoffset() == timedelta(hours=1)
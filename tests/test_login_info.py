@@ -0,0 +1,139 @@
+"""Tests for the SSO login information discovery."""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from apyhiveapi.api import hive_auth_async
+from apyhiveapi.api.hive_async_api import HiveApiAsync
+from apyhiveapi.api.login_info import HiveLoginInfoCache, parse_login_info
+from apyhiveapi.helper.hive_exceptions import HiveApiError
+
+from .common import MockResponse, MockWebsession
+
+INFO = {"UPID": "eu-west-1_pool", "CLIID": "client", "REGION": "eu-west-1_pool"}
+PAGE = """
+<script>
+  window.HiveSSOPoolId = "eu-west-1_pool";
+  window.HiveSSOPublicCognitoClientId = 'client';
+  window.HiveSSOPoolId = "ignored";
+</script>
+"""
+
+
+def test_sso_variables_are_parsed():
+    """Test the pool and client are read from single or double quotes."""
+    assert parse_login_info(PAGE) == INFO
+
+
+def test_escaped_and_unquoted_values_are_parsed():
+    """Test escaped strings are decoded and unquoted values are kept."""
+    page = (
+        'window.HiveSSOPoolId = "eu-west-1_p\\u006fol",'
+        "window.HiveSSOPublicCognitoClientId=client;"
+    )
+
+    assert parse_login_info(page) == INFO
+
+
+@pytest.mark.parametrize(
+    "page",
+    ["", "<html></html>", 'window.HiveSSOPoolId = "eu-west-1_pool";'],
+)
+def test_incomplete_pages_give_no_login_info(page):
+    """Test a page without both variables gives no login information."""
+    assert parse_login_info(page) is None
+
+
+def test_concurrent_discoveries_share_one_fetch(tmp_path):
+    """Test callers arriving during a discovery wait for that discovery."""
+    cache = HiveLoginInfoCache(path=str(tmp_path / "login_info.json"))
+    calls = []
+
+    async def fetch():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return dict(INFO)
+
+    async def run():
+        return await asyncio.gather(*(cache.get(fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == [INFO] * 5
+    assert len(calls) == 1
+    assert asyncio.run(cache.get(fetch)) == INFO
+    assert len(calls) == 1
+
+
+def test_stored_login_info_is_used_when_discovery_fails(tmp_path):
+    """Test the persisted login information is used once it has expired."""
+    path = str(tmp_path / "login_info.json")
+    HiveLoginInfoCache(path=path).get_sync(lambda: dict(INFO))
+    cache = HiveLoginInfoCache(ttl=0, path=path)
+
+    def failing():
+        raise ConnectionError("offline")
+
+    assert cache.get_sync(failing) == INFO
+    assert cache.get_sync(lambda: None) == INFO
+
+
+def test_failed_discovery_without_login_info_is_raised(tmp_path):
+    """Test a discovery error is raised when nothing is known yet."""
+    cache = HiveLoginInfoCache(path=str(tmp_path / "login_info.json"))
+
+    async def failing():
+        raise ConnectionError("offline")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(cache.get(failing))
+    assert cache.get_sync(lambda: {"UPID": "pool"}) == {"UPID": "pool"}
+
+
+def get_login_info(*responses):
+    """Fetch the login information with queued responses."""
+    api = HiveApiAsync(websession=MockWebsession(*responses))
+    return asyncio.run(api.getLoginInfo())
+
+
+def test_login_info_is_fetched_from_the_sso_page():
+    """Test the login information is parsed from a fetched SSO page."""
+    assert get_login_info(MockResponse(200, PAGE.encode())) == INFO
+
+
+@pytest.mark.parametrize(
+    "response",
+    [MockResponse(503, PAGE.encode()), MockResponse(200, b"<html></html>")],
+)
+def test_failed_fetches_raise_api_errors(response):
+    """Test an error status or a page without login information is raised."""
+    with pytest.raises(HiveApiError):
+        get_login_info(response)
+
+
+def test_auth_without_login_info_raises_an_api_error(tmp_path, monkeypatch):
+    """Test auth setup fails clearly when no login information is known."""
+    cache = HiveLoginInfoCache(path=str(tmp_path / "login_info.json"))
+    monkeypatch.setattr(hive_auth_async, "LOGIN_INFO", cache)
+
+    async def run():
+        auth = hive_auth_async.HiveAuthAsync(
+            "user", "password", websession=MockWebsession(MockResponse(503))
+        )
+        await auth.async_init()
+
+    with pytest.raises(HiveApiError):
+        asyncio.run(run())
+
+
+def test_importing_the_async_package_does_not_load_pyquery():
+    """Test pyquery is only imported for the synchronous login fallback."""
+    code = "import sys, apyhiveapi; print('pyquery' in sys.modules)"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, check=True
+    )
+
+    assert result.stdout.strip() == b"False"
@@ -0,0 +1,70 @@
+"""Tests for the session manager."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from apyhiveapi import HiveSessionManager
+
+
+class FakeWebsession:  # pylint: disable=too-few-public-methods
+    """Websession which records being closed."""
+
+    def __init__(self):
+        """Initialise the fake websession."""
+        self.closed = False
+
+    async def close(self):
+        """Close the websession."""
+        self.closed = True
+
+
+def test_sessions_share_one_websession():
+    """Test every created session uses the pool which is closed on exit."""
+
+    async def run():
+        async with HiveSessionManager() as manager:
+            first = await manager.createSession("one@example.com", "password")
+            second = await manager.createSession("two@example.com", "password")
+            websession = manager.websession
+            assert first.api.websession is websession
+            assert second.api.websession is websession
+            assert manager.sessions == [first, second]
+        return manager, websession
+
+    manager, websession = asyncio.run(run())
+
+    assert websession.closed
+    assert manager.websession is None
+
+
+def test_only_due_sessions_are_polled():
+    """Test sessions are polled once their scan interval has passed."""
+    polled = []
+
+    async def refresh(session):
+        polled.append(session)
+        if session == "failing":
+            raise ConnectionError("offline")
+        return True
+
+    async def run():
+        manager = HiveSessionManager()
+        manager.websession = FakeWebsession()
+        sessions = [await manager.createSession() for _ in range(3)]
+        for name, session in zip(["due", "recent", "failing"], sessions):
+            session.refreshData = lambda n_id, name=name: refresh(name)
+        sessions[0].config.lastUpdated = datetime.now() - timedelta(minutes=5)
+        sessions[2].config.lastUpdated = datetime.now() - timedelta(minutes=5)
+
+        results = await manager.pollAll()
+        forced = await manager.pollAll(force=True)
+        await manager.close()
+        return manager, results, forced
+
+    manager, results, forced = asyncio.run(run())
+
+    assert results[0] is True
+    assert isinstance(results[1], ConnectionError)
+    assert forced[:2] == [True, True]
+    assert polled == ["due", "failing", "due", "recent", "failing"]
+    assert manager.websession is None
@@ -0,0 +1,79 @@
+"""Tests for the incremental nodes response parser."""
+
+import asyncio
+import json
+
+import pytest
+
+from apyhiveapi.helper.node_parser import HiveNodeParser, parseNodes
+
+RESPONSE = {
+    "user": {"id": "user-1", "username": "test@test.com"},
+    "products": [
+        {"id": "product-1", "type": "heating", "state": {"name": "Kitchen ©"}},
+        {"id": "product-2", "type": "activeplug", "props": {"online": True}},
+    ],
+    "devices": [{"id": "device-1", "type": "thermostatui", "state": {}}],
+    "actions": [],
+    "homes": {"homes": [{"id": "home-1"}]},
+}
+EXPECTED = {
+    "user": RESPONSE["user"],
+    "products": {node["id"]: node for node in RESPONSE["products"]},
+    "devices": {node["id"]: node for node in RESPONSE["devices"]},
+    "actions": {},
+    "homes": RESPONSE["homes"],
+}
+BODY = json.dumps(RESPONSE, ensure_ascii=False, indent=1).encode("utf-8")
+
+
+class FakeStream:  # pylint: disable=too-few-public-methods
+    """Response content which is read in chunks."""
+
+    def __init__(self, body):
+        """Initialise the fake stream."""
+        self.body = body
+        self.sizes = []
+
+    async def iter_chunked(self, size):
+        """Yield the body in chunks of the requested size."""
+        self.sizes.append(size)
+        for start in range(0, len(self.body), size):
+            yield self.body[start:][:size]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, len(BODY)])
+def test_any_chunking_gives_the_same_result(size):
+    """Test the nodes are parsed however the body is split into chunks."""
+    parser = HiveNodeParser()
+    for start in range(0, len(BODY), size):
+        parser.feed(BODY[start:][:size])
+
+    assert parser.close() == EXPECTED
+
+
+def test_buffer_is_released_as_nodes_are_parsed():
+    """Test parsed nodes are removed from the buffer."""
+    parser = HiveNodeParser()
+    end = BODY.index(b"product-2")
+    parser.feed(BODY[:end])
+
+    assert "product-1" in parser.result["products"]
+    assert "product-1" not in parser.buffer
+
+
+def test_incomplete_response_is_rejected():
+    """Test a truncated response raises an error."""
+    parser = HiveNodeParser()
+    parser.feed(BODY[:-10])
+
+    with pytest.raises(json.JSONDecodeError):
+        parser.close()
+
+
+def test_parse_nodes_reads_streams():
+    """Test parseNodes reads a stream in chunks."""
+    stream = FakeStream(BODY)
+
+    assert asyncio.run(parseNodes(stream, chunk_size=16)) == EXPECTED
+    assert stream.sizes == [16]
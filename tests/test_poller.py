@@ -0,0 +1,75 @@
+"""Tests for the background poller."""
+
+import asyncio
+import time
+from datetime import timedelta
+
+from apyhiveapi.helper.map import Map
+from apyhiveapi.poller import HivePoller, HiveRateLimiter
+
+
+class FakeSession:  # pylint: disable=too-few-public-methods
+    """Session which records when it is polled."""
+
+    def __init__(self, interval=0.05):
+        """Initialise the fake session."""
+        self.config = Map(
+            {"scanInterval": timedelta(seconds=interval), "scheduledPolling": False}
+        )
+        self.polls = []
+
+    async def refreshData(self, n_id):  # pylint: disable=invalid-name
+        """Record a poll."""
+        self.polls.append((n_id, time.monotonic()))
+        return True
+
+
+def test_next_delay_stays_within_jitter():
+    """Test each delay is the scan interval varied by at most the jitter."""
+    poller = HivePoller(jitter=0.2)
+    session = FakeSession(interval=100)
+
+    delays = [poller.nextDelay(session) for _ in range(200)]
+
+    assert all(80 <= delay <= 120 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_sessions_are_polled_until_removed():
+    """Test a session is polled from its offset until it is removed."""
+
+    async def run():
+        poller = HivePoller(jitter=0)
+        session = FakeSession()
+        poller.addSession(session, offset=0)
+        assert session.config.scheduledPolling
+        await asyncio.sleep(0.22)
+        await poller.removeSession(session)
+        polled = len(session.polls)
+        await asyncio.sleep(0.1)
+        return session, polled
+
+    session, polled = asyncio.run(run())
+
+    assert 3 <= polled <= 6
+    assert len(session.polls) == polled
+    assert not session.config.scheduledPolling
+    assert {n_id for n_id, _ in session.polls} == {"No_ID"}
+
+
+def test_rate_limiter_spaces_requests():
+    """Test the rate limiter allows a burst and then spaces out requests."""
+
+    async def run():
+        limiter = HiveRateLimiter(rate=20, burst=2)
+        times = []
+        for _ in range(4):
+            await limiter.acquire()
+            times.append(time.monotonic())
+        return times
+
+    times = asyncio.run(run())
+
+    assert times[1] - times[0] < 0.02
+    assert times[2] - times[1] >= 0.04
+    assert times[3] - times[2] >= 0.04
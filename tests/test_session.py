@@ -0,0 +1,347 @@
+"""Tests for the session node data and change subscriptions."""
+
+import asyncio
+import copy
+from datetime import datetime, timedelta
+
+from apyhiveapi import Hive
+
+USERNAME = "use@file.com"
+
+
+async def start_session():
+    """Start a session which reads its data from the bundled files."""
+    hive = Hive(username=USERNAME, password="password")
+    await hive.startSession({"username": USERNAME})
+    return hive
+
+
+def file_data(hive, change=None):
+    """Serve the bundled data, optionally changed, in place of data.json."""
+    data = hive.openFile("data.json")
+    if change is not None:
+        change(data)
+    open_file = hive.openFile
+    hive.openFile = lambda file: (
+        copy.deepcopy(data) if file == "data.json" else open_file(file)
+    )
+
+
+def test_unchanged_poll_keeps_node_objects():
+    """Test an unchanged poll reports no changes and keeps every node."""
+
+    async def run():
+        hive = await start_session()
+        products = dict(hive.data.products)
+        try:
+            assert await hive.getDevices("No_ID")
+            assert hive.changedNodes == set()
+            assert all(
+                hive.data.products[n_id] is node for n_id, node in products.items()
+            )
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_changed_node_is_updated_in_place():
+    """Test only the changed node is updated, in place."""
+
+    async def run():
+        hive = await start_session()
+        n_id = next(iter(hive.data.products))
+        node = hive.data.products[n_id]
+        others = {
+            other: value for other, value in hive.data.products.items() if other != n_id
+        }
+
+        def rename(data):
+            for product in data["parsed"]["products"]:
+                if product["id"] == n_id:
+                    product["state"]["name"] = "Renamed"
+
+        try:
+            file_data(hive, rename)
+            assert await hive.getDevices("No_ID")
+            assert hive.changedNodes == {n_id}
+            assert hive.data.products[n_id] is node
+            assert node["state"]["name"] == "Renamed"
+            assert all(
+                hive.data.products[other] is value for other, value in others.items()
+            )
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_removed_node_is_reported():
+    """Test nodes missing from the latest data are removed."""
+
+    async def run():
+        hive = await start_session()
+        n_id = next(iter(hive.data.products))
+
+        def remove(data):
+            parsed = data["parsed"]
+            parsed["products"] = [
+                product for product in parsed["products"] if product["id"] != n_id
+            ]
+
+        try:
+            file_data(hive, remove)
+            assert await hive.getDevices("No_ID")
+            assert hive.changedNodes == {n_id}
+            assert n_id not in hive.data.products
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_merge_nodes_reports_field_changes():
+    """Test the field changes of each changed node are collected."""
+    current = {"a": {"id": "a", "state": {"mode": "OFF", "target": 7}}}
+    latest = {
+        "a": {"id": "a", "state": {"mode": "SCHEDULE", "target": 7}},
+        "b": {"id": "b"},
+    }
+    changes = {}
+
+    changed = Hive.mergeNodes(current, latest, changes)
+
+    assert changed == {"a", "b"}
+    assert changes["a"] == {"state.mode": ("OFF", "SCHEDULE")}
+    assert changes["b"] == {"id": (None, "b")}
+    assert current["b"] is latest["b"]
+
+
+def test_subscribers_receive_node_changes():
+    """Test subscribers are sent the changes of the nodes they follow."""
+
+    async def run():
+        hive = await start_session()
+        n_id = next(iter(hive.data.products))
+        everything = []
+        single = []
+        awaited = []
+
+        async def callback(event):
+            awaited.append(event)
+
+        def rename(data):
+            for product in data["parsed"]["products"]:
+                if product["id"] == n_id:
+                    product["state"]["name"] = "Renamed"
+
+        try:
+            hive.subscribe(everything.append)
+            hive.subscribe(single.append, "other-node")
+            unsubscribe = hive.subscribe(callback, n_id)
+            file_data(hive, rename)
+            assert await hive.getDevices("No_ID")
+
+            assert [event.hiveID for event in everything] == [n_id]
+            assert everything[0].nodeType == "products"
+            assert "state.name" in everything[0].changes
+            assert everything[0].changes["state.name"][1] == "Renamed"
+            assert not single
+            assert awaited == everything
+
+            unsubscribe()
+            assert n_id not in hive.subscribers
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_failing_subscriber_does_not_stop_others():
+    """Test an error in one subscriber does not affect the others."""
+
+    async def run():
+        hive = await start_session()
+        n_id = next(iter(hive.data.products))
+        received = []
+
+        def failing(event):
+            raise ValueError(event.hiveID)
+
+        try:
+            hive.subscribe(failing)
+            hive.subscribe(received.append)
+            file_data(hive, lambda data: data["parsed"]["products"].pop(0))
+            assert await hive.getDevices("No_ID")
+            assert [event.hiveID for event in received] == [n_id]
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_concurrent_refreshes_share_one_fetch():
+    """Test concurrent refreshes wait for a single fetch of the nodes."""
+
+    async def run():
+        hive = await start_session()
+        calls = []
+        get_devices = hive.getDevices
+
+        async def counted(n_id, deadline=None):
+            calls.append(n_id)
+            await asyncio.sleep(0.01)
+            return await get_devices(n_id, deadline)
+
+        hive.getDevices = counted
+        try:
+            results = await asyncio.gather(
+                *(hive.refreshData(str(index)) for index in range(5))
+            )
+            assert results == [True] * 5
+            assert calls == ["0"]
+            assert hive.updateTask is None
+
+            assert await hive.refreshData("5")
+            assert calls == ["0", "5"]
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_not_modified_poll_reapplies_pending_writes():
+    """Test an unchanged poll keeps the writes made while it was fetched."""
+
+    async def run():
+        hive = await start_session()
+        written = list(hive.data.products)[0]
+        hive.config.file = False
+        hive.tokens.tokenCreated = datetime.now()
+        calls = []
+
+        async def not_modified(*_):
+            calls.append(None)
+            hive.data.pending[written] = {
+                "fields": {"status": "ON"},
+                "time": datetime.now(),
+            }
+            return {"original": 304, "parsed": None}
+
+        hive.api.getAll = not_modified
+        hive.data.products[written]["state"]["status"] = "OFF"
+        try:
+            assert await hive.getDevices("No_ID")
+            assert hive.changedNodes == set()
+            assert list(hive.data.pending) == [written]
+            assert hive.data.products[written]["state"]["status"] == "ON"
+            assert len(calls) == 1
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_not_modified_poll_replaces_unapplied_writes():
+    """Test an unchanged poll after a write fetches the Hive state in full."""
+
+    async def run():
+        hive = await start_session()
+        written = list(hive.data.products)[0]
+        state = copy.deepcopy(hive.data.products[written]["state"])
+        full = dict(hive.openFile("data.json"), original=200)
+        hive.config.file = False
+        hive.tokens.tokenCreated = datetime.now()
+        calls = []
+
+        async def get_all(*_):
+            calls.append(None)
+            if len(calls) == 1:
+                return {"original": 304, "parsed": None}
+            return copy.deepcopy(full)
+
+        hive.api.getAll = get_all
+        hive.api.validators["all"] = {"etag": '"v1"'}
+        hive.data.products[written]["state"]["status"] = "IGNORED"
+        hive.data.pending[written] = {
+            "fields": {"status": "IGNORED"},
+            "time": datetime.now() - timedelta(seconds=1),
+        }
+        try:
+            assert await hive.getDevices("No_ID")
+            assert len(calls) == 2
+            assert not hive.api.validators
+            assert not hive.data.pending
+            assert hive.data.products[written]["state"] == state
+            assert written in hive.changedNodes
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_write_refreshes_the_product_and_its_thermostat():
+    """Test a write fetches the written product and its linked thermostat."""
+
+    async def run():
+        hive = await start_session()
+        product = next(
+            node for node in hive.data.products.values() if node["type"] == "heating"
+        )
+        thermostat = hive.helper.getDeviceData(product)
+        hive.config.file = False
+        hive.tokens.tokenCreated = datetime.now()
+        fetched = []
+
+        async def set_state(*_, **kwargs):
+            return {"original": 200, "parsed": kwargs}
+
+        async def get_node(n_type, n_id, *_):
+            fetched.append((n_type, n_id))
+            node = hive.data.products.get(n_id, hive.data.devices.get(n_id))
+            return {"original": 200, "parsed": copy.deepcopy(node)}
+
+        hive.api.setState = set_state
+        hive.api.getNode = get_node
+        try:
+            resp = await hive.writeState("heating", product["id"], target=21)
+            assert resp["original"] == 200
+            assert fetched == [
+                ("heating", product["id"]),
+                (thermostat["type"], thermostat["id"]),
+            ]
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_refresh_all_entities_reads_without_changing_the_device_list():
+    """Test the entity snapshot matches the getters and leaves the list alone."""
+
+    async def run():
+        hive = await start_session()
+        getters = {
+            "alarm_control_panel": hive.alarm.getAlarm,
+            "binary_sensor": hive.sensor.getSensor,
+            "camera": hive.camera.getCamera,
+            "climate": hive.heating.getClimate,
+            "light": hive.light.getLight,
+            "sensor": hive.sensor.getSensor,
+            "switch": hive.switch.getSwitch,
+            "water_heater": hive.hotwater.getWaterHeater,
+        }
+        try:
+            device_list = copy.deepcopy(hive.deviceList)
+            snapshot = hive.refreshAllEntities()
+            assert hive.deviceList == device_list
+            assert set(snapshot) == set(getters) & set(device_list)
+            for entity_type, entities in snapshot.items():
+                assert entities == [
+                    await getters[entity_type](copy.deepcopy(entity))
+                    for entity in device_list[entity_type]
+                ]
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
@@ -0,0 +1,117 @@
+"""Tests for the token renewal."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from apyhiveapi import Hive
+from apyhiveapi.helper.map import Map
+from apyhiveapi.token_refresher import HiveTokenRefresher
+
+USERNAME = "use@file.com"
+RESULT = {
+    "AuthenticationResult": {
+        "IdToken": "id",
+        "AccessToken": "access",
+        "RefreshToken": "refresh",
+        "ExpiresIn": 3600,
+    }
+}
+
+
+async def start_session():
+    """Start a session which reads its data from the bundled files."""
+    hive = Hive(username=USERNAME, password="password")
+    await hive.startSession({"username": USERNAME})
+    hive.config.file = False
+    hive.tokens.tokenData["refreshToken"] = "old"
+    return hive
+
+
+def count_refreshes(hive):
+    """Replace the token refresh request with one which counts its calls."""
+    calls = []
+
+    async def refresh_token(token):
+        calls.append(token)
+        await asyncio.sleep(0.01)
+        return RESULT
+
+    hive.auth.refresh_token = refresh_token
+    return calls
+
+
+def test_concurrent_refreshes_share_one_request():
+    """Test callers arriving during a renewal wait for the same renewal."""
+
+    async def run():
+        hive = await start_session()
+        calls = count_refreshes(hive)
+        hive.tokens.tokenCreated = datetime.now() - timedelta(hours=2)
+        try:
+            results = await asyncio.gather(
+                *(hive.hiveRefreshTokens() for _ in range(5))
+            )
+            assert results == [RESULT] * 5
+            assert calls == ["old"]
+            assert hive.tokenTask is None
+            assert hive.tokens.tokenData["token"] == "id"
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+def test_valid_tokens_are_only_renewed_when_forced():
+    """Test unexpired tokens are kept unless a renewal is forced."""
+
+    async def run():
+        hive = await start_session()
+        calls = count_refreshes(hive)
+        hive.tokens.tokenCreated = datetime.now()
+        try:
+            assert await hive.hiveRefreshTokens() is None
+            assert not calls
+
+            assert await hive.hiveRefreshTokens(force=True) == RESULT
+            assert calls == ["old"]
+        finally:
+            await hive.api.websession.close()
+
+    asyncio.run(run())
+
+
+class FakeSession:  # pylint: disable=too-few-public-methods
+    """Session whose tokens expire almost at once."""
+
+    def __init__(self):
+        """Initialise the fake session."""
+        self.tokens = Map(
+            {"tokenCreated": datetime.now(), "tokenExpiry": timedelta(seconds=0.05)}
+        )
+        self.renewals = []
+
+    async def hiveRefreshTokens(self, force=False):  # pylint: disable=invalid-name
+        """Record a renewal and start a new token lifetime."""
+        self.renewals.append(force)
+        self.tokens.tokenCreated = datetime.now()
+
+
+def test_refresher_renews_before_expiry_until_stopped():
+    """Test the tokens are renewed in the background until stopped."""
+
+    async def run():
+        session = FakeSession()
+        refresher = HiveTokenRefresher(session, margin=0.01, jitter=0, retry_delay=1)
+        refresher.start()
+        await asyncio.sleep(0.15)
+        await refresher.stop()
+        renewed = len(session.renewals)
+        await asyncio.sleep(0.1)
+        return session, renewed, refresher
+
+    session, renewed, refresher = asyncio.run(run())
+
+    assert 2 <= renewed <= 5
+    assert len(session.renewals) == renewed
+    assert all(session.renewals)
+    assert refresher.task is None
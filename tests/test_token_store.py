@@ -0,0 +1,70 @@
+"""Tests for the file token store."""
+
+import asyncio
+import os
+import stat
+
+import pytest
+
+from apyhiveapi.token_store import HiveFileTokenStore, HiveTokenStore
+
+fernet = pytest.importorskip("cryptography.fernet")
+
+TOKENS = {"tokens": {"refreshToken": "refresh"}, "tokenExpiry": 3600}
+KEY = fernet.Fernet.generate_key()
+
+
+def test_the_base_store_is_abstract():
+    """Test a store must say how it loads, saves and clears tokens."""
+    with pytest.raises(TypeError):
+        HiveTokenStore()  # pylint: disable=abstract-class-instantiated
+
+
+def test_tokens_are_stored_encrypted_for_the_current_user_only(tmp_path):
+    """Test stored tokens are encrypted in a file only the user can read."""
+    store = HiveFileTokenStore(KEY, str(tmp_path / "tokens"))
+
+    async def run():
+        await store.save("User@Example.com", TOKENS)
+        return await store.load("user@example.com")
+
+    assert asyncio.run(run()) == TOKENS
+    path = store.filePath("user@example.com")
+    assert os.listdir(store.path) == [os.path.basename(path)]
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o700
+    with open(path, "rb") as token_file:
+        assert b"refresh" not in token_file.read()
+
+
+def test_an_existing_directory_is_made_private(tmp_path):
+    """Test the store directory is private even if it already existed."""
+    os.chmod(tmp_path, 0o755)
+    store = HiveFileTokenStore(KEY.decode(), str(tmp_path))
+
+    asyncio.run(store.save("user", TOKENS))
+
+    assert stat.S_IMODE(os.stat(tmp_path).st_mode) == 0o700
+
+
+def test_missing_or_damaged_tokens_are_ignored(tmp_path):
+    """Test tokens which can not be read are treated as not stored."""
+    store = HiveFileTokenStore(KEY, str(tmp_path))
+
+    assert asyncio.run(store.load("user")) is None
+
+    with open(store.filePath("user"), "wb") as token_file:
+        token_file.write(b"{not encrypted")
+    assert asyncio.run(store.load("user")) is None
+
+    asyncio.run(store.clear("user"))
+    asyncio.run(store.clear("user"))
+    assert not os.path.exists(store.filePath("user"))
+
+
+def test_tokens_need_the_key_they_were_stored_with(tmp_path):
+    """Test tokens stored with another key are treated as not stored."""
+    asyncio.run(HiveFileTokenStore(KEY, str(tmp_path)).save("user", TOKENS))
+    store = HiveFileTokenStore(fernet.Fernet.generate_key(), str(tmp_path))
+
+    assert asyncio.run(store.load("user")) is None
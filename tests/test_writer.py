@@ -0,0 +1,112 @@
+"""Tests for the batched node writes."""
+
+# pylint: disable=invalid-name,too-few-public-methods,unused-argument
+
+import asyncio
+
+from apyhiveapi.helper.map import Map
+from apyhiveapi.writer import HiveWriteQueue
+
+
+class FakeApi:
+    """API which records the writes it is sent."""
+
+    def __init__(self):
+        """Initialise the fake API."""
+        self.writes = []
+
+    async def setState(self, n_type, n_id, deadline=None, **kwargs):
+        """Record a write."""
+        self.writes.append((n_type, n_id, kwargs))
+        return {"original": 200, "parsed": {}}
+
+
+class FakeSession:
+    """Session which records the refreshes after writes."""
+
+    def __init__(self):
+        """Initialise the fake session."""
+        self.api = FakeApi()
+        self.config = Map({"writeDelay": 0.01})
+        self.refreshed = []
+
+    def getDeadline(self, deadline=None):
+        """Get no deadline."""
+        return deadline
+
+    async def refreshWritten(self, written, deadline=None):
+        """Record a refresh."""
+        self.refreshed.append(dict(written))
+
+
+def test_writes_to_a_node_are_merged():
+    """Test writes to a node within the window are sent as one write."""
+
+    async def run():
+        session = FakeSession()
+        queue = HiveWriteQueue(session)
+        results = await asyncio.gather(
+            queue.add("colourtuneablelight", "a", status="ON", brightness=40),
+            queue.add("colourtuneablelight", "a", colourTemperature=3000),
+            queue.add("activeplug", "b", status="ON"),
+        )
+        return session, results
+
+    session, results = asyncio.run(run())
+
+    light = {"status": "ON", "brightness": 40, "colourTemperature": 3000}
+    assert session.api.writes == [
+        ("colourtuneablelight", "a", light),
+        ("activeplug", "b", {"status": "ON"}),
+    ]
+    assert session.refreshed == [{"a": light, "b": {"status": "ON"}}]
+    assert all(result["original"] == 200 for result in results)
+
+
+def test_fields_of_a_left_mode_are_dropped():
+    """Test a boost or colour cancelled within the window is not sent."""
+
+    async def run():
+        session = FakeSession()
+        queue = HiveWriteQueue(session)
+        await asyncio.gather(
+            queue.add("heating", "a", autoBoost="ENABLED"),
+            queue.add("heating", "a", mode="BOOST", boost=30, target=22),
+            queue.add("heating", "a", mode="SCHEDULE"),
+            queue.add("colourtuneablelight", "b", colourMode="COLOUR", hue="10"),
+            queue.add("colourtuneablelight", "b", colourMode="WHITE"),
+        )
+        return session
+
+    session = asyncio.run(run())
+
+    assert session.api.writes == [
+        ("heating", "a", {"autoBoost": "ENABLED", "mode": "SCHEDULE"}),
+        ("colourtuneablelight", "b", {"colourMode": "WHITE"}),
+    ]
+
+
+def test_failed_write_is_returned_to_its_callers():
+    """Test an error sending a write is raised to the callers of that node."""
+
+    async def run():
+        session = FakeSession()
+
+        async def failing(n_type, n_id, deadline=None, **kwargs):
+            if n_id == "a":
+                raise RuntimeError(n_type)
+            return {"original": 200, "parsed": kwargs}
+
+        session.api.setState = failing
+        queue = HiveWriteQueue(session)
+        return session, await asyncio.gather(
+            queue.add("heating", "a", target=20),
+            queue.add("activeplug", "b", status="ON"),
+            return_exceptions=True,
+        )
+
+    session, results = asyncio.run(run())
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1]["original"] == 200
+    assert session.refreshed == [{"b": {"status": "ON"}}]